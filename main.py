@@ -1,41 +1,45 @@
 import threading
 import time
-import csv
 import json
-import xml.etree.ElementTree as ET
 import uuid
 import webbrowser
 import argparse
 import os
-from io import StringIO
 from datetime import datetime, timedelta
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, render_template, request, jsonify, session, Response, stream_with_context, send_file
 from functools import wraps
 from src.crawler import WebCrawler
+from src.core.link_manager import LinkManager
+from src.core.exclusion_matcher import get_exclusion_matcher
 from src.settings_manager import SettingsManager
-from src.auth_db import init_db, get_crawls_last_24h, log_crawl_start, get_or_create_admin_user
-
-# Parse command line arguments
-parser = argparse.ArgumentParser(description='LibreCrawl - SEO Spider Tool')
-parser.add_argument('--local', '-l', action='store_true',
-                    help='Run in local mode (all users get admin tier, no rate limits)')
-args = parser.parse_args()
-
-LOCAL_MODE = args.local
+from src.auth_db import (
+    init_db, get_crawls_last_24h, log_crawl_start, get_or_create_admin_user,
+    get_user_crawl_history, get_crawl_record, query_crawl_store, delete_crawl_data,
+    iter_crawl_store, count_crawl_store
+)
+from src.exporters import (
+    EXPORT_DATASETS, EXPORT_FILE_PREFIXES, EXPORT_MIMETYPES, RowSource, get_export_chunks, gzip_chunks,
+    generate_csv_export, generate_json_export, generate_xml_export,
+    generate_links_csv_export, generate_links_json_export,
+    generate_issues_csv_export, generate_issues_json_export
+)
+from src.export_jobs import ExportArtifact, ExportJobManager
+
+# Command line arguments, parsed in main()
+parser = argparse.ArgumentParser(description='LibreCrawl - SEO Spider Tool')
+parser.add_argument('--local', '-l', action='store_true',
+                    help='Run in local mode (all users get admin tier, no rate limits)')
+
+LOCAL_MODE = False  # Set by init_app()
 APP_PORT = int(os.getenv('APP_PORT', '5000'))
+
+# Crawl event stream: max items of each kind per event, batching window and idle stats tick
+SSE_BATCH_LIMIT = 500
+SSE_BATCH_SECONDS = 0.25
+SSE_TICK_SECONDS = 1.0
 
 app = Flask(__name__, template_folder='web/templates', static_folder='web/static')
-app.secret_key = os.getenv('APP_SECRET_KEY', 'librecrawl-secret-key-change-in-production')
-
-# Initialize database on startup
-init_db()
-
-if LOCAL_MODE:
-    print("=" * 60)
-    print("LOCAL MODE ENABLED")
-    print("All users will have admin tier access")
-    print("No rate limits or tier restrictions")
-    print("=" * 60)
+app.secret_key = os.getenv('APP_SECRET_KEY', 'librecrawl-secret-key-change-in-production')
 
 def get_client_ip():
     """Get the real client IP address, checking Cloudflare headers first"""
@@ -84,6 +88,9 @@ def auto_login_admin():
 crawler_instances = {}  # session_id -> {'crawler': WebCrawler, 'settings': SettingsManager, 'last_accessed': datetime}
 instances_lock = threading.Lock()
 
+# Background export jobs (all sessions), created by init_app()
+export_jobs = None
+
 def get_or_create_crawler():
     """Get or create a crawler instance for the current session"""
     # Get or create session ID
@@ -164,6 +171,7 @@ def start_cleanup_thread():
             time.sleep(300)  # Check every 5 minutes
             try:
                 cleanup_old_instances()
+                export_jobs.cleanup_expired()
             except Exception as e:
                 print(f"Error in cleanup thread: {e}")
 
@@ -171,186 +179,31 @@ def start_cleanup_thread():
     cleanup_thread.start()
     print("Started crawler instance cleanup thread")
 
-def generate_csv_export(urls, fields):
-    """Generate CSV export content"""
-    output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=fields)
-    writer.writeheader()
-
-    for url_data in urls:
-        row = {}
-        for field in fields:
-            value = url_data.get(field, '')
-
-            # Handle complex data types for CSV
-            if field == 'analytics' and isinstance(value, dict):
-                analytics_list = []
-                if value.get('gtag') or value.get('ga4_id'): analytics_list.append('GA4')
-                if value.get('google_analytics'): analytics_list.append('GA')
-                if value.get('gtm_id'): analytics_list.append('GTM')
-                if value.get('facebook_pixel'): analytics_list.append('FB')
-                if value.get('hotjar'): analytics_list.append('HJ')
-                if value.get('mixpanel'): analytics_list.append('MP')
-                row[field] = ', '.join(analytics_list)
-            elif field == 'og_tags' and isinstance(value, dict):
-                row[field] = f"{len(value)} tags" if value else ''
-            elif field == 'twitter_tags' and isinstance(value, dict):
-                row[field] = f"{len(value)} tags" if value else ''
-            elif field == 'json_ld' and isinstance(value, list):
-                row[field] = f"{len(value)} scripts" if value else ''
-            elif field == 'images' and isinstance(value, list):
-                row[field] = f"{len(value)} images" if value else ''
-            elif field == 'internal_links' and isinstance(value, (int, float)):
-                row[field] = f"{int(value)} internal links" if value else '0 internal links'
-            elif field == 'external_links' and isinstance(value, (int, float)):
-                row[field] = f"{int(value)} external links" if value else '0 external links'
-            elif field == 'h2' and isinstance(value, list):
-                row[field] = ', '.join(value[:3]) + ('...' if len(value) > 3 else '')
-            elif field == 'h3' and isinstance(value, list):
-                row[field] = ', '.join(value[:3]) + ('...' if len(value) > 3 else '')
-            elif isinstance(value, (dict, list)):
-                row[field] = str(value)
-            else:
-                row[field] = value
-
-        writer.writerow(row)
-
-    return output.getvalue()
-
-def generate_json_export(urls, fields):
-    """Generate JSON export content"""
-    filtered_urls = []
-    for url_data in urls:
-        filtered_data = {}
-        for field in fields:
-            value = url_data.get(field, '')
-            # Keep complex data structures intact in JSON
-            filtered_data[field] = value
-        filtered_urls.append(filtered_data)
-
-    return json.dumps({
-        'export_date': time.strftime('%Y-%m-%d %H:%M:%S'),
-        'total_urls': len(filtered_urls),
-        'fields': fields,
-        'data': filtered_urls
-    }, indent=2, default=str)
-
-def generate_xml_export(urls, fields):
-    """Generate XML export content"""
-    root = ET.Element('librecrawl_export')
-    root.set('export_date', time.strftime('%Y-%m-%d %H:%M:%S'))
-    root.set('total_urls', str(len(urls)))
-
-    urls_element = ET.SubElement(root, 'urls')
-
-    for url_data in urls:
-        url_element = ET.SubElement(urls_element, 'url')
-        for field in fields:
-            field_element = ET.SubElement(url_element, field)
-            field_element.text = str(url_data.get(field, ''))
-
-    return ET.tostring(root, encoding='unicode')
-
-def generate_links_csv_export(links):
-    """Generate CSV export for links data"""
-    output = StringIO()
-    fieldnames = ['source_url', 'target_url', 'anchor_text', 'is_internal', 'target_domain', 'target_status', 'placement']
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-
-    for link in links:
-        row = {
-            'source_url': link.get('source_url', ''),
-            'target_url': link.get('target_url', ''),
-            'anchor_text': link.get('anchor_text', ''),
-            'is_internal': 'Yes' if link.get('is_internal') else 'No',
-            'target_domain': link.get('target_domain', ''),
-            'target_status': link.get('target_status', 'Not crawled'),
-            'placement': link.get('placement', 'body')
-        }
-        writer.writerow(row)
-
-    return output.getvalue()
-
-def generate_links_json_export(links):
-    """Generate JSON export for links data"""
-    return json.dumps(links, indent=2)
-
-def filter_issues_by_exclusion_patterns(issues, exclusion_patterns):
-    """Filter issues based on exclusion patterns (applies current settings to loaded crawls)"""
-    from fnmatch import fnmatch
-    from urllib.parse import urlparse
-
-    if not exclusion_patterns:
-        return issues
-
-    filtered_issues = []
-
-    for issue in issues:
-        url = issue.get('url', '')
-        parsed = urlparse(url)
-        path = parsed.path
-
-        # Check if URL matches any exclusion pattern
-        should_exclude = False
-        for pattern in exclusion_patterns:
-            if not pattern.strip() or pattern.strip().startswith('#'):
-                continue
-
-            if '*' in pattern:
-                if fnmatch(path, pattern):
-                    should_exclude = True
-                    break
-            elif path == pattern or path.startswith(pattern.rstrip('*')):
-                should_exclude = True
-                break
-
-        if not should_exclude:
-            filtered_issues.append(issue)
-
-    return filtered_issues
-
-def generate_issues_csv_export(issues):
-    """Generate CSV export for issues data"""
-    output = StringIO()
-    fieldnames = ['url', 'type', 'category', 'issue', 'details']
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-
-    for issue in issues:
-        row = {
-            'url': issue.get('url', ''),
-            'type': issue.get('type', ''),
-            'category': issue.get('category', ''),
-            'issue': issue.get('issue', ''),
-            'details': issue.get('details', '')
-        }
-        writer.writerow(row)
-
-    return output.getvalue()
-
-def generate_issues_json_export(issues):
-    """Generate JSON export for issues data"""
-    # Group issues by URL for better organization
-    issues_by_url = {}
-    for issue in issues:
-        url = issue.get('url', '')
-        if url not in issues_by_url:
-            issues_by_url[url] = []
-        issues_by_url[url].append({
-            'type': issue.get('type', ''),
-            'category': issue.get('category', ''),
-            'issue': issue.get('issue', ''),
-            'details': issue.get('details', '')
-        })
-
-    return json.dumps({
-        'export_date': time.strftime('%Y-%m-%d %H:%M:%S'),
-        'total_issues': len(issues),
-        'total_urls_with_issues': len(issues_by_url),
-        'issues_by_url': issues_by_url,
-        'all_issues': issues
-    }, indent=2)
+def get_issue_exclusion_matcher():
+    """Compiled matcher for the session's current issue exclusion patterns (recompiled only when they change)"""
+    settings_manager = get_session_settings()
+    return get_exclusion_matcher(settings_manager.get_settings().get('issueExclusionPatterns', ''))
+
+def get_issue_exclusion_filter():
+    """Predicate applying the current issue exclusion patterns to one issue, or None when there are none"""
+    matcher = get_issue_exclusion_matcher()
+    if not matcher.pattern_count:
+        return None
+    return lambda issue: not matcher.is_excluded(issue.get('url', ''))
+
+def get_export_source(dataset, crawl_id=None, local_data=None):
+    """
+    Rows of a dataset to export: from a stored crawl, from data the client sent
+    (loaded crawls) or from the current crawl. Rows are read lazily; the count
+    fixes which rows belong to the export
+    """
+    if crawl_id is not None:
+        return RowSource(lambda: iter_crawl_store(crawl_id, dataset), count_crawl_store(crawl_id, dataset))
+    if local_data:
+        rows = local_data.get(dataset) or []
+        return RowSource(lambda: iter(rows), len(rows))
+    crawler = get_or_create_crawler()
+    return RowSource(lambda: crawler.iter_rows(dataset), crawler.get_row_count(dataset))
 
 @app.route('/api/user/info')
 @login_required
@@ -406,12 +259,15 @@ def start_crawl():
     except Exception as e:
         print(f"Warning: Could not apply settings: {e}")
 
-    success, message = crawler.start_crawl(url)
+    # Log crawl start first so the crawl store can link its data to the crawl_history row
+    crawl_id = log_crawl_start(user_id, url)
+    success, message = crawler.start_crawl(url, crawl_id)
 
-    # Log crawl start
     if success:
-        crawl_id = log_crawl_start(user_id, url)
         session['current_crawl_id'] = crawl_id
+    elif crawl_id:
+        # A rejected start (bad URL, crawl already running) must not count toward the daily crawl quota
+        delete_crawl_data(crawl_id)
 
     return jsonify({'success': success, 'message': message})
 
@@ -426,20 +282,126 @@ def stop_crawl():
 @login_required
 def crawl_status():
     crawler = get_or_create_crawler()
-    settings_manager = get_session_settings()
-    status_data = crawler.get_status()
+
+    # Clients that pass a cursor only receive URLs, links and issues added since then
+    cursor = None
+    if request.args.get('crawl_id'):
+        cursor = {
+            'crawl_id': request.args.get('crawl_id'),
+            'urls': request.args.get('urls', 0, type=int),
+            'links': request.args.get('links', 0, type=int),
+            'issues': request.args.get('issues', 0, type=int)
+        }
+
+    status_data = crawler.get_status(cursor)
 
     # Apply current issue exclusion patterns to displayed issues
     issues = status_data.get('issues', [])
     if issues:
-        current_settings = settings_manager.get_settings()
-        exclusion_patterns_text = current_settings.get('issueExclusionPatterns', '')
-        exclusion_patterns = [p.strip() for p in exclusion_patterns_text.split('\n') if p.strip()]
-        filtered_issues = filter_issues_by_exclusion_patterns(issues, exclusion_patterns)
-        status_data['issues'] = filtered_issues
+        status_data['issues'] = get_issue_exclusion_matcher().filter_issues(issues)
 
     return jsonify(status_data)
 
+@app.route('/api/crawl_events')
+@login_required
+def crawl_events():
+    """Server-Sent Events stream of crawl progress (new URLs, links, issues and stats)"""
+    crawler = get_or_create_crawler()
+    exclusion_matcher = get_issue_exclusion_matcher()
+
+    cursor = None
+    if request.args.get('crawl_id'):
+        cursor = {
+            'crawl_id': request.args.get('crawl_id'),
+            'urls': request.args.get('urls', 0, type=int),
+            'links': request.args.get('links', 0, type=int),
+            'issues': request.args.get('issues', 0, type=int)
+        }
+
+    def generate():
+        nonlocal cursor
+
+        while True:
+            # Batches are capped so a slow client gets several bounded events instead of one huge one,
+            # and since each batch is read from the cursor nothing queues up server-side
+            status_data = crawler.get_status(cursor, limit=SSE_BATCH_LIMIT)
+            cursor = status_data['cursor']
+
+            # A full batch means more may be waiting; judged before the exclusion filter drops issues
+            backlog = (len(status_data['urls']) == SSE_BATCH_LIMIT or
+                       len(status_data['links']) == SSE_BATCH_LIMIT or
+                       len(status_data['issues']) == SSE_BATCH_LIMIT)
+
+            if status_data['issues']:
+                status_data['issues'] = exclusion_matcher.filter_issues(status_data['issues'])
+
+            yield f"event: crawl\ndata: {json.dumps(status_data, default=str)}\n\n"
+
+            if backlog:
+                continue
+
+            if status_data['status'] != 'running' and not status_data['is_running_pagespeed']:
+                yield "event: done\ndata: {}\n\n"
+                return
+
+            # Wait for new results (or a stats tick), then let a batch accumulate
+            if crawler.wait_for_update(SSE_TICK_SECONDS):
+                time.sleep(SSE_BATCH_SECONDS)
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/query/<dataset>')
+@login_required
+def query_crawl_data(dataset):
+    """Paginated, sorted and filtered view of the current crawl's urls, links or issues"""
+    crawler = get_or_create_crawler()
+
+    # Apply current issue exclusion patterns, as /api/crawl_status does
+    row_filter = get_issue_exclusion_filter() if dataset == 'issues' else None
+
+    try:
+        result = crawler.query_results(dataset, request.args, row_filter)
+        return jsonify({'success': True, **result})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+@app.route('/api/crawls')
+@login_required
+def list_crawls():
+    """List the current user's crawls from crawl_history"""
+    limit = request.args.get('limit', 50, type=int)
+    return jsonify({'success': True, 'crawls': get_user_crawl_history(session.get('user_id'), limit)})
+
+def get_owned_crawl(crawl_id):
+    """Get a crawl_history row if it belongs to the current user"""
+    crawl = get_crawl_record(crawl_id)
+    if not crawl or crawl['user_id'] != session.get('user_id'):
+        return None
+    return crawl
+
+@app.route('/api/crawls/<int:crawl_id>/query/<dataset>')
+@login_required
+def query_stored_crawl(crawl_id, dataset):
+    """Paginated, sorted and filtered view of a stored crawl's urls, links or issues"""
+    if not get_owned_crawl(crawl_id):
+        return jsonify({'success': False, 'error': 'Crawl not found'}), 404
+
+    try:
+        result = query_crawl_store(crawl_id, dataset, request.args)
+        return jsonify({'success': True, **result})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+@app.route('/api/crawls/<int:crawl_id>', methods=['DELETE'])
+@login_required
+def delete_stored_crawl(crawl_id):
+    """Delete a stored crawl and its data"""
+    if not get_owned_crawl(crawl_id):
+        return jsonify({'success': False, 'error': 'Crawl not found'}), 404
+
+    return jsonify({'success': delete_crawl_data(crawl_id)})
+
 @app.route('/api/debug/memory')
 @login_required
 def debug_memory():
@@ -459,7 +421,7 @@ def debug_memory():
             # Get accurate data sizes
             data_sizes = MemoryProfiler.get_crawler_data_size(
                 crawler.crawl_results,
-                crawler.link_manager.all_links if crawler.link_manager else [],
+                crawler.link_manager,
                 crawler.issue_detector.detected_issues if crawler.issue_detector else []
             )
 
@@ -468,7 +430,8 @@ def debug_memory():
                 'last_accessed': instance_data['last_accessed'].isoformat(),
                 'urls_crawled': len(crawler.crawl_results),
                 'memory': stats,
-                'data_sizes': data_sizes
+                'data_sizes': data_sizes,
+                'tracked_data_sizes': crawler.data_sizes.get_data_sizes(crawler.link_manager)
             })
 
         return jsonify(memory_stats)
@@ -491,7 +454,7 @@ def debug_memory_profile():
             # Get crawler-specific data sizes
             data_sizes = MemoryProfiler.get_crawler_data_size(
                 crawler.crawl_results,
-                crawler.link_manager.all_links if crawler.link_manager else [],
+                crawler.link_manager,
                 crawler.issue_detector.detected_issues if crawler.issue_detector else []
             )
 
@@ -513,15 +476,9 @@ def filter_issues():
     try:
         data = request.get_json()
         issues = data.get('issues', [])
-        settings_manager = get_session_settings()
-
-        # Get current exclusion patterns
-        current_settings = settings_manager.get_settings()
-        exclusion_patterns_text = current_settings.get('issueExclusionPatterns', '')
-        exclusion_patterns = [p.strip() for p in exclusion_patterns_text.split('\n') if p.strip()]
 
-        # Filter issues
-        filtered_issues = filter_issues_by_exclusion_patterns(issues, exclusion_patterns)
+        # Filter issues with the current exclusion patterns
+        filtered_issues = get_issue_exclusion_matcher().filter_issues(issues)
 
         return jsonify({'success': True, 'issues': filtered_issues})
     except Exception as e:
@@ -618,19 +575,11 @@ def export_data():
 
         # Update link statuses from crawled URLs (fixes missing status codes in exports)
         if links and urls:
-            status_lookup = {url_data['url']: url_data.get('status_code') for url_data in urls}
-            for link in links:
-                target_url = link.get('target_url')
-                if target_url in status_lookup:
-                    link['target_status'] = status_lookup[target_url]
+            LinkManager.apply_link_statuses(links, LinkManager.build_status_index(urls))
 
         # Apply current issue exclusion patterns (works for loaded crawls too)
         if issues:
-            settings_manager = get_session_settings()
-            current_settings = settings_manager.get_settings()
-            exclusion_patterns_text = current_settings.get('issueExclusionPatterns', '')
-            exclusion_patterns = [p.strip() for p in exclusion_patterns_text.split('\n') if p.strip()]
-            issues = filter_issues_by_exclusion_patterns(issues, exclusion_patterns)
+            issues = get_issue_exclusion_matcher().filter_issues(issues)
             print(f"DEBUG: After exclusion filter, {len(issues)} issues remain")
 
         # Collect files to export based on special field selections
@@ -746,7 +695,155 @@ def export_data():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/api/export/<dataset>')
+@login_required
+def stream_export(dataset):
+    """
+    Stream the current crawl's (or a stored crawl's) urls, links or issues as a file download.
+    Query args: format (csv, json or xml), fields (comma-separated URL fields),
+    gzip=1 to compress the file, crawl_id to export a stored crawl
+    """
+    if dataset not in EXPORT_DATASETS:
+        return jsonify({'success': False, 'error': f'Unknown dataset: {dataset}'}), 400
+
+    export_format = request.args.get('format', 'csv')
+    export_fields = [f.strip() for f in request.args.get('fields', 'url,status_code,title').split(',') if f.strip()]
+    crawl_id = request.args.get('crawl_id', type=int)
+
+    if crawl_id is not None and not get_owned_crawl(crawl_id):
+        return jsonify({'success': False, 'error': 'Crawl not found'}), 404
+
+    rows = get_export_source(dataset, crawl_id)
+    if not len(rows):
+        return jsonify({'success': False, 'error': f'No {dataset} data to export'}), 404
+
+    # Apply current issue exclusion patterns (works for stored crawls too)
+    row_filter = get_issue_exclusion_filter() if dataset == 'issues' else None
+    if row_filter:
+        source = rows
+        rows = RowSource(lambda: (issue for issue in source if row_filter(issue)))
+
+    try:
+        chunks, mimetype, extension = get_export_chunks(dataset, export_format, rows, export_fields)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    filename = f'{EXPORT_FILE_PREFIXES[dataset]}_{int(time.time())}.{extension}'
+    if request.args.get('gzip', '').lower() in ('1', 'true', 'yes'):
+        chunks = gzip_chunks(chunks)
+        mimetype = 'application/gzip'
+        filename += '.gz'
+
+    return Response(stream_with_context(chunks), mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"',
+                             'X-Accel-Buffering': 'no'})
+
+@app.route('/api/export_jobs', methods=['POST'])
+@login_required
+def create_export_job():
+    """
+    Start a background export of the current crawl, a stored crawl (crawl_id)
+    or data sent by the client (localData). Body: format, fields (URL fields plus
+    issues_detected / links_detailed for the extra files), zip to bundle the files
+    """
+    data = request.get_json() or {}
+    export_format = data.get('format', 'csv')
+    export_fields = data.get('fields', ['url', 'status_code', 'title'])
+    local_data = data.get('localData') or {}
+    crawl_id = data.get('crawl_id')
+
+    if export_format not in EXPORT_MIMETYPES:
+        return jsonify({'success': False, 'error': 'Unsupported export format'}), 400
+    if crawl_id is not None and not get_owned_crawl(crawl_id):
+        return jsonify({'success': False, 'error': 'Crawl not found'}), 404
+    if not local_data.get('urls'):
+        local_data = None
+
+    # Same files as /api/export_data: issues and links on request, then the URL fields
+    regular_fields = [f for f in export_fields if f not in ['issues_detected', 'links_detailed']]
+    datasets = []
+    if 'issues_detected' in export_fields:
+        datasets.append('issues')
+    if 'links_detailed' in export_fields:
+        datasets.append('links')
+    if regular_fields:
+        datasets.append('urls')
+
+    if not len(get_export_source('urls', crawl_id, local_data)):
+        return jsonify({'success': False, 'error': 'No data to export'})
+
+    if local_data and local_data.get('links'):
+        # Update link statuses from crawled URLs (fixes missing status codes in exports)
+        LinkManager.apply_link_statuses(local_data['links'], LinkManager.build_status_index(local_data['urls']))
+
+    artifacts = []
+    for dataset in datasets:
+        source = get_export_source(dataset, crawl_id, local_data)
+        if len(source):
+            row_filter = get_issue_exclusion_filter() if dataset == 'issues' else None
+            artifacts.append(ExportArtifact(dataset, source, regular_fields, row_filter))
+
+    if not artifacts:
+        return jsonify({'success': False, 'error': 'No data to export'})
+
+    job = export_jobs.submit(session.get('user_id'), export_format, artifacts, bool(data.get('zip')))
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+@app.route('/api/export_jobs/<job_id>')
+@login_required
+def get_export_job(job_id):
+    """Progress and files of an export job"""
+    job = export_jobs.get_job(job_id, session.get('user_id'))
+    if not job:
+        return jsonify({'success': False, 'error': 'Export job not found'}), 404
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+@app.route('/api/export_jobs/<job_id>/download')
+@login_required
+def download_export_job(job_id):
+    """Download a finished export file (pass ?file= when the job has several)"""
+    job = export_jobs.get_job(job_id, session.get('user_id'))
+    if not job:
+        return jsonify({'success': False, 'error': 'Export job not found'}), 404
+
+    path = job.get_file_path(request.args.get('file'))
+    if not path:
+        return jsonify({'success': False, 'error': 'Export file not available'}), 404
+    return send_file(path, as_attachment=True, download_name=os.path.basename(path))
+
+@app.route('/api/export_jobs/<job_id>', methods=['DELETE'])
+@login_required
+def delete_export_job(job_id):
+    """Delete a finished export job and its files"""
+    return jsonify({'success': export_jobs.delete_job(job_id, session.get('user_id'))})
+
+def init_app(local_mode=False):
+    """
+    Run the server's startup side effects: database, export jobs and local mode.
+
+    Kept out of module import because parse pool workers (spawned processes)
+    re-import this module as __mp_main__.
+    """
+    global LOCAL_MODE, export_jobs
+
+    LOCAL_MODE = local_mode
+
+    # Initialize database on startup
+    init_db()
+
+    export_jobs = ExportJobManager()
+
+    if LOCAL_MODE:
+        print("=" * 60)
+        print("LOCAL MODE ENABLED")
+        print("All users will have admin tier access")
+        print("No rate limits or tier restrictions")
+        print("=" * 60)
+
 def main():
+    args = parser.parse_args()
+    init_app(args.local)
+
     # Start cleanup thread for old crawler instances
     start_cleanup_thread()
 
@@ -4,6 +4,7 @@ Handles user registration, login, and verification
 """
 import sqlite3
 import bcrypt
+import json
 import os
 import secrets
 from datetime import datetime
@@ -77,12 +78,73 @@ def init_db():
             ON guest_crawls(ip_address, crawl_time)
         ''')
 
+        # Per-crawl result store, linked to crawl_history and written while crawls run
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_urls (
+                crawl_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                status_code INTEGER,
+                content_type TEXT,
+                depth INTEGER,
+                title TEXT,
+                is_internal INTEGER,
+                word_count INTEGER,
+                response_time REAL,
+                size INTEGER,
+                data_json TEXT NOT NULL,
+                PRIMARY KEY (crawl_id, seq),
+                FOREIGN KEY (crawl_id) REFERENCES crawl_history (id) ON DELETE CASCADE
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_crawl_urls_url
+            ON crawl_urls(crawl_id, url)
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_links (
+                crawl_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                source_url TEXT NOT NULL,
+                target_url TEXT NOT NULL,
+                anchor_text TEXT,
+                is_internal INTEGER,
+                target_domain TEXT,
+                target_status INTEGER,
+                placement TEXT,
+                PRIMARY KEY (crawl_id, seq),
+                FOREIGN KEY (crawl_id) REFERENCES crawl_history (id) ON DELETE CASCADE
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_issues (
+                crawl_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                url TEXT,
+                type TEXT,
+                category TEXT,
+                issue TEXT,
+                details TEXT,
+                PRIMARY KEY (crawl_id, seq),
+                FOREIGN KEY (crawl_id) REFERENCES crawl_history (id) ON DELETE CASCADE
+            )
+        ''')
+
+        # WAL lets the crawl store write batches while requests read
+        cursor.execute('PRAGMA journal_mode=WAL')
+
         # Add tier column to existing users table if it doesn't exist
         try:
             cursor.execute("ALTER TABLE users ADD COLUMN tier TEXT DEFAULT 'guest'")
         except:
             pass  # Column already exists
 
+        # Failed crawl store batch writes per crawl (the batches are retried)
+        try:
+            cursor.execute("ALTER TABLE crawl_history ADD COLUMN store_errors INTEGER DEFAULT 0")
+        except:
+            pass  # Column already exists
+
         print("Database initialized successfully")
 
 def hash_password(password):
@@ -382,6 +444,21 @@ def log_crawl_complete(crawl_id, urls_crawled, status='completed'):
         print(f"Error logging crawl complete: {e}")
         return False
 
+def log_crawl_store_error(crawl_id):
+    """Count a failed crawl store batch write against a crawl"""
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE crawl_history
+                SET store_errors = COALESCE(store_errors, 0) + 1
+                WHERE id = ?
+            ''', (crawl_id,))
+        return True
+    except Exception as e:
+        print(f"Error logging crawl store error: {e}")
+        return False
+
 def log_guest_crawl(ip_address):
     """Log a guest crawl by IP address"""
     try:
@@ -440,7 +517,7 @@ def get_user_crawl_history(user_id, limit=50):
         with get_db() as conn:
             cursor = conn.cursor()
             cursor.execute('''
-                SELECT id, base_url, started_at, completed_at, urls_crawled, status
+                SELECT id, base_url, started_at, completed_at, urls_crawled, status, store_errors
                 FROM crawl_history
                 WHERE user_id = ?
                 ORDER BY started_at DESC
@@ -450,3 +527,229 @@ def get_user_crawl_history(user_id, limit=50):
     except Exception as e:
         print(f"Error getting crawl history: {e}")
         return []
+
+
+# Columns stored for each crawl dataset; url rows also keep the full record as JSON
+CRAWL_DATA_COLUMNS = {
+    'urls': ('url', 'status_code', 'content_type', 'depth', 'title', 'is_internal',
+             'word_count', 'response_time', 'size'),
+    'links': ('source_url', 'target_url', 'anchor_text', 'is_internal', 'target_domain',
+              'target_status', 'placement'),
+    'issues': ('url', 'type', 'category', 'issue', 'details')
+}
+
+CRAWL_DATA_TABLES = {'urls': 'crawl_urls', 'links': 'crawl_links', 'issues': 'crawl_issues'}
+
+def save_crawl_batch(crawl_id, results, links, issues):
+    """
+    Write a batch of crawl data in one transaction
+    Each argument is a list of (seq, record) pairs
+    """
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            for dataset, rows in (('urls', results), ('links', links), ('issues', issues)):
+                if not rows:
+                    continue
+                columns = CRAWL_DATA_COLUMNS[dataset]
+                names = ['crawl_id', 'seq', *columns] + (['data_json'] if dataset == 'urls' else [])
+                values = []
+                for seq, record in rows:
+                    row = [crawl_id, seq, *(record.get(column) for column in columns)]
+                    if dataset == 'urls':
+                        row.append(json.dumps(dict(record), default=str))
+                    values.append(row)
+                cursor.executemany(f'''
+                    INSERT OR REPLACE INTO {CRAWL_DATA_TABLES[dataset]} ({', '.join(names)})
+                    VALUES ({', '.join('?' * len(names))})
+                ''', values)
+        return True
+    except Exception as e:
+        print(f"Error saving crawl data: {e}")
+        return False
+
+def finalize_crawl_data(crawl_id, linked_from):
+    """
+    Fill in data only known once a crawl ends: linked_from per URL
+    (list of (seq, linked_from, linked_from_count)) and link target statuses
+    """
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                UPDATE crawl_urls
+                SET data_json = json_set(data_json, '$.linked_from', json(?), '$.linked_from_count', ?)
+                WHERE crawl_id = ? AND seq = ?
+            ''', [(json.dumps(sources), count, crawl_id, seq) for seq, sources, count in linked_from])
+            cursor.execute('''
+                UPDATE crawl_links
+                SET target_status = (
+                    SELECT status_code FROM crawl_urls
+                    WHERE crawl_urls.crawl_id = crawl_links.crawl_id AND crawl_urls.url = crawl_links.target_url
+                )
+                WHERE crawl_id = ? AND target_status IS NULL
+            ''', (crawl_id,))
+        return True
+    except Exception as e:
+        print(f"Error finalizing crawl data: {e}")
+        return False
+
+def get_crawl_record(crawl_id):
+    """Get a crawl_history row"""
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, user_id, base_url, started_at, completed_at, urls_crawled, status, store_errors
+                FROM crawl_history
+                WHERE id = ?
+            ''', (crawl_id,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+    except Exception as e:
+        print(f"Error getting crawl record: {e}")
+        return None
+
+def query_crawl_store(crawl_id, dataset, params):
+    """
+    Paginated, sorted and filtered query over a stored crawl
+    Accepts the same parameters as the in-memory /api/query endpoint
+    Raises ValueError on an unknown dataset or malformed parameter
+    """
+    from src.core.result_query import (
+        DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, SEARCH_FIELDS, STATUS_FIELDS, parse_status_filter
+    )
+
+    if dataset not in CRAWL_DATA_TABLES:
+        raise ValueError(f"Unknown dataset: {dataset}")
+
+    columns = CRAWL_DATA_COLUMNS[dataset]
+    page = max(1, int(params.get('page', 1)))
+    page_size = min(MAX_PAGE_SIZE, max(1, int(params.get('page_size', DEFAULT_PAGE_SIZE))))
+
+    where = ['crawl_id = ?']
+    args = [crawl_id]
+
+    if params.get('status') and dataset in STATUS_FIELDS:
+        ranges = parse_status_filter(params['status'])
+        if ranges:
+            where.append('(' + ' OR '.join(f'{STATUS_FIELDS[dataset]} BETWEEN ? AND ?' for _ in ranges) + ')')
+            args.extend(bound for status_range in ranges for bound in status_range)
+    if params.get('content_type') and dataset == 'urls':
+        where.append('instr(lower(content_type), ?) > 0')
+        args.append(params['content_type'].lower())
+    if dataset == 'urls':
+        if params.get('min_depth') not in (None, ''):
+            where.append('depth >= ?')
+            args.append(int(params['min_depth']))
+        if params.get('max_depth') not in (None, ''):
+            where.append('depth <= ?')
+            args.append(int(params['max_depth']))
+    if params.get('internal') and dataset in ('urls', 'links'):
+        where.append('is_internal = ?')
+        args.append(1 if params['internal'].strip().lower() in ('1', 'true', 'yes') else 0)
+    if params.get('placement') and dataset == 'links':
+        where.append('placement = ?')
+        args.append(params['placement'])
+    if dataset == 'issues':
+        for field in ('category', 'type'):
+            if params.get(field):
+                where.append(f'{field} = ?')
+                args.append(params[field])
+    if params.get('search'):
+        fields = SEARCH_FIELDS[dataset]
+        where.append('(' + ' OR '.join(f"instr(lower(coalesce({field}, '')), ?) > 0" for field in fields) + ')')
+        args.extend([params['search'].lower()] * len(fields))
+
+    order_by = 'seq'
+    sort_key = params.get('sort')
+    if sort_key:
+        if sort_key not in columns:
+            raise ValueError(f"Cannot sort stored {dataset} by: {sort_key}")
+        direction = 'DESC' if params.get('order', 'asc').lower() == 'desc' else 'ASC'
+        order_by = f'{sort_key} IS NULL, {sort_key} {direction}, seq'
+
+    table = CRAWL_DATA_TABLES[dataset]
+    where_sql = ' AND '.join(where)
+    select_sql = 'data_json' if dataset == 'urls' else ', '.join(columns)
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT COUNT(*) AS count FROM {table} WHERE {where_sql}', args)
+        total = cursor.fetchone()['count']
+        cursor.execute(f'''
+            SELECT {select_sql} FROM {table}
+            WHERE {where_sql}
+            ORDER BY {order_by}
+            LIMIT ? OFFSET ?
+        ''', args + [page_size, (page - 1) * page_size])
+        if dataset == 'urls':
+            items = [json.loads(row['data_json']) for row in cursor.fetchall()]
+        else:
+            items = [dict(row) for row in cursor.fetchall()]
+
+    if dataset == 'links':
+        for item in items:
+            item['is_internal'] = bool(item['is_internal'])
+
+    return {
+        'items': items,
+        'total': total,
+        'page': page,
+        'page_size': page_size,
+        'pages': (total + page_size - 1) // page_size
+    }
+
+def count_crawl_store(crawl_id, dataset):
+    """Number of stored rows in a crawl dataset"""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT COUNT(*) AS count FROM {CRAWL_DATA_TABLES[dataset]} WHERE crawl_id = ?', (crawl_id,))
+        return cursor.fetchone()['count']
+
+def iter_crawl_store(crawl_id, dataset, batch_size=1000):
+    """
+    Yield every stored row of a crawl dataset in crawl order
+    Reads seq-keyed batches, so no connection stays open while the caller consumes rows
+    """
+    table = CRAWL_DATA_TABLES[dataset]
+    select_sql = 'seq, data_json' if dataset == 'urls' else 'seq, ' + ', '.join(CRAWL_DATA_COLUMNS[dataset])
+    last_seq = -1
+
+    while True:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT {select_sql} FROM {table}
+                WHERE crawl_id = ? AND seq > ?
+                ORDER BY seq
+                LIMIT ?
+            ''', (crawl_id, last_seq, batch_size))
+            rows = cursor.fetchall()
+
+        if not rows:
+            return
+        last_seq = rows[-1]['seq']
+
+        for row in rows:
+            if dataset == 'urls':
+                yield json.loads(row['data_json'])
+            else:
+                item = dict(row)
+                del item['seq']
+                if dataset == 'links':
+                    item['is_internal'] = bool(item['is_internal'])
+                yield item
+
+def delete_crawl_data(crawl_id):
+    """Delete a crawl's stored results, links and issues along with its history row"""
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            for table in CRAWL_DATA_TABLES.values():
+                cursor.execute(f'DELETE FROM {table} WHERE crawl_id = ?', (crawl_id,))
+            cursor.execute('DELETE FROM crawl_history WHERE id = ?', (crawl_id,))
+        return True
+    except Exception as e:
+        print(f"Error deleting crawl data: {e}")
+        return False
@@ -0,0 +1,166 @@
+"""Adaptive per-host concurrency: AIMD driven by response latency and overload signals"""
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+# Responses that mean the server is overloaded
+OVERLOAD_STATUS_CODES = frozenset((429, 503))
+
+# Concurrent requests a host starts with before the controller raises it
+INITIAL_HOST_CONCURRENCY = 2
+
+# Latency above baseline * ratio (and baseline + margin seconds) counts as the server slowing down
+LATENCY_BACKOFF_RATIO = 2.0
+LATENCY_BACKOFF_MARGIN = 0.1
+
+# Weight of the newest response in the smoothed latency
+LATENCY_SMOOTHING = 0.2
+
+# Factor the limit is cut by on backoff
+DECREASE_FACTOR = 0.5
+
+# Upper bound on a Retry-After pause, in seconds
+MAX_RETRY_AFTER = 300
+
+# Hosts tracked before idle ones are dropped
+MAX_TRACKED_HOSTS = 10000
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header (delta seconds or HTTP date).
+
+    Returns:
+        float: Seconds to wait (capped at MAX_RETRY_AFTER), or None if absent or invalid
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class HostConcurrency:
+    """Concurrency state of one host"""
+
+    __slots__ = ('limit', 'in_flight', 'latency', 'baseline', 'last_decrease')
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.in_flight = 0
+        self.latency = None  # Smoothed response time
+        self.baseline = None  # Response time the host manages when not under strain
+        self.last_decrease = 0.0
+
+
+class AdaptiveConcurrency:
+    """
+    Per-host concurrency limits tuned by additive increase / multiplicative decrease.
+
+    Each host starts at INITIAL_HOST_CONCURRENCY requests in flight. Every
+    response that comes back at about the host's baseline latency raises the
+    limit by 1/limit (one more request per round of responses), up to
+    max_concurrency. A 429/503, a timeout or latency well above the baseline
+    halves it, at most once per latency period so responses to requests
+    started before a cut do not cut again. With adaptive off every host is
+    allowed max_concurrency and only the statistics are kept.
+    """
+
+    def __init__(self, max_concurrency, adaptive=True):
+        """
+        Args:
+            max_concurrency: Most requests a single host may have in flight
+            adaptive: Tune the per-host limit; if False it stays at max_concurrency
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.adaptive = adaptive
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def _get_host(self, host):
+        state = self.hosts.get(host)
+        if state is None:
+            if len(self.hosts) >= MAX_TRACKED_HOSTS:
+                self.hosts = {h: s for h, s in self.hosts.items() if s.in_flight}
+            limit = min(INITIAL_HOST_CONCURRENCY, self.max_concurrency) if self.adaptive else self.max_concurrency
+            state = self.hosts[host] = HostConcurrency(limit)
+        return state
+
+    def try_start(self, host):
+        """Take an in-flight slot for host if it is below its limit"""
+        with self.lock:
+            state = self._get_host(host)
+            if state.in_flight >= int(state.limit):
+                return False
+            state.in_flight += 1
+            return True
+
+    def finish(self, host):
+        """Give back an in-flight slot taken by try_start()"""
+        with self.lock:
+            state = self.hosts.get(host)
+            if state and state.in_flight > 0:
+                state.in_flight -= 1
+
+    def record_response(self, host, latency, status_code=None, timed_out=False):
+        """
+        Feed one fetch outcome to the host's controller.
+
+        Args:
+            host: Host the request went to
+            latency: Fetch time in seconds
+            status_code: HTTP status, if a response arrived
+            timed_out: The request timed out
+        """
+        with self.lock:
+            state = self._get_host(host)
+            now = time.monotonic()
+
+            if not timed_out:
+                if state.latency is None:
+                    state.latency = state.baseline = latency
+                else:
+                    state.latency += (latency - state.latency) * LATENCY_SMOOTHING
+                    # The baseline follows latency down at once but up only slowly
+                    state.baseline = min(state.latency, state.baseline + (state.latency - state.baseline) * 0.01)
+
+            if not self.adaptive:
+                return
+
+            overloaded = (
+                timed_out or
+                status_code in OVERLOAD_STATUS_CODES or
+                state.latency > max(state.baseline * LATENCY_BACKOFF_RATIO,
+                                    state.baseline + LATENCY_BACKOFF_MARGIN)
+            )
+
+            if overloaded:
+                if now - state.last_decrease >= max(state.latency or 0.0, 1.0):
+                    state.limit = max(1.0, state.limit * DECREASE_FACTOR)
+                    state.last_decrease = now
+                    print(f"Backing off {host}: concurrency limit now {int(state.limit)}")
+            elif state.limit < self.max_concurrency:
+                state.limit = min(self.max_concurrency, state.limit + 1.0 / state.limit)
+
+    def get_stats(self, max_hosts=20):
+        """Limits, in-flight counts and latency of the busiest hosts"""
+        with self.lock:
+            busiest = sorted(self.hosts.items(), key=lambda item: item[1].in_flight, reverse=True)[:max_hosts]
+            return {
+                'adaptive': self.adaptive,
+                'max_concurrency': self.max_concurrency,
+                'hosts': {
+                    host: {
+                        'limit': int(state.limit),
+                        'in_flight': state.in_flight,
+                        'latency_ms': round(state.latency * 1000, 1) if state.latency is not None else None
+                    }
+                    for host, state in busiest
+                }
+            }
@@ -0,0 +1,120 @@
+"""HTTP connection pooling sized to crawl concurrency, with reuse statistics"""
+import threading
+from functools import partial
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionPoolStats:
+    """Thread-safe counters for connection reuse across all host pools"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all counters"""
+        with self.lock:
+            self.pool_hits = 0
+            self.pool_misses = 0
+            self.tls_handshakes = 0
+            self.hosts = set()
+
+    def record_checkout(self, scheme, host, reused):
+        """Record a connection checkout; a miss means a new TCP (and TLS) connection"""
+        with self.lock:
+            if host:
+                self.hosts.add(host)
+            if reused:
+                self.pool_hits += 1
+            else:
+                self.pool_misses += 1
+                if scheme == 'https':
+                    self.tls_handshakes += 1
+
+    def get_stats(self):
+        """Get connection pool statistics"""
+        with self.lock:
+            checkouts = self.pool_hits + self.pool_misses
+            return {
+                'pool_hits': self.pool_hits,
+                'pool_misses': self.pool_misses,
+                'tcp_connects': self.pool_misses,
+                'tls_handshakes': self.tls_handshakes,
+                'hosts': len(self.hosts),
+                'reuse_rate': round(self.pool_hits / checkouts * 100, 1) if checkouts else 0.0
+            }
+
+
+class _CountingPoolMixin:
+    """Reports every connection checkout from a urllib3 pool to ConnectionPoolStats"""
+
+    def __init__(self, *args, pool_stats=None, **kwargs):
+        self.pool_stats = pool_stats
+        super().__init__(*args, **kwargs)
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        if self.pool_stats:
+            # A connection without a socket has to connect (and handshake) before use
+            reused = getattr(conn, 'sock', None) is not None
+            self.pool_stats.record_checkout(self.scheme, self.host, reused)
+        return conn
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter keeping one keep-alive pool per host.
+
+    pool_connections bounds how many host pools are cached, pool_maxsize how many
+    idle connections each host pool keeps (normally the crawl concurrency).
+    """
+
+    def __init__(self, pool_stats, pool_connections=10, pool_maxsize=10, **kwargs):
+        self.pool_stats = pool_stats
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self._install_counting_pools(self.poolmanager)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        self._install_counting_pools(manager)
+        return manager
+
+    def _install_counting_pools(self, manager):
+        """Make the pool manager create instrumented host pools"""
+        manager.pool_classes_by_scheme = {
+            'http': partial(_CountingHTTPConnectionPool, pool_stats=self.pool_stats),
+            'https': partial(_CountingHTTPSConnectionPool, pool_stats=self.pool_stats)
+        }
+
+
+def create_aiohttp_trace_config(pool_stats):
+    """Build an aiohttp TraceConfig that feeds connection reuse into ConnectionPoolStats"""
+    import aiohttp
+
+    async def on_request_start(session, ctx, params):
+        ctx.scheme = params.url.scheme
+        ctx.host = params.url.host
+
+    async def on_connection_create_end(session, ctx, params):
+        pool_stats.record_checkout(getattr(ctx, 'scheme', ''), getattr(ctx, 'host', ''), False)
+
+    async def on_connection_reuseconn(session, ctx, params):
+        pool_stats.record_checkout(getattr(ctx, 'scheme', ''), getattr(ctx, 'host', ''), True)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    return trace_config
@@ -0,0 +1,184 @@
+"""Compact record type for crawl results"""
+import sys
+from collections.abc import MutableMapping
+
+
+def _default_analytics():
+    return {
+        'google_analytics': False,
+        'gtag': False,
+        'ga4_id': '',
+        'gtm_id': '',
+        'facebook_pixel': False,
+        'hotjar': False,
+        'mixpanel': False
+    }
+
+
+# Fields every result has, in API order; callable defaults build the per-record containers extraction fills in
+RESULT_FIELDS = {
+    'url': '',
+    'status_code': 0,
+    'content_type': '',
+    'size': 0,
+    'is_internal': False,
+    'depth': 0,
+    'title': '',
+    'meta_description': '',
+    'h1': '',
+    'h2': list,
+    'h3': list,
+    'word_count': 0,
+    'meta_tags': dict,
+    'og_tags': dict,
+    'twitter_tags': dict,
+    'canonical_url': '',
+    'lang': '',
+    'charset': '',
+    'viewport': '',
+    'robots': '',
+    'author': '',
+    'keywords': '',
+    'generator': '',
+    'theme_color': '',
+    'json_ld': list,
+    'analytics': _default_analytics,
+    'images': list,
+    'external_links': 0,
+    'internal_links': 0,
+    'response_time': 0,
+    'redirects': list,
+    'hreflang': list,
+    'schema_org': list,
+    'linked_from': list,
+    'linked_from_count': 0
+}
+
+# Fields only present on some results (failed fetches, JavaScript-rendered pages)
+OPTIONAL_FIELDS = ('error', 'javascript_rendered')
+
+# Short values that repeat across most pages of a site
+INTERNED_FIELDS = ('content_type', 'lang', 'charset', 'viewport', 'robots', 'author', 'generator', 'theme_color')
+
+# Distinct analytics dicts shared between results before new ones stop being pooled
+MAX_SHARED_ANALYTICS = 1024
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError('Shared crawl result values are read-only')
+
+
+class _SharedDict(dict):
+    """Read-only dict shared by many results (still a dict for JSON and isinstance checks)"""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+
+class _SharedList(list):
+    """Read-only list shared by many results (still a list for JSON and isinstance checks)"""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+
+EMPTY_DICT = _SharedDict()
+EMPTY_LIST = _SharedList()
+_shared_analytics = {}
+
+
+def _share_analytics(analytics):
+    """Return the pooled read-only copy of an analytics dict"""
+    key = tuple(analytics.items())
+    shared = _shared_analytics.get(key)
+    if shared is None:
+        if len(_shared_analytics) >= MAX_SHARED_ANALYTICS:
+            return analytics
+        shared = _shared_analytics.setdefault(key, _SharedDict(analytics))
+    return shared
+
+
+def get_shared_values():
+    """Objects shared between results, which per-record size measurements should leave out"""
+    return (EMPTY_DICT, EMPTY_LIST, *_shared_analytics.values())
+
+
+class CrawlResult(MutableMapping):
+    """
+    One crawled URL, stored in slots instead of a per-record dict.
+
+    Behaves like the result dict it replaces (item access, get, update,
+    iteration in API order), so extraction, issue detection and queries are
+    unchanged. Optional fields that were never set are absent, as they were
+    in the dicts. Once the record is stored, compact() swaps empty containers
+    and common analytics dicts for shared read-only instances and interns
+    repeated strings. Use to_dict() where a plain dict is needed (jsonify).
+    """
+
+    __slots__ = (*RESULT_FIELDS, *OPTIONAL_FIELDS)
+    FIELD_NAMES = frozenset(__slots__)
+
+    def __init__(self, **values):
+        for name, default in RESULT_FIELDS.items():
+            if name in values:
+                setattr(self, name, values.pop(name))
+            else:
+                setattr(self, name, default() if callable(default) else default)
+        for name, value in values.items():
+            self[name] = value
+
+    def __getitem__(self, key):
+        if key in self.FIELD_NAMES:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in self.FIELD_NAMES:
+            return getattr(self, key, default)
+        return default
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELD_NAMES:
+            raise KeyError(f'Unknown crawl result field: {key}')
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in RESULT_FIELDS and key in self.FIELD_NAMES and hasattr(self, key):
+            delattr(self, key)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.FIELD_NAMES and hasattr(self, key)
+
+    def __iter__(self):
+        for name in self.__slots__:
+            if hasattr(self, name):
+                yield name
+
+    def __len__(self):
+        return len(RESULT_FIELDS) + sum(1 for name in OPTIONAL_FIELDS if hasattr(self, name))
+
+    def __repr__(self):
+        return f'CrawlResult({self.to_dict()!r})'
+
+    def to_dict(self):
+        """Plain dict copy for JSON serialization (nested values are shared, not copied)"""
+        return {name: getattr(self, name) for name in self}
+
+    def compact(self):
+        """Share empty containers and common analytics dicts, and intern repeated strings"""
+        for name, default in RESULT_FIELDS.items():
+            value = getattr(self, name)
+            if default is list and not value:
+                setattr(self, name, EMPTY_LIST)
+            elif default is dict and not value:
+                setattr(self, name, EMPTY_DICT)
+            elif name in INTERNED_FIELDS and type(value) is str:
+                setattr(self, name, sys.intern(value))
+
+        if type(self.analytics) is dict:
+            self.analytics = _share_analytics(self.analytics)
+        return self
@@ -0,0 +1,106 @@
+"""Streams crawl results, links and issues to the SQLite crawl store while a crawl runs"""
+import queue
+import threading
+import time
+
+from src.auth_db import save_crawl_batch, finalize_crawl_data, log_crawl_complete, log_crawl_store_error
+
+
+class CrawlStore:
+    """
+    Background writer for one crawl's data.
+
+    Crawl threads only enqueue records; a single writer thread serializes them
+    and writes batched transactions (every batch_size records or
+    flush_interval seconds). New links are read straight from the link
+    manager's append-only storage at each flush.
+
+    A batch that fails to write is kept and retried with the next flush (the
+    last retry happens in finish()); each failure is counted in the crawl's
+    crawl_history row.
+    """
+
+    def __init__(self, crawl_id, link_manager, batch_size=500, flush_interval=1.0):
+        self.crawl_id = crawl_id
+        self.link_manager = link_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.pending = queue.Queue()
+        self.issue_seq = 0
+        self.links_written = 0
+        self.unsaved_results = []  # Results and issues of batches that failed to write
+        self.unsaved_issues = []
+        self.store_errors = 0
+        self.stop_event = threading.Event()
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+
+    def start(self):
+        """Start the writer thread"""
+        self.writer_thread.start()
+
+    def add(self, seq, result, issues):
+        """Queue a stored result (seq = its position in crawl_results) and the issues detected for it"""
+        self.pending.put((seq, result, issues))
+
+    def _writer_loop(self):
+        results, issues = [], []
+        last_flush = time.time()
+
+        while not self.stop_event.is_set() or not self.pending.empty():
+            try:
+                seq, result, result_issues = self.pending.get(timeout=0.2)
+                results.append((seq, result))
+                for issue in result_issues:
+                    issues.append((self.issue_seq, issue))
+                    self.issue_seq += 1
+            except queue.Empty:
+                pass
+
+            if len(results) >= self.batch_size or time.time() - last_flush >= self.flush_interval:
+                self._flush(results, issues)
+                results, issues = [], []
+                last_flush = time.time()
+
+        self._flush(results, issues)
+
+    def _flush(self, results, issues):
+        """Write queued results and issues plus any links collected since the last flush; False if the write failed"""
+        results = self.unsaved_results + results
+        issues = self.unsaved_issues + issues
+        links = self.link_manager.get_links(self.links_written)
+        if not results and not issues and not links:
+            return True
+
+        link_rows = list(enumerate(links, self.links_written))
+        if save_crawl_batch(self.crawl_id, results, link_rows, issues):
+            self.links_written += len(links)
+            self.unsaved_results, self.unsaved_issues = [], []
+            return True
+
+        # Links are not marked written, so they are read again with the retry
+        self.unsaved_results, self.unsaved_issues = results, issues
+        self.store_errors += 1
+        log_crawl_store_error(self.crawl_id)
+        return False
+
+    def finish(self, crawl_results, status='completed'):
+        """
+        Flush everything, store the final linked_from data and close the crawl_history row.
+
+        Args:
+            crawl_results: The crawler's results (positions match the queued seq numbers)
+            status: Final crawl status for crawl_history
+        """
+        self.stop_event.set()
+        self.writer_thread.join()
+
+        # Last retry of a failed batch, plus links collected after the writer stopped
+        if not self._flush([], []):
+            print(f"Crawl store {self.crawl_id}: {len(self.unsaved_results)} results, {len(self.unsaved_issues)} "
+                  f"issues and {self.link_manager.get_link_count() - self.links_written} links could not be saved")
+
+        linked_from = [(seq, result.get('linked_from', []), result.get('linked_from_count', 0))
+                       for seq, result in enumerate(crawl_results)]
+        finalize_crawl_data(self.crawl_id, linked_from)
+        log_crawl_complete(self.crawl_id, len(crawl_results), status)
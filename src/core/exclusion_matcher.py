@@ -0,0 +1,68 @@
+"""Compiled matcher for issue exclusion patterns"""
+import re
+from fnmatch import translate
+from functools import lru_cache
+from urllib.parse import urlparse
+
+
+# URLs whose match result each matcher remembers
+MATCH_CACHE_SIZE = 100000
+
+
+class ExclusionMatcher:
+    """
+    Issue exclusion patterns compiled into a single regex.
+
+    Patterns containing '*' are fnmatch globs over the URL path; any other
+    pattern matches the path as a prefix. Blank lines and '#' comments are
+    ignored. Results are cached per URL, so a URL is only matched once no
+    matter how many issues it has or how often they are filtered.
+    """
+
+    def __init__(self, patterns):
+        parts = []
+        for pattern in patterns:
+            pattern = pattern.strip()
+            if not pattern or pattern.startswith('#'):
+                continue
+            parts.append(translate(pattern) if '*' in pattern else re.escape(pattern))
+
+        self.pattern_count = len(parts)
+        self.regex = re.compile('|'.join(parts)) if parts else None
+        self.cache = {}
+
+    def is_excluded(self, url):
+        """Check if a URL's path matches any exclusion pattern"""
+        if self.regex is None:
+            return False
+
+        excluded = self.cache.get(url)
+        if excluded is None:
+            excluded = self.regex.match(urlparse(url).path) is not None
+            if len(self.cache) >= MATCH_CACHE_SIZE:
+                self.cache.clear()
+            self.cache[url] = excluded
+        return excluded
+
+    def filter_issues(self, issues):
+        """Drop issues whose URL is excluded"""
+        if self.regex is None:
+            return issues
+        return [issue for issue in issues if not self.is_excluded(issue.get('url', ''))]
+
+
+@lru_cache(maxsize=32)
+def _compile_matcher(patterns):
+    return ExclusionMatcher(patterns)
+
+
+def get_exclusion_matcher(patterns):
+    """
+    Get the shared matcher for a pattern list or newline-separated pattern text.
+
+    Matchers are keyed by the patterns themselves, so each settings value is
+    compiled once and its URL cache is reused until the patterns change.
+    """
+    if isinstance(patterns, str):
+        patterns = patterns.split('\n')
+    return _compile_matcher(tuple(pattern.strip() for pattern in patterns))
@@ -0,0 +1,104 @@
+"""Crawl frontier storage: in-memory deque or disk-backed FIFO queue"""
+import os
+import shutil
+import tempfile
+import weakref
+from array import array
+from collections import deque
+
+
+FRONTIER_MODES = ('memory', 'disk')
+
+
+def create_frontier(mode='memory', buffer_size=50000):
+    """Create the pending-URL queue for the given frontier mode"""
+    if mode == 'disk':
+        return DiskFrontier(buffer_size=buffer_size)
+    return deque()
+
+
+class DiskFrontier:
+    """
+    FIFO queue of (url_id, depth) pairs that spills to segment files on disk.
+
+    New entries collect in an in-memory tail buffer which is written out as an
+    append-only segment file once it holds buffer_size entries. Entries are
+    served from an in-memory head buffer, refilled from the oldest segment (or
+    straight from the tail when nothing is on disk), so at most two buffers of
+    pending URLs are held in RAM. Supports the deque operations LinkManager
+    uses (append, popleft, len, clear). Not thread-safe on its own.
+
+    Only the queue entries are spilled: the URL strings stay in the link
+    manager's url_table in RAM. Every frontier URL is also the target of a
+    collected link, so the link graph needs that string in memory anyway and
+    the disk mode bounds the queue, not the URL storage.
+    """
+
+    def __init__(self, directory=None, buffer_size=50000):
+        self.directory = tempfile.mkdtemp(prefix='librecrawl-frontier-', dir=directory)
+        self.buffer_size = buffer_size
+        self.head = deque()
+        self.tail = array('i')  # Flat url_id, depth pairs
+        self.segments = deque()
+        self.segment_count = 0
+        self.pending = 0
+
+        # Remove segment files when the frontier is discarded
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    def append(self, item):
+        """Add a (url_id, depth) pair to the end of the queue"""
+        self.tail.extend(item)
+        self.pending += 1
+        if len(self.tail) >= self.buffer_size * 2:
+            self._spill()
+
+    def popleft(self):
+        """Remove and return the oldest (url_id, depth) pair"""
+        if not self.head:
+            self._refill()
+            if not self.head:
+                raise IndexError('pop from an empty frontier')
+        self.pending -= 1
+        return self.head.popleft()
+
+    def _spill(self):
+        """Write the tail buffer out as a new segment file"""
+        path = os.path.join(self.directory, f'segment-{self.segment_count:08d}.bin')
+        self.segment_count += 1
+        with open(path, 'wb') as f:
+            self.tail.tofile(f)
+        self.segments.append(path)
+        self.tail = array('i')
+
+    def _refill(self):
+        """Load the next batch of entries into the head buffer"""
+        if self.segments:
+            path = self.segments.popleft()
+            data = array('i')
+            with open(path, 'rb') as f:
+                data.frombytes(f.read())
+            os.remove(path)
+        else:
+            data, self.tail = self.tail, array('i')
+        self.head.extend(zip(data[::2], data[1::2]))
+
+    def __len__(self):
+        return self.pending
+
+    def clear(self):
+        """Remove all pending entries"""
+        for path in self.segments:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.segments.clear()
+        self.head.clear()
+        self.tail = array('i')
+        self.pending = 0
+
+    def close(self):
+        """Delete the frontier directory"""
+        self.clear()
+        self._finalizer()
@@ -0,0 +1,264 @@
+"""Politeness scheduling: hands workers the next URL whose host may be fetched now"""
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+
+# Frontier URLs looked at per call while searching for an eligible host
+FRONTIER_SCAN_LIMIT = 100
+
+# URLs parked across all waiting hosts before the frontier stops being read ahead
+MAX_PARKED_URLS = 5000
+
+
+class HostScheduler:
+    """
+    Ready queue in front of the link manager's frontier.
+
+    URLs leave the frontier in discovery order. A URL whose host is below its
+    concurrency limit and has a rate limiter slot is handed out straight
+    away; otherwise it is parked in its host's queue. Hosts waiting on the
+    rate limiter sit in a heap ordered by when they become eligible, hosts
+    at their concurrency limit wait for release(). A slow or delayed host
+    only holds back its own URLs while workers keep getting URLs for the
+    hosts that are ready.
+
+    Failed fetches come back through schedule_retry(): they wait out their
+    backoff in a delayed retry queue (not in a sleeping worker) and then
+    rejoin ahead of the frontier.
+
+    With robots set, URLs of a host whose robots.txt is not cached yet are
+    parked while it is fetched in the background, and URLs the rules
+    disallow are dropped before they are handed out.
+    """
+
+    def __init__(self, link_manager, rate_limiter, concurrency, robots=None):
+        """
+        Args:
+            link_manager: LinkManager whose frontier supplies the URLs
+            rate_limiter: HostRateLimiter deciding when a host is eligible
+            concurrency: AdaptiveConcurrency limiting requests in flight per host
+            robots: Optional RobotsChecker enforcing robots.txt
+        """
+        self.link_manager = link_manager
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.robots = robots
+        self.host_queues = {}  # host -> deque of parked (url, depth)
+        self.waiting_hosts = []  # Heap of (eligible_at, host) for parked hosts waiting on the rate limiter
+        self.saturated_hosts = set()  # Parked hosts waiting for an in-flight request to finish
+        self.robots_hosts = set()  # Parked hosts waiting for their robots.txt
+        self.robots_blocked = 0
+        self.parked_count = 0
+        self.retry_queue = []  # Heap of (ready_at, seq, url, depth) waiting out their backoff
+        self.retry_seq = itertools.count()
+        self.retry_counts = {}  # url -> retries made so far, while the URL is being retried
+        self.retry_stats = {'scheduled': 0, 'recovered': 0, 'exhausted': 0, 'reasons': {}}
+        self.lock = threading.RLock()  # Reentrant: a robots fetch that is already done calls back at once
+
+    def _try_start(self, host):
+        """Take a concurrency and a rate limiter slot for host; returns 0, None if saturated, or seconds to wait"""
+        if not self.concurrency.try_start(host):
+            return None
+        wait = self.rate_limiter.try_acquire(host)
+        if wait:
+            self.concurrency.finish(host)
+        return wait
+
+    def get_next_url(self):
+        """
+        Get the next URL whose host may be fetched now, taking its slots.
+
+        Every URL handed out must be given back with release() once its fetch is done.
+
+        Returns:
+            tuple: (url, depth), or None if no pending URL's host is eligible yet
+        """
+        with self.lock:
+            now = time.monotonic()
+
+            # Parked hosts that have become eligible go first
+            while self.waiting_hosts and self.waiting_hosts[0][0] <= now:
+                _, host = heapq.heappop(self.waiting_hosts)
+                if self.robots and not self._drop_disallowed(host):
+                    continue
+                wait = self._try_start(host)
+                if wait is None:
+                    self.saturated_hosts.add(host)
+                    continue
+                if wait:
+                    heapq.heappush(self.waiting_hosts, (now + wait, host))
+                    continue
+                return self._pop_parked(host, now)
+
+            # Retries whose backoff is over
+            while self.retry_queue and self.retry_queue[0][0] <= now:
+                _, _, url, depth = heapq.heappop(self.retry_queue)
+                url_info = self._admit((url, depth), now)
+                if url_info:
+                    return url_info
+
+            # Then read ahead in the frontier, parking URLs of hosts that must wait
+            for _ in range(FRONTIER_SCAN_LIMIT):
+                if self.parked_count >= MAX_PARKED_URLS:
+                    break
+                url_info = self.link_manager.get_next_url()
+                if not url_info:
+                    break
+
+                url_info = self._admit(url_info, now)
+                if url_info:
+                    return url_info
+
+        return None
+
+    def _admit(self, url_info, now):
+        """Return url_info if its host can be fetched now, otherwise park it"""
+        host = urlparse(url_info[0]).netloc
+        queue = self.host_queues.get(host)
+        if queue is not None:
+            # Keep per-host order behind the URLs already parked
+            queue.append(url_info)
+            self.parked_count += 1
+            return None
+
+        if self.robots:
+            allowed = self.robots.is_allowed(url_info[0])
+            if allowed is False:
+                self.robots_blocked += 1
+                return None
+            if allowed is None:
+                # Park the host until its robots.txt arrives
+                self.host_queues[host] = deque([url_info])
+                self.parked_count += 1
+                self.robots_hosts.add(host)
+                future = self.robots.prefetch(url_info[0])
+                future.add_done_callback(lambda f, host=host: self._robots_ready(host))
+                return None
+
+        wait = self._try_start(host)
+        if wait == 0:
+            return url_info
+
+        self.host_queues[host] = deque([url_info])
+        self.parked_count += 1
+        if wait is None:
+            self.saturated_hosts.add(host)
+        else:
+            heapq.heappush(self.waiting_hosts, (now + wait, host))
+        return None
+
+    def _robots_ready(self, host):
+        """Make a host parked for its robots.txt eligible once the rules are cached"""
+        with self.lock:
+            if host in self.robots_hosts:
+                self.robots_hosts.discard(host)
+                heapq.heappush(self.waiting_hosts, (time.monotonic(), host))
+
+    def _drop_disallowed(self, host):
+        """Drop parked URLs at the front of host's queue that robots.txt disallows; False if none are left"""
+        queue = self.host_queues[host]
+        while queue:
+            if self.robots.is_allowed(queue[0][0]) is not False:
+                return True
+            queue.popleft()
+            self.parked_count -= 1
+            self.robots_blocked += 1
+        del self.host_queues[host]
+        return False
+
+    def _pop_parked(self, host, now):
+        queue = self.host_queues[host]
+        url_info = queue.popleft()
+        self.parked_count -= 1
+        if queue:
+            heapq.heappush(self.waiting_hosts, (now + self.rate_limiter.get_wait_time(host), host))
+        else:
+            del self.host_queues[host]
+        return url_info
+
+    def release(self, url):
+        """Give back the slot of a URL from get_next_url() once its fetch is done"""
+        host = urlparse(url).netloc
+        self.concurrency.finish(host)
+        with self.lock:
+            if host in self.saturated_hosts:
+                self.saturated_hosts.discard(host)
+                heapq.heappush(self.waiting_hosts, (time.monotonic(), host))
+
+    def record_response(self, url, latency, status_code=None, timed_out=False, retry_after=None):
+        """
+        Feed a fetch outcome back to the host's concurrency limit.
+
+        Args:
+            url: URL that was fetched
+            latency: Fetch time in seconds
+            status_code: HTTP status, if a response arrived
+            timed_out: The request timed out
+            retry_after: Seconds the server asked us to wait (Retry-After)
+        """
+        host = urlparse(url).netloc
+        self.concurrency.record_response(host, latency, status_code, timed_out)
+        if retry_after:
+            self.rate_limiter.pause(host, retry_after)
+            print(f"Pausing {host} for {retry_after:.0f}s (Retry-After)")
+
+    def get_retry_count(self, url):
+        """Retries already made for a URL"""
+        with self.lock:
+            return self.retry_counts.get(url, 0)
+
+    def schedule_retry(self, url, depth, delay, reason):
+        """
+        Queue a failed URL to be handed out again after delay seconds.
+
+        Args:
+            url: URL whose fetch failed
+            depth: Crawl depth of the URL
+            delay: Backoff in seconds
+            reason: Status code or error type, for the retry statistics
+        """
+        with self.lock:
+            self.retry_counts[url] = self.retry_counts.get(url, 0) + 1
+            heapq.heappush(self.retry_queue, (time.monotonic() + delay, next(self.retry_seq), url, depth))
+            self.retry_stats['scheduled'] += 1
+            reasons = self.retry_stats['reasons']
+            reasons[reason] = reasons.get(reason, 0) + 1
+
+    def finish_retries(self, url, recovered):
+        """Stop tracking a URL's retries once it has a final result"""
+        with self.lock:
+            if self.retry_counts.pop(url, None) is not None:
+                self.retry_stats['recovered' if recovered else 'exhausted'] += 1
+
+    def get_wait_time(self):
+        """Seconds until the next parked host or retry is due, or None if nothing is waiting"""
+        with self.lock:
+            due = [heap[0][0] for heap in (self.waiting_hosts, self.retry_queue) if heap]
+            if not due:
+                return None
+            return max(0.0, min(due) - time.monotonic())
+
+    def get_pending_count(self):
+        """Number of URLs parked waiting for their host or waiting to be retried"""
+        with self.lock:
+            return self.parked_count + len(self.retry_queue)
+
+    def get_stats(self):
+        with self.lock:
+            stats = {
+                'parked_urls': self.parked_count,
+                'waiting_hosts': len(self.host_queues),
+                'robots_pending_hosts': len(self.robots_hosts),
+                'robots_blocked': self.robots_blocked,
+                'retries': {
+                    **self.retry_stats,
+                    'reasons': dict(self.retry_stats['reasons']),
+                    'pending': len(self.retry_queue)
+                }
+            }
+        stats['concurrency'] = self.concurrency.get_stats()
+        return stats
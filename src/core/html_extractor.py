@@ -0,0 +1,404 @@
+"""Single-pass HTML extraction with pluggable parser backends"""
+import re
+import json
+from urllib.parse import urljoin, urlparse
+from bs4 import BeautifulSoup, UnicodeDammit
+from bs4.element import Tag, NavigableString, CData, PreformattedString
+from lxml import etree
+import lxml.html
+
+from src.core.seo_extractor import SEOExtractor
+
+
+PARSER_BACKENDS = ('lxml', 'html.parser')
+
+# Result fields filled by the extractor (everything else is known before parsing)
+EXTRACTED_FIELDS = (
+    'title', 'meta_description', 'h1', 'h2', 'h3', 'word_count', 'meta_tags', 'og_tags',
+    'twitter_tags', 'canonical_url', 'lang', 'charset', 'viewport', 'robots', 'author',
+    'keywords', 'generator', 'theme_color', 'json_ld', 'analytics', 'images',
+    'external_links', 'internal_links', 'hreflang', 'schema_org'
+)
+
+# lxml parser fed with UTF-8 bytes, so encoding declarations inside the markup never conflict
+_LXML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+
+class HTMLExtractor:
+    """
+    Fills every SEO field of a result and collects the page's links in one walk of the document.
+
+    Backends:
+        lxml: C-backed libxml2 parser, walked with etree.iterwalk
+        html.parser: BeautifulSoup with the pure-Python parser (previous behaviour)
+    """
+
+    def __init__(self, backend='lxml', base_domain=''):
+        self.backend = backend if backend in PARSER_BACKENDS else 'lxml'
+        self.base_domain = base_domain
+
+    def extract(self, markup, html_text, url, result):
+        """
+        Extract page data into result.
+
+        Args:
+            markup: Raw page bytes or decoded HTML string
+            html_text: Decoded HTML used for analytics pattern matching
+            url: URL of the page (base for relative links)
+            result: Result dict to fill
+
+        Returns:
+            list: (href, anchor_text, placement) tuples for every <a href> on the page
+        """
+        walk = _PageWalk(url, self.base_domain, result)
+
+        if self.backend == 'lxml':
+            self._walk_lxml(markup, walk)
+        else:
+            self._walk_soup(markup, walk)
+
+        walk.finish()
+        SEOExtractor.extract_analytics_tracking(None, html_text, result)
+        return walk.anchors
+
+    @staticmethod
+    def _walk_lxml(markup, walk):
+        """Feed lxml parse events to the page walk"""
+        if isinstance(markup, bytes):
+            # Same encoding detection BeautifulSoup applies to raw bytes
+            markup = UnicodeDammit(markup, is_html=True).unicode_markup or ''
+
+        try:
+            root = lxml.html.document_fromstring(markup.encode('utf-8'), parser=_LXML_PARSER)
+        except (etree.ParserError, ValueError):
+            return  # Empty document
+
+        for event, element in etree.iterwalk(root, events=('start', 'end', 'comment', 'pi')):
+            if event == 'start':
+                walk.start(element.tag, element.attrib)
+                if element.text:
+                    walk.text(element.text)
+            else:
+                if event == 'end':
+                    walk.end()
+                if element.tail:
+                    walk.text(element.tail)
+
+    @staticmethod
+    def _walk_soup(markup, walk):
+        """Feed a BeautifulSoup tree to the page walk without recursion"""
+        soup = BeautifulSoup(markup, 'html.parser')
+        stack = [iter(soup.contents)]
+
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                if stack:
+                    walk.end()
+                continue
+
+            if isinstance(node, Tag):
+                attrs = {
+                    key: ' '.join(value) if isinstance(value, list) else value
+                    for key, value in node.attrs.items()
+                }
+                walk.start(node.name, attrs)
+                stack.append(iter(node.contents))
+            elif isinstance(node, NavigableString):
+                # Comments, doctypes and processing instructions are not page text
+                if isinstance(node, PreformattedString) and not isinstance(node, CData):
+                    continue
+                walk.text(str(node))
+
+
+class _PageWalk:
+    """Parse-event consumer that builds the result fields and link list in document order"""
+
+    # Text inside these elements is not page text (matches BeautifulSoup get_text)
+    HIDDEN_TEXT_TAGS = ('script', 'style', 'template')
+
+    def __init__(self, url, base_domain, result):
+        self.url = url
+        self.base_domain_clean = base_domain.replace('www.', '', 1)
+        self.result = result
+        self.anchors = []
+
+        # One frame per open element: [tag, placement for children, text capture, finishers, microdata scope]
+        self.frames = []
+        self.captures = []
+        self.hidden_depth = 0
+        self.text_parts = []
+        self.scopes = []
+
+        self.seen_title = False
+        self.seen_h1 = False
+        self.seen_html = False
+        self.seen_description = False
+        self.seen_canonical = False
+        self.img_count = 0
+        self.charset_meta = None
+        self.content_type_meta = None
+
+    def start(self, tag, attrs):
+        """Handle an opening element"""
+        parent_placement = self.frames[-1][1] if self.frames else 'body'
+        placement = self._placement_of(tag, attrs) or parent_placement
+        finishers = []
+        needs_text = False
+        raw_text = False
+        scope = None
+
+        if tag in self.HIDDEN_TEXT_TAGS:
+            self.hidden_depth += 1
+
+        if tag == 'a' and 'href' in attrs:
+            href = attrs.get('href', '')
+            self._count_link(href)
+            # Reserve the slot now so nested anchors keep document order
+            finishers.append(('anchor', len(self.anchors)))
+            self.anchors.append((href.strip(), '', parent_placement))
+            needs_text = True
+        elif tag == 'meta':
+            self._handle_meta(attrs)
+        elif tag == 'link':
+            self._handle_link(attrs)
+        elif tag == 'img':
+            self._handle_image(attrs)
+        elif tag == 'title' and not self.seen_title:
+            self.seen_title = True
+            finishers.append(('title', None))
+            needs_text = True
+        elif tag == 'h1' and not self.seen_h1:
+            self.seen_h1 = True
+            finishers.append(('h1', None))
+            needs_text = True
+        elif tag in ('h2', 'h3') and len(self.result[tag]) < 10:
+            finishers.append((tag, len(self.result[tag])))
+            self.result[tag].append('')
+            needs_text = True
+        elif tag == 'html' and not self.seen_html:
+            self.seen_html = True
+            self.result['lang'] = attrs.get('lang', '')
+        elif tag == 'script' and attrs.get('type') == 'application/ld+json':
+            # JSON-LD needs the raw script body, which is hidden from regular text
+            finishers.append(('json_ld', None))
+            needs_text = True
+            raw_text = True
+
+        # Microdata properties belong to every enclosing itemtype scope (but not their own)
+        if 'itemprop' in attrs and self.scopes:
+            slot = [attrs.get('itemprop', ''), '']
+            for _, props in self.scopes:
+                props.append(slot)
+            if tag == 'meta':
+                slot[1] = attrs.get('content', '')
+            elif tag == 'img':
+                slot[1] = attrs.get('src', '')
+            elif tag == 'a':
+                slot[1] = attrs.get('href', '')
+            else:
+                finishers.append(('itemprop', slot))
+                needs_text = True
+
+        if attrs.get('itemtype'):
+            entry = {'type': attrs.get('itemtype'), 'properties': {}}
+            self.result['schema_org'].append(entry)
+            scope = (entry, [])
+            self.scopes.append(scope)
+
+        capture = None
+        if needs_text:
+            capture = (raw_text, [])
+            self.captures.append(capture)
+
+        self.frames.append((tag, placement, capture, finishers, scope))
+
+    def text(self, text):
+        """Handle a text node"""
+        visible = self.hidden_depth == 0
+        if visible:
+            self.text_parts.append(text)
+        for raw, parts in self.captures:
+            if visible or raw:
+                parts.append(text)
+
+    def end(self):
+        """Handle a closing element"""
+        tag, placement, capture, finishers, scope = self.frames.pop()
+
+        if tag in self.HIDDEN_TEXT_TAGS:
+            self.hidden_depth -= 1
+
+        if capture:
+            self.captures.pop()
+            text = ''.join(capture[1])
+            for kind, payload in finishers:
+                self._finish(kind, payload, text)
+
+        if scope:
+            self.scopes.pop()
+            entry, props = scope
+            for name, value in props:
+                if name and value:
+                    entry['properties'][name] = value
+
+    def finish(self):
+        """Resolve values that depend on the whole document"""
+        # Close elements left open by a truncated document
+        while self.frames:
+            self.end()
+
+        words = re.findall(r'\b\w+\b', ''.join(self.text_parts))
+        self.result['word_count'] = len(words)
+
+        if self.charset_meta is not None:
+            self.result['charset'] = self.charset_meta
+        elif self.content_type_meta is not None:
+            charset_match = re.search(r'charset=([^;]+)', self.content_type_meta)
+            self.result['charset'] = charset_match.group(1) if charset_match else ''
+
+    def _finish(self, kind, payload, text):
+        """Store the captured text of a closed element"""
+        if kind == 'anchor':
+            href, _, placement = self.anchors[payload]
+            self.anchors[payload] = (href, text.strip()[:100], placement)
+        elif kind in ('title', 'h1'):
+            self.result[kind] = text.strip()
+        elif kind in ('h2', 'h3'):
+            self.result[kind][payload] = text.strip()
+        elif kind == 'itemprop':
+            payload[1] = text.strip()
+        elif kind == 'json_ld':
+            try:
+                self.result['json_ld'].append(json.loads(text))
+            except (json.JSONDecodeError, TypeError):
+                pass
+
+    @staticmethod
+    def _placement_of(tag, attrs):
+        """Placement an element imposes on the links inside it, if any"""
+        classes_str = attrs.get('class', '').lower()
+        element_id = attrs.get('id', '').lower()
+
+        if tag == 'footer' or 'footer' in classes_str or 'footer' in element_id:
+            return 'footer'
+
+        if tag in ('nav', 'header') or any(keyword in classes_str or keyword in element_id
+                                           for keyword in ('nav', 'menu', 'header')):
+            return 'navigation'
+
+        return None
+
+    def _count_link(self, href):
+        """Count an <a href> as an internal or external link"""
+        if href and not href.startswith(('#', 'mailto:', 'tel:', 'javascript:')):
+            parsed_url = urlparse(urljoin(self.url, href))
+
+            # Handle www vs non-www domains
+            if parsed_url.netloc.replace('www.', '', 1) == self.base_domain_clean:
+                self.result['internal_links'] += 1
+            else:
+                self.result['external_links'] += 1
+
+    def _handle_meta(self, attrs):
+        """Extract description, charset, named, OpenGraph and Twitter meta tags"""
+        name_attr = attrs.get('name', '')
+        content = attrs.get('content', '')
+
+        if name_attr == 'description' and not self.seen_description:
+            self.seen_description = True
+            self.result['meta_description'] = content.strip()
+
+        if 'charset' in attrs and self.charset_meta is None:
+            self.charset_meta = attrs.get('charset', '')
+        if attrs.get('http-equiv') == 'Content-Type' and self.content_type_meta is None:
+            self.content_type_meta = content
+
+        name = name_attr.lower()
+        if name:
+            self.result['meta_tags'][name] = content
+
+            # Extract specific important meta tags
+            if name == 'viewport':
+                self.result['viewport'] = content
+            elif name == 'robots':
+                self.result['robots'] = content
+            elif name == 'author':
+                self.result['author'] = content
+            elif name == 'keywords':
+                self.result['keywords'] = content
+            elif name == 'generator':
+                self.result['generator'] = content
+            elif name == 'theme-color':
+                self.result['theme_color'] = content
+
+        property_name = attrs.get('property', '')
+        if property_name.startswith('og:'):
+            self.result['og_tags'][property_name.replace('og:', '')] = content
+
+        if name_attr.startswith('twitter:'):
+            self.result['twitter_tags'][name_attr.replace('twitter:', '')] = content
+
+    def _handle_link(self, attrs):
+        """Extract canonical and hreflang <link> elements"""
+        rel = attrs.get('rel', '').split()
+
+        if 'canonical' in rel and not self.seen_canonical:
+            self.seen_canonical = True
+            self.result['canonical_url'] = attrs.get('href', '')
+
+        if 'alternate' in rel and 'hreflang' in attrs:
+            hreflang = attrs.get('hreflang', '')
+            href = attrs.get('href', '')
+            if hreflang and href:
+                self.result['hreflang'].append({
+                    'lang': hreflang,
+                    'url': href
+                })
+
+    def _handle_image(self, attrs):
+        """Extract the first 20 images"""
+        self.img_count += 1
+        if self.img_count > 20:
+            return
+
+        src = attrs.get('src', '')
+        if src:
+            self.result['images'].append({
+                'src': SEOExtractor.resolve_image_src(src, self.url),
+                'alt': attrs.get('alt', ''),
+                'width': attrs.get('width', ''),
+                'height': attrs.get('height', '')
+            })
+
+
+def extract_page_data(backend, base_domain, url, markup, encoding=None):
+    """
+    Parse a page and return only the extracted data.
+
+    Module-level so it can run in a ProcessPoolExecutor: the arguments and the
+    returned (fields, anchors) tuple are small, picklable values.
+
+    Args:
+        backend: Parser backend name
+        base_domain: Crawl base domain for internal/external link counts
+        url: URL of the page
+        markup: Raw page bytes or decoded HTML string
+        encoding: Encoding used to decode bytes for analytics matching
+
+    Returns:
+        tuple: (dict of EXTRACTED_FIELDS values, list of (href, anchor_text, placement))
+    """
+    if isinstance(markup, str):
+        html_text = markup
+    else:
+        try:
+            html_text = str(markup, encoding or 'utf-8', errors='replace')
+        except LookupError:
+            # Declared charset Python does not know
+            html_text = str(markup, 'utf-8', errors='replace')
+
+    result = SEOExtractor.create_empty_result(url, 0)
+    anchors = HTMLExtractor(backend, base_domain).extract(markup, html_text, url, result)
+    return {field: result[field] for field in EXTRACTED_FIELDS}, anchors
@@ -1,7 +1,6 @@
 """SEO issue detection and reporting"""
 import threading
-from fnmatch import fnmatch
-from urllib.parse import urlparse
+from src.core.exclusion_matcher import get_exclusion_matcher
 
 
 class IssueDetector:
@@ -9,17 +8,18 @@ class IssueDetector:
 
     def __init__(self, exclusion_patterns=None):
         self.exclusion_patterns = exclusion_patterns or []
+        self.exclusion_matcher = get_exclusion_matcher(self.exclusion_patterns)
         self.detected_issues = []
         self.issues_lock = threading.Lock()
 
     def detect_issues(self, result):
-        """Detect SEO issues for a crawled URL"""
+        """Detect SEO issues for a crawled URL and return the ones added"""
         url = result.get('url', '')
         issues = []
 
         # Skip if URL matches exclusion patterns
         if self._should_exclude(url):
-            return
+            return issues
 
         # Critical SEO Issues
         self._check_title_issues(result, issues)
@@ -38,6 +38,8 @@ class IssueDetector:
         with self.issues_lock:
             self.detected_issues.extend(issues)
 
+        return issues
+
     def _check_title_issues(self, result, issues):
         """Check for title-related issues"""
         url = result.get('url', '')
@@ -312,17 +314,7 @@ class IssueDetector:
 
     def _should_exclude(self, url):
         """Check if URL should be excluded from issue detection"""
-        parsed = urlparse(url)
-        path = parsed.path
-
-        for pattern in self.exclusion_patterns:
-            if '*' in pattern:
-                if fnmatch(path, pattern):
-                    return True
-            elif path == pattern or path.startswith(pattern.rstrip('*')):
-                return True
-
-        return False
+        return self.exclusion_matcher.is_excluded(url)
 
     def _get_status_code_message(self, status_code):
         """Get descriptive message for HTTP status codes"""
@@ -345,10 +337,10 @@ class IssueDetector:
         }
         return messages.get(status_code, f'HTTP {status_code} Error')
 
-    def get_issues(self):
-        """Get all detected issues"""
+    def get_issues(self, start=0, limit=None):
+        """Get all detected issues (from index start, at most limit)"""
         with self.issues_lock:
-            return self.detected_issues.copy()
+            return self.detected_issues[start:start + limit if limit else None]
 
     def reset(self):
         """Reset detected issues"""
@@ -5,6 +5,10 @@ from playwright.async_api import async_playwright, TimeoutError as PlaywrightTim
 from urllib.parse import urlparse
 
 
+# Error message render_page returns when navigation times out
+RENDER_TIMEOUT_ERROR = "JavaScript rendering timeout"
+
+
 class JavaScriptRenderer:
     """Handles JavaScript rendering for dynamic content using Playwright"""
 
@@ -121,7 +125,7 @@ class JavaScriptRenderer:
                 return html_content, status_code, None
 
             except PlaywrightTimeoutError:
-                return None, 0, "JavaScript rendering timeout"
+                return None, 0, RENDER_TIMEOUT_ERROR
             except Exception as e:
                 return None, 0, f"Navigation error: {str(e)}"
 
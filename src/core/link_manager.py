@@ -1,159 +1,340 @@
 """Link management and extraction"""
+import random
+import sys
 import threading
+from array import array
 from urllib.parse import urljoin, urlparse
-from collections import deque
+from src.core.frontier import create_frontier
+
+
+# JSON bytes per link besides its URLs, anchor text and domain (keys, punctuation, flags)
+LINK_JSON_OVERHEAD = 140
+
+
+class InternTable:
+    """Assigns each distinct string a compact integer ID and stores it only once"""
+
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+        self.value_bytes = 0  # Running size of the stored strings and their ID ints
+        self.lock = threading.Lock()
+
+    def intern(self, value):
+        """Get the ID for a string, assigning a new one if it hasn't been seen"""
+        value_id = self.ids.get(value)
+        if value_id is None:
+            with self.lock:
+                value_id = self.ids.get(value)
+                if value_id is None:
+                    value_id = len(self.values)
+                    self.values.append(value)
+                    self.ids[value] = value_id
+                    self.value_bytes += sys.getsizeof(value) + sys.getsizeof(value_id)
+        return value_id
+
+    def get_size(self):
+        """Estimated size in bytes without walking the table"""
+        return sys.getsizeof(self.ids) + sys.getsizeof(self.values) + self.value_bytes
+
+    def get_id(self, value):
+        """Get the ID for a string, or None if it was never interned"""
+        return self.ids.get(value)
+
+    def __getitem__(self, value_id):
+        return self.values[value_id]
+
+    def __len__(self):
+        return len(self.values)
+
+    def clear(self):
+        with self.lock:
+            self.ids.clear()
+            self.values.clear()
+            self.value_bytes = 0
+
+
+class IdBitSet:
+    """
+    Set of interned integer IDs stored as one bit per ID.
+
+    The bits are only the membership part of a lookup: a URL has to be
+    interned first, so its InternTable entry (string plus dict slot) is the
+    real per-URL cost.
+    """
+
+    def __init__(self):
+        self.bits = bytearray()
+        self.count = 0
+
+    def add(self, value_id):
+        byte_index = value_id >> 3
+        if byte_index >= len(self.bits):
+            # Grow geometrically so appends stay amortized O(1)
+            self.bits.extend(bytes(max(byte_index + 1 - len(self.bits), len(self.bits))))
+        mask = 1 << (value_id & 7)
+        if not self.bits[byte_index] & mask:
+            self.bits[byte_index] |= mask
+            self.count += 1
+
+    def __contains__(self, value_id):
+        byte_index = value_id >> 3
+        return byte_index < len(self.bits) and bool(self.bits[byte_index] & (1 << (value_id & 7)))
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.bits = bytearray()
+        self.count = 0
+
+
+class LinkView:
+    """
+    Read-only view of the first count collected links, read from the link arrays.
+
+    Queries filter and sort through get_value() and only turn the rows they
+    return into dicts. Link positions never move, so a view stays valid while
+    the crawl appends more links; target_status is read live.
+    """
+
+    def __init__(self, link_manager, count):
+        self.link_manager = link_manager
+        self.count = count
+        self.base_domain_clean = link_manager.base_domain.replace('www.', '', 1)
+        self.target_info = {}  # target_id -> (target_domain, is_internal)
+
+    def __len__(self):
+        return self.count
+
+    def _get_target_info(self, target_id):
+        info = self.target_info.get(target_id)
+        if info is None:
+            target_domain = urlparse(self.link_manager.url_table[target_id]).netloc
+            info = (target_domain, target_domain.replace('www.', '', 1) == self.base_domain_clean)
+            self.target_info[target_id] = info
+        return info
+
+    def get_value(self, position, field):
+        """Get one field of the link at position without building its dict"""
+        manager = self.link_manager
+        if field == 'source_url':
+            return manager.url_table[manager.link_sources[position]]
+        if field == 'target_url':
+            return manager.url_table[manager.link_targets[position]]
+        if field == 'anchor_text':
+            return manager.text_table[manager.link_texts[position]]
+        if field == 'placement':
+            return manager.text_table[manager.link_placements[position]]
+        if field == 'target_status':
+            return manager.url_status.get(manager.link_targets[position])
+        if field == 'target_domain':
+            return self._get_target_info(manager.link_targets[position])[0]
+        if field == 'is_internal':
+            return self._get_target_info(manager.link_targets[position])[1]
+        return None
+
+    def __getitem__(self, position):
+        manager = self.link_manager
+        target_id = manager.link_targets[position]
+        target_domain, is_internal = self._get_target_info(target_id)
+        return {
+            'source_url': manager.url_table[manager.link_sources[position]],
+            'target_url': manager.url_table[target_id],
+            'anchor_text': manager.text_table[manager.link_texts[position]],
+            'is_internal': is_internal,
+            'target_domain': target_domain,
+            'target_status': manager.url_status.get(target_id),
+            'placement': manager.text_table[manager.link_placements[position]]
+        }
 
 
 class LinkManager:
-    """Manages link discovery, tracking, and extraction"""
+    """Manages link discovery, tracking, and extraction
+
+    URLs are interned to integer IDs; the frontier, dedup sets, link graph and
+    source pages hold only those IDs and are turned back into strings by
+    get_links / get_link_view / get_source_pages / get_next_url.
+    """
 
-    def __init__(self, base_domain):
+    def __init__(self, base_domain, linked_from_limit=0, frontier_mode='memory'):
         self.base_domain = base_domain
-        self.visited_urls = set()
-        self.discovered_urls = deque()
-        self.all_discovered_urls = set()
-        self.all_links = []
-        self.links_set = set()
-        self.source_pages = {}  # Maps target_url -> list of source_urls
+        self.linked_from_limit = linked_from_limit  # Max stored source pages per URL (0 = all)
+        self.sampler = random.Random()
+        self.url_table = InternTable()
+        self.text_table = InternTable()  # Anchor texts and placements
+        # Seen-URL dedup: IDs are dense, so a bitset adds one bit per known URL on top of
+        # its url_table entry (kept anyway for the link graph)
+        self.visited_urls = IdBitSet()
+        self.discovered_urls = create_frontier(frontier_mode)  # Pending (url_id, depth)
+        self.all_discovered_urls = IdBitSet()
+
+        # Link graph as parallel arrays, one entry per unique source -> target link
+        self.link_sources = array('i')
+        self.link_targets = array('i')
+        self.link_texts = array('i')
+        self.link_placements = array('i')
+        self.links_set = set()  # (source_id << 32) | target_id
+        self.source_pages = {}  # Maps target_id -> array of source_ids (sampled past the limit)
+        self.in_degree = {}  # Maps target_id -> exact number of unique source pages
+        self.source_page_bytes = 0  # Running size of the source_pages arrays
+        self.links_json_bytes = 0  # Running estimate of the links' JSON size
+        self.url_status = {}  # Maps crawled url_id -> status_code
+        self.status_version = 0  # Bumped whenever a status is recorded (links' target_status changes)
 
         self.urls_lock = threading.Lock()
         self.links_lock = threading.Lock()
 
-    def extract_links(self, soup, current_url, depth, should_crawl_callback):
-        """Extract links from HTML and add to discovery queue"""
-        links = soup.find_all('a', href=True)
-
-        for link in links:
-            href = link['href'].strip()
+    @staticmethod
+    def _clean_url(absolute_url):
+        """Split an absolute URL into its fragment-free form and its parsed parts"""
+        parsed = urlparse(absolute_url)
+        clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        if parsed.query:
+            clean_url += f"?{parsed.query}"
+        return clean_url, parsed
+
+    def extract_links(self, anchors, current_url, depth, should_crawl_callback):
+        """
+        Add links from a page's (href, anchor_text, placement) anchors to the discovery queue.
+
+        should_crawl_callback runs without urls_lock held, so fetch threads do not
+        serialize on URL filtering; only the final dedup and insert take the lock.
+        """
+        current_id = self.url_table.intern(current_url)
+
+        candidates = []
+        for href, _, _ in anchors:
             if not href or href.startswith('#') or href.startswith('mailto:') or href.startswith('tel:'):
                 continue
 
-            # Convert relative URLs to absolute
-            absolute_url = urljoin(current_url, href)
-
-            # Clean URL (remove fragment)
-            parsed = urlparse(absolute_url)
-            clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            if parsed.query:
-                clean_url += f"?{parsed.query}"
-
-            # Thread-safe checking and adding
-            with self.urls_lock:
-                # Track source page for this URL
-                if clean_url not in self.source_pages:
-                    self.source_pages[clean_url] = []
-                if current_url not in self.source_pages[clean_url]:
-                    self.source_pages[clean_url].append(current_url)
-
-                if (clean_url not in self.visited_urls and
-                    clean_url not in self.all_discovered_urls and
-                    clean_url != current_url):
-
-                    # Check if this URL should be crawled
-                    if should_crawl_callback(clean_url):
-                        self.all_discovered_urls.add(clean_url)
-                        self.discovered_urls.append((clean_url, depth))
-
-    def collect_all_links(self, soup, source_url, crawl_results):
-        """Collect all links for the Links tab display"""
-        links = soup.find_all('a', href=True)
+            # Convert relative URLs to absolute and remove the fragment
+            clean_url, _ = self._clean_url(urljoin(current_url, href))
+            url_id = self.url_table.intern(clean_url)
 
-        for link in links:
-            href = link['href'].strip()
+            # Unlocked pre-check so known URLs skip the filter; rechecked under the lock below
+            if (url_id != current_id and
+                url_id not in self.visited_urls and
+                url_id not in self.all_discovered_urls and
+                should_crawl_callback(clean_url)):
+                candidates.append(url_id)
+
+        if not candidates:
+            return
+
+        # Thread-safe checking and adding
+        with self.urls_lock:
+            for url_id in candidates:
+                if url_id not in self.visited_urls and url_id not in self.all_discovered_urls:
+                    self.all_discovered_urls.add(url_id)
+                    self.discovered_urls.append((url_id, depth))
+
+    def collect_all_links(self, anchors, source_url):
+        """Collect all links from a page's (href, anchor_text, placement) anchors for the Links tab display"""
+        source_id = self.url_table.intern(source_url)
+
+        for href, anchor_text, placement in anchors:
             if not href or href.startswith('#'):
                 continue
 
-            # Get anchor text
-            anchor_text = link.get_text().strip()[:100]
-
             # Handle special link types
             if href.startswith('mailto:') or href.startswith('tel:'):
                 continue
 
             # Convert relative URLs to absolute
             try:
-                absolute_url = urljoin(source_url, href)
-                parsed_target = urlparse(absolute_url)
-
-                # Clean URL (remove fragment)
-                clean_url = f"{parsed_target.scheme}://{parsed_target.netloc}{parsed_target.path}"
-                if parsed_target.query:
-                    clean_url += f"?{parsed_target.query}"
-
-                # Determine if link is internal or external
-                target_domain_clean = parsed_target.netloc.replace('www.', '', 1)
-                base_domain_clean = self.base_domain.replace('www.', '', 1)
-                is_internal = target_domain_clean == base_domain_clean
-
-                # Find the status of the target URL if we've crawled it
-                target_status = None
-                for result in crawl_results:
-                    if result['url'] == clean_url:
-                        target_status = result['status_code']
-                        break
-
-                # Determine placement (navigation, footer, body)
-                placement = self._detect_link_placement(link)
-
-                link_data = {
-                    'source_url': source_url,
-                    'target_url': clean_url,
-                    'anchor_text': anchor_text or '(no text)',
-                    'is_internal': is_internal,
-                    'target_domain': parsed_target.netloc,
-                    'target_status': target_status,
-                    'placement': placement
-                }
-
-                # Track source page for this URL (for "Linked From" feature)
-                with self.urls_lock:
-                    if clean_url not in self.source_pages:
-                        self.source_pages[clean_url] = []
-                    if source_url not in self.source_pages[clean_url]:
-                        self.source_pages[clean_url].append(source_url)
+                clean_url, parsed_target = self._clean_url(urljoin(source_url, href))
+                target_id = self.url_table.intern(clean_url)
+                link_key = (source_id << 32) | target_id
 
                 # Thread-safe adding to links collection with duplicate checking
                 with self.links_lock:
-                    link_key = f"{link_data['source_url']}|{link_data['target_url']}"
-
                     if link_key not in self.links_set:
                         self.links_set.add(link_key)
-                        self.all_links.append(link_data)
+                        self.link_sources.append(source_id)
+                        self.link_targets.append(target_id)
+                        self.link_texts.append(self.text_table.intern(anchor_text or '(no text)'))
+                        self.link_placements.append(self.text_table.intern(placement))
+                        self.links_json_bytes += (len(source_url) + len(clean_url) + len(anchor_text or '') +
+                                                  len(parsed_target.netloc) + LINK_JSON_OVERHEAD)
+
+                        # Track source page for this URL (for "Linked From" feature)
+                        self._add_source_page(target_id, source_id)
 
             except Exception:
                 continue
 
-    def _detect_link_placement(self, link_element):
-        """Detect where on the page a link is placed"""
-        # Check parent elements up the tree
-        current = link_element.parent
-
-        while current and current.name:
-            # Check for footer
-            if current.name == 'footer':
-                return 'footer'
-
-            # Check for footer by class/id
-            classes = current.get('class', [])
-            element_id = current.get('id', '')
-            classes_str = ' '.join(classes).lower() if classes else ''
-
-            if 'footer' in classes_str or 'footer' in element_id.lower():
-                return 'footer'
-
-            # Check for navigation
-            if current.name in ['nav', 'header']:
-                return 'navigation'
-
-            # Check for navigation by class/id
-            if any(keyword in classes_str or keyword in element_id.lower()
-                   for keyword in ['nav', 'menu', 'header']):
-                return 'navigation'
-
-            current = current.parent
-
-        # Default to body if not in nav or footer
-        return 'body'
+    def _add_source_page(self, target_id, source_id):
+        """
+        Record a new (unique) source page for a target; caller holds links_lock.
+
+        Keeps every source up to linked_from_limit, then a uniform reservoir
+        sample of that size, while in_degree stays exact.
+        """
+        count = self.in_degree.get(target_id, 0) + 1
+        self.in_degree[target_id] = count
+
+        sources = self.source_pages.get(target_id)
+        if sources is None:
+            sources = self.source_pages[target_id] = array('i')
+            self.source_page_bytes += sys.getsizeof(sources)
+
+        limit = self.linked_from_limit
+        if not limit or count <= limit:
+            sources.append(source_id)
+            self.source_page_bytes += sources.itemsize
+        else:
+            slot = self.sampler.randrange(count)
+            if slot < limit:
+                sources[slot] = source_id
+
+    def get_link_view(self):
+        """Get a LinkView over the links collected so far"""
+        with self.links_lock:
+            return LinkView(self, len(self.link_sources))
+
+    def get_links(self, start=0, limit=None):
+        """Materialize collected links (from index start, at most limit) as dicts for the API and exports"""
+        view = self.get_link_view()
+        end = len(view)
+        if limit:
+            end = min(end, start + limit)
+        return [view[position] for position in range(start, end)]
+
+    def get_link_count(self):
+        """Get the number of unique links collected"""
+        with self.links_lock:
+            return len(self.link_sources)
+
+    def get_data_size(self):
+        """
+        Estimate link storage size from running totals, without a deep walk.
+
+        Returns:
+            tuple: (estimated bytes in memory, estimated JSON bytes, link count)
+        """
+        with self.links_lock:
+            link_arrays = (self.link_sources, self.link_targets, self.link_texts, self.link_placements)
+            size = sum(sys.getsizeof(link_array) for link_array in link_arrays)
+            # Edge keys are ints above 2**30, 32 bytes each
+            size += sys.getsizeof(self.links_set) + len(self.links_set) * 32
+            size += sys.getsizeof(self.source_pages) + self.source_page_bytes + sys.getsizeof(self.in_degree)
+            links_json_bytes = self.links_json_bytes
+            count = len(self.link_sources)
+
+        with self.urls_lock:
+            size += sys.getsizeof(self.url_status) + sys.getsizeof(self.visited_urls.bits)
+            size += sys.getsizeof(self.all_discovered_urls.bits) + sys.getsizeof(self.discovered_urls)
+
+        size += self.url_table.get_size() + self.text_table.get_size()
+        return size, links_json_bytes, count
+
+    def get_storage(self):
+        """Get the containers that hold link and URL data (for memory profiling)"""
+        return (self.url_table.values, self.url_table.ids, self.text_table.values, self.text_table.ids,
+                self.link_sources, self.link_targets, self.link_texts, self.link_placements,
+                self.links_set, self.source_pages, self.in_degree, self.url_status,
+                self.visited_urls, self.all_discovered_urls, self.discovered_urls)
 
     def is_internal(self, url):
         """Check if URL is internal to the base domain"""
@@ -164,21 +345,24 @@ class LinkManager:
 
     def add_url(self, url, depth):
         """Add a URL to the discovery queue"""
+        url_id = self.url_table.intern(url)
         with self.urls_lock:
-            if url not in self.all_discovered_urls and url not in self.visited_urls:
-                self.all_discovered_urls.add(url)
-                self.discovered_urls.append((url, depth))
+            if url_id not in self.all_discovered_urls and url_id not in self.visited_urls:
+                self.all_discovered_urls.add(url_id)
+                self.discovered_urls.append((url_id, depth))
 
     def mark_visited(self, url):
         """Mark a URL as visited"""
+        url_id = self.url_table.intern(url)
         with self.urls_lock:
-            self.visited_urls.add(url)
+            self.visited_urls.add(url_id)
 
     def get_next_url(self):
         """Get the next URL to crawl"""
         with self.urls_lock:
             if self.discovered_urls:
-                return self.discovered_urls.popleft()
+                url_id, depth = self.discovered_urls.popleft()
+                return self.url_table[url_id], depth
         return None
 
     def get_stats(self):
@@ -190,30 +374,57 @@ class LinkManager:
                 'pending': len(self.discovered_urls)
             }
 
-    def update_link_statuses(self, crawl_results):
-        """Update target_status for all links based on crawl results"""
-        # Build a fast lookup dict
-        status_lookup = {result['url']: result['status_code'] for result in crawl_results}
+    def record_status(self, url, status_code):
+        """Record the status code of a crawled URL in the status index"""
+        url_id = self.url_table.intern(url)
+        with self.urls_lock:
+            self.url_status[url_id] = status_code
+            self.status_version += 1
 
-        with self.links_lock:
-            for link in self.all_links:
-                target_url = link['target_url']
-                if target_url in status_lookup:
-                    link['target_status'] = status_lookup[target_url]
+    @staticmethod
+    def build_status_index(crawl_results):
+        """Build a url -> status_code index from a list of crawl results"""
+        return {result['url']: result.get('status_code') for result in crawl_results}
+
+    @staticmethod
+    def apply_link_statuses(links, status_index):
+        """Set target_status on links whose target URL is in the status index"""
+        for link in links:
+            target_url = link.get('target_url')
+            if target_url in status_index:
+                link['target_status'] = status_index[target_url]
 
     def get_source_pages(self, url):
         """Get list of source pages that link to this URL"""
-        with self.urls_lock:
-            return self.source_pages.get(url, []).copy()
-
+        url_id = self.url_table.get_id(url)
+        with self.links_lock:
+            source_ids = self.source_pages.get(url_id, ())
+            return [self.url_table[source_id] for source_id in source_ids]
+
+    def get_in_degree(self, url):
+        """Get the exact number of unique pages linking to this URL"""
+        url_id = self.url_table.get_id(url)
+        with self.links_lock:
+            return self.in_degree.get(url_id, 0)
+
     def reset(self):
         """Reset all state"""
         with self.urls_lock:
             self.visited_urls.clear()
             self.discovered_urls.clear()
             self.all_discovered_urls.clear()
-            self.source_pages.clear()
+            self.url_status.clear()
 
         with self.links_lock:
-            self.all_links.clear()
+            del self.link_sources[:]
+            del self.link_targets[:]
+            del self.link_texts[:]
+            del self.link_placements[:]
             self.links_set.clear()
+            self.source_pages.clear()
+            self.in_degree.clear()
+            self.source_page_bytes = 0
+            self.links_json_bytes = 0
+
+        self.url_table.clear()
+        self.text_table.clear()
@@ -2,15 +2,17 @@
 import sys
 import gc
 import json
-from collections import defaultdict
+import threading
+from collections import defaultdict, deque
+from src.core.crawl_result import get_shared_values
 
 
 class MemoryProfiler:
     """Profile memory usage by object type"""
 
     @staticmethod
-    def get_deep_size(obj, seen=None):
-        """Recursively calculate deep size of an object"""
+    def get_deep_size(obj, seen=None, count_keys=True):
+        """Recursively calculate deep size of an object (optionally leaving out dict keys)"""
         if seen is None:
             seen = set()
 
@@ -22,10 +24,14 @@ class MemoryProfiler:
         size = sys.getsizeof(obj)
 
         if isinstance(obj, dict):
-            size += sum(MemoryProfiler.get_deep_size(k, seen) + MemoryProfiler.get_deep_size(v, seen)
-                       for k, v in obj.items())
-        elif isinstance(obj, (list, tuple, set, frozenset)):
-            size += sum(MemoryProfiler.get_deep_size(item, seen) for item in obj)
+            size += sum((MemoryProfiler.get_deep_size(k, seen, count_keys) if count_keys else 0) +
+                        MemoryProfiler.get_deep_size(v, seen, count_keys)
+                        for k, v in obj.items())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            size += sum(MemoryProfiler.get_deep_size(item, seen, count_keys) for item in obj)
+        elif isinstance(getattr(type(obj), '__slots__', None), tuple):
+            size += sum(MemoryProfiler.get_deep_size(getattr(obj, name), seen, count_keys)
+                        for name in type(obj).__slots__ if hasattr(obj, name))
 
         return size
 
@@ -63,17 +69,19 @@ class MemoryProfiler:
         return breakdown
 
     @staticmethod
-    def get_crawler_data_size(crawl_results, links, issues):
+    def get_crawler_data_size(crawl_results, link_manager, issues):
         """Estimate actual data size with DEEP measurement"""
+        # Links are held in the link manager's compact storage and only materialized for JSON
+        links = link_manager.get_links() if link_manager else []
 
         # Deep size calculation
         crawl_results_deep = MemoryProfiler.get_deep_size(crawl_results)
-        links_deep = MemoryProfiler.get_deep_size(links)
+        links_deep = MemoryProfiler.get_deep_size(link_manager.get_storage()) if link_manager else 0
         issues_deep = MemoryProfiler.get_deep_size(issues)
 
         # Also get JSON size for comparison
         try:
-            crawl_json_size = len(json.dumps(crawl_results, default=str))
+            crawl_json_size = len(json.dumps([dict(result) for result in crawl_results], default=str))
             links_json_size = len(json.dumps(links, default=str))
             issues_json_size = len(json.dumps(issues, default=str))
         except:
@@ -81,20 +89,80 @@ class MemoryProfiler:
             links_json_size = 0
             issues_json_size = 0
 
+        return MemoryProfiler.format_data_sizes(
+            (crawl_results_deep, crawl_json_size, len(crawl_results)),
+            (links_deep, links_json_size, len(links)),
+            (issues_deep, issues_json_size, len(issues))
+        )
+
+    @staticmethod
+    def format_data_sizes(results, links, issues):
+        """Build the data size report from (deep bytes, JSON bytes, count) tuples"""
+        crawl_results_deep, crawl_json_size, crawl_results_count = results
+        links_deep, links_json_size, links_count = links
+        issues_deep, issues_json_size, issues_count = issues
+
         return {
             'crawl_results_deep_mb': round(crawl_results_deep / 1024 / 1024, 2),
             'crawl_results_json_mb': round(crawl_json_size / 1024 / 1024, 2),
-            'crawl_results_count': len(crawl_results),
-            'avg_per_url_kb': round(crawl_results_deep / len(crawl_results) / 1024, 2) if crawl_results else 0,
+            'crawl_results_count': crawl_results_count,
+            'avg_per_url_kb': round(crawl_results_deep / crawl_results_count / 1024, 2) if crawl_results_count else 0,
 
             'links_deep_mb': round(links_deep / 1024 / 1024, 2),
             'links_json_mb': round(links_json_size / 1024 / 1024, 2),
-            'links_count': len(links),
+            'links_count': links_count,
 
             'issues_deep_mb': round(issues_deep / 1024 / 1024, 2),
             'issues_json_mb': round(issues_json_size / 1024 / 1024, 2),
-            'issues_count': len(issues),
+            'issues_count': issues_count,
 
             'total_deep_mb': round((crawl_results_deep + links_deep + issues_deep) / 1024 / 1024, 2),
             'total_json_mb': round((crawl_json_size + links_json_size + issues_json_size) / 1024 / 1024, 2)
         }
+
+
+class DataSizeTracker:
+    """Running crawl data size totals, updated as each record is added instead of walking everything on read"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all totals"""
+        with self.lock:
+            self.results = [0, 0, 0]  # deep bytes, JSON bytes, count
+            self.issues = [0, 0, 0]
+
+    @staticmethod
+    def _measure(record):
+        """Measure one record; dict keys, singletons and shared result values are left out"""
+        try:
+            json_size = len(json.dumps(dict(record), default=str))
+        except (TypeError, ValueError):
+            json_size = 0
+        seen = {id(None), id(True), id(False), *map(id, get_shared_values())}
+        return MemoryProfiler.get_deep_size(record, seen, count_keys=False), json_size
+
+    def add_result(self, result):
+        """Account for a newly stored crawl result"""
+        deep_size, json_size = self._measure(result)
+        with self.lock:
+            self.results[0] += deep_size
+            self.results[1] += json_size
+            self.results[2] += 1
+
+    def add_issues(self, issues):
+        """Account for newly detected issues"""
+        for issue in issues:
+            deep_size, json_size = self._measure(issue)
+            with self.lock:
+                self.issues[0] += deep_size
+                self.issues[1] += json_size
+                self.issues[2] += 1
+
+    def get_data_sizes(self, link_manager=None):
+        """Get the data size report (same keys as MemoryProfiler.get_crawler_data_size)"""
+        links = link_manager.get_data_size() if link_manager else (0, 0, 0)
+        with self.lock:
+            return MemoryProfiler.format_data_sizes(tuple(self.results), links, tuple(self.issues))
@@ -1,44 +1,145 @@
-"""Token bucket rate limiter for smooth request distribution"""
+"""Per-host token bucket rate limiting for polite request distribution"""
 import time
 import threading
 
 
-class RateLimiter:
+# Host buckets kept before idle (full) ones are dropped
+MAX_HOST_BUCKETS = 10000
+
+
+class TokenBucket:
+    """
+    Token bucket for one host.
+
+    Holds up to burst tokens and refills at rate tokens per second. Each
+    request takes a token, so a host can get burst requests back to back
+    and is then held to the sustained rate.
     """
-    Token bucket rate limiter that ensures smooth, steady request distribution.
-    Prevents bursting by spacing out requests evenly over time.
+
+    __slots__ = ('rate', 'burst', 'tokens', 'updated')
+
+    def __init__(self, rate, burst, now):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now):
+        """Take a token if one is available; returns 0, or the seconds until one is"""
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def wait_time(self, now):
+        """Seconds until a token is available, without taking it"""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def is_full(self, now):
+        self._refill(now)
+        return self.tokens >= self.burst
+
+
+class HostRateLimiter:
     """
+    Rate limiter with a token bucket per host.
 
-    def __init__(self, requests_per_second=1.0):
+    Every host gets its own sustained rate and burst, so a slow or heavily
+    delayed host never holds back requests to other hosts, and pause() holds
+    back a single host (e.g. for a Retry-After). try_acquire() never blocks:
+    it takes a slot or says how long to wait, and the HostScheduler parks the
+    host until then instead of a worker sleeping.
+    """
+
+    def __init__(self, requests_per_second=None, burst=1):
         """
         Initialize rate limiter.
 
         Args:
-            requests_per_second: Target request rate (e.g., 1.0 = 1 req/sec, 0.5 = 1 req every 2 sec)
+            requests_per_second: Sustained request rate per host, or None for no limit
+            burst: Requests a host may get back to back before the rate applies
         """
-        self.requests_per_second = max(0.01, requests_per_second)  # Minimum rate
-        self.min_interval = 1.0 / self.requests_per_second if self.requests_per_second > 0 else 0
-        self.last_request_time = 0
+        self.requests_per_second = None
+        self.burst = 1
+        self.buckets = {}
+        self.paused_until = {}  # host -> monotonic time it may be requested again
         self.lock = threading.Lock()
+        self.update_rate(requests_per_second, burst)
+
+    def _get_bucket(self, host, now):
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            if len(self.buckets) >= MAX_HOST_BUCKETS:
+                # A full bucket is the same as a new one, so idle hosts can go
+                self.buckets = {h: b for h, b in self.buckets.items() if not b.is_full(now)}
+            bucket = self.buckets[host] = TokenBucket(self.requests_per_second, self.burst, now)
+        return bucket
 
-    def acquire(self):
+    def _get_pause(self, host, now):
+        paused_until = self.paused_until.get(host)
+        if paused_until is None:
+            return 0.0
+        if paused_until <= now:
+            del self.paused_until[host]
+            return 0.0
+        return paused_until - now
+
+    def try_acquire(self, host):
         """
-        Acquire permission to make a request.
-        Blocks until enough time has passed since the last request.
+        Take a request slot for host without blocking.
+
+        Returns:
+            float: 0 if the request may go ahead, else seconds until the host is eligible
         """
+        if self.requests_per_second is None and not self.paused_until:
+            return 0.0
         with self.lock:
-            now = time.time()
-            time_since_last = now - self.last_request_time
-
-            if time_since_last < self.min_interval:
-                sleep_time = self.min_interval - time_since_last
-                time.sleep(sleep_time)
-                self.last_request_time = time.time()
-            else:
-                self.last_request_time = now
-
-    def update_rate(self, requests_per_second):
-        """Update the rate limit dynamically"""
+            now = time.monotonic()
+            pause = self._get_pause(host, now)
+            if pause or self.requests_per_second is None:
+                return pause
+            return self._get_bucket(host, now).take(now)
+
+    def get_wait_time(self, host):
+        """Seconds until host is eligible, without taking a slot"""
+        if self.requests_per_second is None and not self.paused_until:
+            return 0.0
         with self.lock:
-            self.requests_per_second = max(0.01, requests_per_second)
-            self.min_interval = 1.0 / self.requests_per_second if self.requests_per_second > 0 else 0
+            now = time.monotonic()
+            pause = self._get_pause(host, now)
+            if pause or self.requests_per_second is None:
+                return pause
+            bucket = self.buckets.get(host)
+            return bucket.wait_time(now) if bucket else 0.0
+
+    def pause(self, host, seconds):
+        """Hold back all requests to host for the given number of seconds"""
+        with self.lock:
+            until = time.monotonic() + seconds
+            if until > self.paused_until.get(host, 0.0):
+                self.paused_until[host] = until
+
+    def update_rate(self, requests_per_second, burst=None):
+        """Update the per-host rate (None for no limit) and burst dynamically"""
+        with self.lock:
+            if requests_per_second is not None:
+                requests_per_second = max(0.01, requests_per_second)  # Minimum rate
+            self.requests_per_second = requests_per_second
+            if burst is not None:
+                self.burst = max(1, int(burst))
+
+            if requests_per_second is None:
+                self.buckets.clear()
+                return
+            now = time.monotonic()
+            for bucket in self.buckets.values():
+                bucket._refill(now)
+                bucket.rate = requests_per_second
+                bucket.burst = self.burst
+                bucket.tokens = min(bucket.tokens, self.burst)
@@ -0,0 +1,240 @@
+"""Paginated, sorted and filtered queries over crawl results, links and issues"""
+import heapq
+import threading
+
+from src.core.crawl_result import RESULT_FIELDS, OPTIONAL_FIELDS
+
+
+QUERY_DATASETS = ('urls', 'links', 'issues')
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Fields matched by the free-text search parameter
+SEARCH_FIELDS = {
+    'urls': ('url', 'title'),
+    'links': ('source_url', 'target_url', 'anchor_text'),
+    'issues': ('url', 'issue', 'details')
+}
+
+# Fields a dataset can be sorted by; each sorted order is cached, so keys from
+# requests are limited to real columns
+SORT_FIELDS = {
+    'urls': frozenset(RESULT_FIELDS) | frozenset(OPTIONAL_FIELDS),
+    'links': frozenset(('source_url', 'target_url', 'anchor_text', 'is_internal', 'target_domain',
+                        'target_status', 'placement')),
+    'issues': frozenset(('url', 'type', 'category', 'issue', 'details'))
+}
+
+# Field the status filter applies to
+STATUS_FIELDS = {
+    'urls': 'status_code',
+    'links': 'target_status'
+}
+
+# Fields rewritten on rows that were already added (a link's target_status once
+# its target is crawled, linked_from when the crawl ends); sorts on them are
+# only reused while the caller's mutation_version stays the same
+MUTABLE_SORT_FIELDS = {
+    'urls': ('linked_from', 'linked_from_count'),
+    'links': ('target_status',)
+}
+
+
+def parse_status_filter(text):
+    """
+    Parse a status filter such as "200,3xx,500-599" into inclusive ranges.
+
+    Raises:
+        ValueError: If a part is not a code, an Nxx class or a range
+    """
+    ranges = []
+    for part in text.split(','):
+        part = part.strip().lower()
+        if not part:
+            continue
+        try:
+            if len(part) == 3 and part.endswith('xx') and part[0].isdigit():
+                low = int(part[0]) * 100
+                ranges.append((low, low + 99))
+            elif '-' in part:
+                low, high = part.split('-', 1)
+                ranges.append((int(low), int(high)))
+            else:
+                ranges.append((int(part), int(part)))
+        except ValueError:
+            raise ValueError(f"Invalid status filter: {part}")
+    return ranges
+
+
+def _parse_bool(text):
+    return text.strip().lower() in ('1', 'true', 'yes')
+
+
+def _sort_value(value):
+    """Sort key that orders mixed and missing values without raising"""
+    if value is None or value == '':
+        return (1, 0, '')
+    if isinstance(value, bool):
+        return (0, 0, int(value))
+    if isinstance(value, (int, float)):
+        return (0, 0, value)
+    if isinstance(value, str):
+        return (0, 1, value.lower())
+    if isinstance(value, (list, dict)):
+        return (0, 0, len(value))
+    return (0, 1, str(value))
+
+
+class ResultQuery:
+    """
+    Answers page/sort/filter queries over append-only crawl data.
+
+    Sorted orders are cached per (dataset, sort key, direction) as lists of row
+    positions. Rows only get appended during a crawl, so when new rows arrive
+    only those are sorted and merged into the cached order; a new crawl_id
+    drops the cache. Orders on MUTABLE_SORT_FIELDS are also dropped when the
+    mutation_version passed in changes, since existing rows moved.
+    """
+
+    def __init__(self):
+        self.sort_cache = {}
+        self.cache_lock = threading.Lock()
+
+    def query(self, dataset, rows, params, version, row_filter=None, mutation_version=0):
+        """
+        Run a query over one dataset.
+
+        Args:
+            dataset: 'urls', 'links' or 'issues'
+            rows: Current rows of the dataset (append-only between versions): a list of
+                dicts, or a view with get_value(position, field) such as LinkView, whose
+                rows are then only built for the returned page
+            params: Mapping of query parameters (page, page_size, sort, order,
+                status, content_type, min_depth, max_depth, internal, placement,
+                category, type, search)
+            version: Identifier of the crawl the rows belong to
+            row_filter: Optional extra predicate rows must pass
+            mutation_version: Changes whenever a MUTABLE_SORT_FIELDS field of existing rows is rewritten
+
+        Returns:
+            dict: items on the requested page plus total, page, page_size and pages
+
+        Raises:
+            ValueError: On an unknown dataset or malformed parameter
+        """
+        if dataset not in QUERY_DATASETS:
+            raise ValueError(f"Unknown dataset: {dataset}")
+
+        page = max(1, int(params.get('page', 1)))
+        page_size = min(MAX_PAGE_SIZE, max(1, int(params.get('page_size', DEFAULT_PAGE_SIZE))))
+        value = getattr(rows, 'get_value', None) or (lambda position, field: rows[position].get(field))
+        predicates = self._build_predicates(dataset, params, value)
+        if row_filter:
+            predicates.append(lambda position: row_filter(rows[position]))
+
+        sort_key = params.get('sort')
+        descending = params.get('order', 'asc').lower() == 'desc'
+        if sort_key:
+            if sort_key not in SORT_FIELDS[dataset]:
+                raise ValueError(f"Cannot sort {dataset} by: {sort_key}")
+            if sort_key in MUTABLE_SORT_FIELDS.get(dataset, ()):
+                version = (version, mutation_version)
+            positions = self._sorted_positions(dataset, rows, value, sort_key, descending, version)
+        else:
+            positions = range(len(rows))
+
+        start = (page - 1) * page_size
+        end = start + page_size
+        items = []
+        total = 0
+
+        for position in positions:
+            if all(predicate(position) for predicate in predicates):
+                if start <= total < end:
+                    items.append(rows[position])
+                total += 1
+
+        return {
+            'items': items,
+            'total': total,
+            'page': page,
+            'page_size': page_size,
+            'pages': (total + page_size - 1) // page_size
+        }
+
+    def _build_predicates(self, dataset, params, value):
+        """Turn filter parameters into predicates on row positions; value(position, field) reads a field"""
+        predicates = []
+
+        def status_matches(position):
+            status_code = value(position, field)
+            return isinstance(status_code, int) and any(low <= status_code <= high for low, high in ranges)
+
+        status = params.get('status')
+        if status and dataset in STATUS_FIELDS:
+            field = STATUS_FIELDS[dataset]
+            ranges = parse_status_filter(status)
+            predicates.append(status_matches)
+
+        content_type = params.get('content_type')
+        if content_type and dataset == 'urls':
+            content_type = content_type.lower()
+            predicates.append(lambda position: content_type in (value(position, 'content_type') or '').lower())
+
+        if dataset == 'urls':
+            if params.get('min_depth') not in (None, ''):
+                min_depth = int(params['min_depth'])
+                predicates.append(lambda position: (value(position, 'depth') or 0) >= min_depth)
+            if params.get('max_depth') not in (None, ''):
+                max_depth = int(params['max_depth'])
+                predicates.append(lambda position: (value(position, 'depth') or 0) <= max_depth)
+
+        internal = params.get('internal')
+        if internal and dataset in ('urls', 'links'):
+            is_internal = _parse_bool(internal)
+            predicates.append(lambda position: bool(value(position, 'is_internal')) == is_internal)
+
+        placement = params.get('placement')
+        if placement and dataset == 'links':
+            predicates.append(lambda position: value(position, 'placement') == placement)
+
+        if dataset == 'issues':
+            category = params.get('category')
+            if category:
+                predicates.append(lambda position: value(position, 'category') == category)
+            issue_type = params.get('type')
+            if issue_type:
+                predicates.append(lambda position: value(position, 'type') == issue_type)
+
+        search = params.get('search')
+        if search:
+            search = search.lower()
+            fields = SEARCH_FIELDS[dataset]
+            predicates.append(lambda position: any(search in str(value(position, field) or '').lower()
+                                                   for field in fields))
+
+        return predicates
+
+    def _sorted_positions(self, dataset, rows, value, sort_key, descending, version):
+        """Get row positions ordered by sort_key, extending the cached order with new rows"""
+        cache_key = (dataset, sort_key, descending)
+
+        def key(position):
+            return _sort_value(value(position, sort_key))
+
+        with self.cache_lock:
+            cached = self.sort_cache.get(cache_key)
+
+        count = len(rows)
+        if cached and cached[0] == version and cached[1] <= count:
+            _, cached_count, order = cached
+            if cached_count == count:
+                return order
+            new_positions = sorted(range(cached_count, count), key=key, reverse=descending)
+            order = list(heapq.merge(order, new_positions, key=key, reverse=descending))
+        else:
+            order = sorted(range(count), key=key, reverse=descending)
+
+        with self.cache_lock:
+            self.sort_cache[cache_key] = (version, count, order)
+        return order
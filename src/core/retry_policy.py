@@ -0,0 +1,95 @@
+"""Retry policy for failed fetches: which failures to retry and how long to back off"""
+import asyncio
+import random
+
+import requests
+
+
+# Retryable status codes and the base backoff (seconds) of each
+RETRY_STATUS_DELAYS = {
+    408: 1.0,   # Request Timeout
+    429: 5.0,   # Too Many Requests - the server is explicitly rate limiting us
+    500: 1.0,   # Internal Server Error
+    502: 1.0,   # Bad Gateway
+    503: 2.0,   # Service Unavailable
+    504: 2.0    # Gateway Timeout
+}
+
+# Base backoff for connection errors and timeouts
+RETRY_ERROR_DELAY = 1.0
+
+# Upper bound of a single backoff, in seconds
+MAX_RETRY_DELAY = 60.0
+
+
+def is_transient_error(error):
+    """
+    Whether a fetch exception is a connection failure or timeout that may pass.
+
+    TLS and certificate errors, invalid URLs, redirect loops and other
+    failures are permanent, and so are render errors only given as a message.
+    """
+    if isinstance(error, requests.exceptions.SSLError):
+        return False
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                          requests.exceptions.ChunkedEncodingError, asyncio.TimeoutError)):
+        return True
+
+    try:
+        import aiohttp
+    except ImportError:
+        return False
+    if isinstance(error, (aiohttp.ClientSSLError, aiohttp.ServerFingerprintMismatch)):
+        return False
+    return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError))
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed fetch is retried and when.
+
+    Transient errors (connection failures and timeouts, see
+    is_transient_error) and the status codes in RETRY_STATUS_DELAYS are
+    retried up to max_retries times. The n-th retry waits
+    base * 2**n seconds (capped at MAX_RETRY_DELAY) with equal jitter, so
+    URLs that failed together do not all come back at the same moment. A
+    Retry-After from the server is used when it asks for longer.
+    """
+
+    def __init__(self, max_retries=3):
+        """
+        Args:
+            max_retries: Retries per URL after the first attempt
+        """
+        self.max_retries = max(0, max_retries)
+
+    @staticmethod
+    def is_retryable(status_code=None, error=None):
+        """Whether a fetch outcome is worth retrying"""
+        if error is not None:
+            return is_transient_error(error)
+        return status_code in RETRY_STATUS_DELAYS
+
+    def should_retry(self, retries, status_code=None, error=None):
+        """Whether to retry a fetch that has already been retried retries times"""
+        return retries < self.max_retries and self.is_retryable(status_code, error)
+
+    @staticmethod
+    def get_delay(retries, status_code=None, retry_after=None):
+        """
+        Backoff before the next attempt.
+
+        Args:
+            retries: Retries already made for the URL
+            status_code: Status of the failed attempt, None for an error
+            retry_after: Seconds the server asked us to wait, if any
+
+        Returns:
+            float: Seconds to wait before retrying
+        """
+        base = RETRY_STATUS_DELAYS.get(status_code, RETRY_ERROR_DELAY)
+        delay = min(MAX_RETRY_DELAY, base * 2 ** retries)
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        if retry_after:
+            delay = max(delay, retry_after)
+        return delay
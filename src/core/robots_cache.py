@@ -0,0 +1,182 @@
+"""Process-wide robots.txt cache shared by all crawls and the sitemap parser"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+
+# How long fetched rules are trusted
+ROBOTS_TTL = 3600
+
+# How long a failed fetch (network error, 5xx) is cached before trying again
+ROBOTS_NEGATIVE_TTL = 300
+
+# Hosts kept in the cache before the oldest are dropped
+MAX_ROBOTS_ENTRIES = 10000
+
+# robots.txt files fetched at once across all crawls
+ROBOTS_FETCH_WORKERS = 8
+
+
+def get_robots_url(url):
+    """robots.txt URL for the host of url"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+
+
+class RobotsRules:
+    """Parsed robots.txt of one host"""
+
+    __slots__ = ('parser', 'sitemaps', 'expires_at')
+
+    def __init__(self, parser, sitemaps, ttl):
+        self.parser = parser
+        self.sitemaps = sitemaps
+        self.expires_at = time.time() + ttl
+
+    @classmethod
+    def from_text(cls, text, ttl=ROBOTS_TTL):
+        parser = RobotFileParser()
+        parser.parse(text.splitlines())
+        return cls(parser, parser.site_maps() or [], ttl)
+
+    @classmethod
+    def allow_all(cls, ttl=ROBOTS_TTL):
+        parser = RobotFileParser()
+        parser.allow_all = True
+        return cls(parser, [], ttl)
+
+    @classmethod
+    def disallow_all(cls, ttl=ROBOTS_TTL):
+        parser = RobotFileParser()
+        parser.disallow_all = True
+        return cls(parser, [], ttl)
+
+    def is_expired(self):
+        return time.time() >= self.expires_at
+
+    def can_fetch(self, user_agent, url):
+        return self.parser.can_fetch(user_agent, url)
+
+
+class RobotsCache:
+    """
+    robots.txt rules per host, fetched once and shared by every crawl in the process.
+
+    Rules are kept for ROBOTS_TTL seconds. Failed fetches are cached too
+    (negative caching) for ROBOTS_NEGATIVE_TTL so an unreachable host is
+    not asked again for every URL. Fetches run on a small background pool
+    through the crawl's own HTTP session, and concurrent requests for the
+    same host share one fetch.
+
+    Status handling follows RobotFileParser.read(): 401/403 disallow
+    everything, other 4xx allow everything. 5xx disallows everything until
+    the negative entry expires; a network error allows everything, as the
+    crawler always did when robots.txt could not be read.
+    """
+
+    def __init__(self):
+        self.entries = {}  # robots_url -> RobotsRules
+        self.pending = {}  # robots_url -> Future of an in-flight fetch
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=ROBOTS_FETCH_WORKERS, thread_name_prefix='robots')
+
+    def get(self, robots_url):
+        """Cached rules for a robots.txt URL, or None if unknown or expired"""
+        with self.lock:
+            rules = self.entries.get(robots_url)
+        if rules is None or rules.is_expired():
+            return None
+        return rules
+
+    def prefetch(self, robots_url, session, timeout):
+        """
+        Start fetching a robots.txt in the background (or join the fetch already running).
+
+        Returns:
+            Future: Resolves to the RobotsRules once they are cached
+        """
+        with self.lock:
+            rules = self.entries.get(robots_url)
+            if rules is not None and not rules.is_expired():
+                future = Future()
+                future.set_result(rules)
+                return future
+
+            future = self.pending.get(robots_url)
+            if future is None:
+                future = self.executor.submit(self._fetch, robots_url, session, timeout)
+                self.pending[robots_url] = future
+        return future
+
+    def fetch(self, robots_url, session, timeout):
+        """Get rules for a robots.txt URL, fetching them if needed (blocks)"""
+        rules = self.get(robots_url)
+        if rules is None:
+            rules = self.prefetch(robots_url, session, timeout).result()
+        return rules
+
+    def _fetch(self, robots_url, session, timeout):
+        try:
+            response = session.get(robots_url, timeout=timeout)
+            if response.status_code in (401, 403):
+                rules = RobotsRules.disallow_all()
+            elif 400 <= response.status_code < 500:
+                rules = RobotsRules.allow_all()
+            elif response.status_code >= 500:
+                rules = RobotsRules.disallow_all(ROBOTS_NEGATIVE_TTL)
+            else:
+                rules = RobotsRules.from_text(response.text)
+        except Exception as e:
+            print(f"Could not fetch {robots_url}: {e}")
+            rules = RobotsRules.allow_all(ROBOTS_NEGATIVE_TTL)
+
+        with self.lock:
+            if robots_url not in self.entries and len(self.entries) >= MAX_ROBOTS_ENTRIES:
+                self._evict()
+            self.entries[robots_url] = rules
+            self.pending.pop(robots_url, None)
+        return rules
+
+    def _evict(self):
+        """Drop expired entries, or the oldest half if none have expired"""
+        expired = [url for url, rules in self.entries.items() if rules.is_expired()]
+        if not expired:
+            expired = list(self.entries)[:len(self.entries) // 2]
+        for url in expired:
+            del self.entries[url]
+
+    def get_stats(self):
+        with self.lock:
+            return {'hosts': len(self.entries), 'fetching': len(self.pending)}
+
+
+class RobotsChecker:
+    """One crawl's view of the shared robots cache: its HTTP session, timeout and user agent"""
+
+    def __init__(self, cache, session, timeout, user_agent):
+        self.cache = cache
+        self.session = session
+        self.timeout = timeout
+        self.user_agent = user_agent
+
+    def is_allowed(self, url):
+        """
+        Check url against its host's cached rules without fetching.
+
+        Returns:
+            bool: Whether url may be crawled, or None if the rules are not known yet
+        """
+        rules = self.cache.get(get_robots_url(url))
+        if rules is None:
+            return None
+        return rules.can_fetch(self.user_agent, url)
+
+    def prefetch(self, url):
+        """Start fetching the rules for url's host; returns a Future of the RobotsRules"""
+        return self.cache.prefetch(get_robots_url(url), self.session, self.timeout)
+
+
+# Shared by every crawler instance in the process
+robots_cache = RobotsCache()
@@ -3,6 +3,8 @@ import gzip
 import xml.etree.ElementTree as ET
 from urllib.parse import urlparse
 
+from src.core.robots_cache import robots_cache
+
 
 class SitemapParser:
     """Discovers and parses sitemap.xml files"""
@@ -47,23 +49,9 @@ class SitemapParser:
         return all_urls
 
     def _get_sitemaps_from_robots(self, base_domain):
-        """Extract sitemap URLs from robots.txt"""
-        sitemaps = []
-        try:
-            robots_url = f"{base_domain}/robots.txt"
-            response = self.session.get(robots_url, timeout=self.timeout)
-
-            if response.status_code == 200:
-                for line in response.text.split('\n'):
-                    line = line.strip()
-                    if line.lower().startswith('sitemap:'):
-                        sitemap_url = line.split(':', 1)[1].strip()
-                        sitemaps.append(sitemap_url)
-
-        except Exception as e:
-            print(f"Could not fetch robots.txt: {e}")
-
-        return sitemaps
+        """Extract sitemap URLs from robots.txt (through the shared robots cache, so it is fetched once)"""
+        rules = robots_cache.fetch(f"{base_domain}/robots.txt", self.session, self.timeout)
+        return list(rules.sitemaps)
 
     def _parse_sitemap(self, sitemap_url, depth=1, max_depth=10):
         """
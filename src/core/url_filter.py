@@ -0,0 +1,83 @@
+"""Compiled crawl URL filter: external policy, file extensions and include/exclude patterns"""
+import re
+import threading
+from urllib.parse import urlparse
+
+
+# URLs whose decision the filter remembers
+DECISION_CACHE_SIZE = 100000
+
+
+class UrlFilter:
+    """
+    Decides whether a discovered URL should be crawled, from the crawl settings.
+
+    Extensions are kept as sets and include/exclude patterns are compiled
+    once when the filter is built, and decisions are cached per URL (the
+    link manager hands over normalized URLs), so a URL linked from every
+    page is only evaluated once. It holds no crawl state, so it can be
+    called from any thread without the link manager's lock.
+    """
+
+    def __init__(self, config, is_internal):
+        """
+        Args:
+            config: Crawler config (crawl_external, include/exclude_extensions, include/exclude_patterns)
+            is_internal: Callable telling whether a URL is on the crawl's base domain
+        """
+        self.crawl_external = config['crawl_external']
+        self.is_internal = is_internal
+        self.exclude_extensions = frozenset(config['exclude_extensions'])
+        self.include_extensions = frozenset(config['include_extensions'])
+        self.exclude_patterns = self._compile(config['exclude_patterns'])
+        self.include_patterns = self._compile(config['include_patterns'])
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _compile(patterns):
+        compiled = []
+        for pattern in patterns:
+            if not pattern:
+                continue
+            try:
+                compiled.append(re.compile(pattern))
+            except re.error as e:
+                print(f"Ignoring invalid URL pattern {pattern!r}: {e}")
+        return compiled
+
+    def is_allowed(self, url):
+        """Check if URL should be crawled based on settings"""
+        allowed = self.cache.get(url)
+        if allowed is None:
+            allowed = self._evaluate(url)
+            with self.lock:
+                if len(self.cache) >= DECISION_CACHE_SIZE:
+                    self.cache.clear()
+                self.cache[url] = allowed
+        return allowed
+
+    def _evaluate(self, url):
+        # Check external domain policy
+        if not self.crawl_external and not self.is_internal(url):
+            return False
+
+        # Check file extensions
+        path = urlparse(url).path.lower()
+        if '.' in path:
+            extension = path.rsplit('.', 1)[-1]
+
+            if extension in self.exclude_extensions:
+                return False
+
+            if self.include_extensions and extension not in self.include_extensions:
+                return False
+
+        # Check URL patterns
+        if any(pattern.search(url) for pattern in self.exclude_patterns):
+            return False
+
+        if self.include_patterns and not any(pattern.search(url) for pattern in self.include_patterns):
+            return False
+
+        return True
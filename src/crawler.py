@@ -6,20 +6,30 @@ import requests
 import threading
 import time
 import asyncio
-import re
+import multiprocessing
+import uuid
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
-from urllib.robotparser import RobotFileParser
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import nest_asyncio
 
-from src.core.rate_limiter import RateLimiter
+from src.core.rate_limiter import HostRateLimiter
+from src.core.host_scheduler import HostScheduler
+from src.core.concurrency_controller import AdaptiveConcurrency, OVERLOAD_STATUS_CODES, parse_retry_after
+from src.core.retry_policy import RetryPolicy
+from src.core.robots_cache import RobotsChecker, robots_cache
+from src.core.url_filter import UrlFilter
+from src.core.connection_pool import ConnectionPoolStats, PooledHTTPAdapter, create_aiohttp_trace_config
 from src.core.seo_extractor import SEOExtractor
+from src.core.crawl_result import CrawlResult
+from src.core.html_extractor import extract_page_data
 from src.core.link_manager import LinkManager
-from src.core.js_renderer import JavaScriptRenderer
+from src.core.js_renderer import JavaScriptRenderer, RENDER_TIMEOUT_ERROR
 from src.core.sitemap_parser import SitemapParser
 from src.core.issue_detector import IssueDetector
 from src.core.memory_monitor import MemoryMonitor
+from src.core.memory_profiler import DataSizeTracker
+from src.core.result_query import ResultQuery
+from src.core.crawl_store import CrawlStore
 
 
 class WebCrawler:
@@ -34,6 +44,7 @@ class WebCrawler:
         self.session.headers.update({
             'User-Agent': 'LibreCrawl/1.0 (Web Crawler)'
         })
+        self.pool_stats = ConnectionPoolStats()
 
         # Base URL tracking
         self.base_url = None
@@ -41,16 +52,27 @@ class WebCrawler:
 
         # Component instances (initialized on demand)
         self.rate_limiter = None
+        self.scheduler = None
+        self.retry_policy = None
+        self.url_filter = None
         self.link_manager = None
         self.js_renderer = None
         self.sitemap_parser = None
         self.issue_detector = None
         self.seo_extractor = SEOExtractor()
+        self.parse_pool = None
         self.memory_monitor = MemoryMonitor()
+        self.data_sizes = DataSizeTracker()
+        self.result_query = ResultQuery()
+        self.crawl_store = None
+        self.stop_requested = False
 
         # Results storage
         self.crawl_results = []
         self.results_lock = threading.Lock()
+        self.linked_from_version = 0  # Bumped when linked_from is rewritten on stored results
+        self.crawl_id = uuid.uuid4().hex  # Changes per crawl so status cursors from older crawls are ignored
+        self.update_condition = threading.Condition()  # Notified when new results are stored
 
         # State flags
         self.is_running = False
@@ -72,8 +94,8 @@ class WebCrawler:
         # Thread reference
         self.crawl_thread = None
 
-        # Robots.txt cache
-        self._robots_cache = {}
+        # Robots.txt rules for this crawl (shared process-wide cache)
+        self.robots = None
 
         # Enable nested asyncio for thread compatibility
         nest_asyncio.apply()
@@ -84,6 +106,7 @@ class WebCrawler:
             'max_depth': 3,
             'max_urls': 1000,
             'delay': 1.0,
+            'burst': 1,
             'follow_redirects': True,
             'crawl_external': False,
             'user_agent': 'LibreCrawl/1.0 (Web Crawler)',
@@ -98,6 +121,15 @@ class WebCrawler:
             'exclude_patterns': [],
             'max_file_size': 50 * 1024 * 1024,
             'concurrency': 5,
+            'fetch_engine': 'threads',
+            'async_concurrency': 100,
+            'adaptive_concurrency': True,
+            'max_host_pools': 100,
+            'html_parser': 'lxml',
+            'parse_workers': 0,
+            'linked_from_limit': 1000,
+            'frontier_mode': 'memory',
+            'persist_results': True,
             'memory_limit': 512 * 1024 * 1024,
             'log_level': 'INFO',
             'enable_proxy': False,
@@ -189,8 +221,14 @@ class WebCrawler:
             ]
         }
 
-    def start_crawl(self, url):
-        """Start crawling from the given URL"""
+    def start_crawl(self, url, store_id=None):
+        """
+        Start crawling from the given URL.
+
+        Args:
+            url: Start URL
+            store_id: Optional crawl_history id; results are then persisted to the crawl store
+        """
         if self.is_running:
             return False, "Crawl already in progress"
 
@@ -219,6 +257,11 @@ class WebCrawler:
                 self._discover_and_add_sitemap_urls(url)
                 print(f"Sitemap discovery completed. Total discovered URLs: {self.stats['discovered']}")
 
+            # Persist results while crawling if this crawl is logged in crawl_history
+            if store_id and self.config.get('persist_results', True):
+                self.crawl_store = CrawlStore(store_id, self.link_manager)
+                self.crawl_store.start()
+
             # Start crawling in separate thread
             self.is_running = True
             self.crawl_thread = threading.Thread(target=self._crawl_worker)
@@ -231,15 +274,25 @@ class WebCrawler:
 
     def _initialize_components(self):
         """Initialize all crawler components"""
-        # Calculate requests per second from delay
-        if self.config['delay'] > 0:
-            requests_per_second = 1.0 / self.config['delay']
+        self.rate_limiter = HostRateLimiter(self._get_requests_per_second(), self.config.get('burst', 1))
+        if self.config['respect_robots']:
+            self.robots = RobotsChecker(robots_cache, self.session, self.config['timeout'], self.config.get('user_agent', '*'))
         else:
-            # If delay is 0, set high rate but still smooth
-            requests_per_second = 100.0
-
-        self.rate_limiter = RateLimiter(requests_per_second)
-        self.link_manager = LinkManager(self.base_domain)
+            self.robots = None
+        self._configure_connection_pools()
+        self.link_manager = LinkManager(
+            self.base_domain,
+            self.config.get('linked_from_limit', 1000),
+            self.config.get('frontier_mode', 'memory')
+        )
+        self.scheduler = HostScheduler(
+            self.link_manager,
+            self.rate_limiter,
+            AdaptiveConcurrency(self._get_engine_concurrency(), self.config.get('adaptive_concurrency', True)),
+            self.robots
+        )
+        self.retry_policy = RetryPolicy(self.config.get('retries', 3))
+        self.url_filter = UrlFilter(self.config, self.link_manager.is_internal)
         self.sitemap_parser = SitemapParser(self.session, self.base_domain, self.config['timeout'])
         self.issue_detector = IssueDetector(self.config.get('issue_exclusion_patterns', []))
 
@@ -247,6 +300,25 @@ class WebCrawler:
         if self.config.get('enable_javascript', False):
             self.js_renderer = JavaScriptRenderer(self.config)
 
+    def _configure_connection_pools(self):
+        """Mount keep-alive adapters whose per-host pool size follows the crawl concurrency"""
+        # External crawls touch many hosts, so keep more host pools cached before evicting
+        if self.config['crawl_external']:
+            host_pools = self.config.get('max_host_pools', 100)
+        else:
+            host_pools = 10
+
+        adapter = PooledHTTPAdapter(
+            self.pool_stats,
+            pool_connections=host_pools,
+            pool_maxsize=self.config.get('concurrency', 5)
+        )
+
+        # Drop connections held by the previous adapters before replacing them
+        self.session.close()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def _reset_state(self):
         """Reset crawler state"""
         if self.link_manager:
@@ -255,6 +327,11 @@ class WebCrawler:
             self.issue_detector.reset()
 
         self.crawl_results.clear()
+        self.crawl_store = None
+        self.stop_requested = False
+        self.data_sizes.reset()
+        self.crawl_id = uuid.uuid4().hex
+        self.pool_stats.reset()
         self.stats = {
             'discovered': 0,
             'crawled': 0,
@@ -285,6 +362,7 @@ class WebCrawler:
 
     def stop_crawl(self):
         """Stop the current crawl"""
+        self.stop_requested = True
         self.is_running = False
         self.is_paused = False
         self.is_running_pagespeed = False
@@ -315,8 +393,18 @@ class WebCrawler:
         self.is_paused = False
         return True, "Crawl resumed"
 
-    def get_status(self):
-        """Get current crawl status and results"""
+    def get_status(self, cursor=None, limit=None):
+        """
+        Get current crawl status and results.
+
+        Args:
+            cursor: Optional dict with crawl_id and the urls/links/issues counts the
+                client already has; only items past those positions are returned
+            limit: Optional maximum number of urls, links and issues each to return
+
+        Returns:
+            dict: Status, stats and (new) urls, links and issues, plus the next cursor
+        """
         status = 'completed' if not self.is_running and self.stats['crawled'] > 0 else 'running'
         if not self.is_running and self.stats['crawled'] == 0:
             status = 'idle'
@@ -329,38 +417,117 @@ class WebCrawler:
         # Get link manager stats
         link_stats = self.link_manager.get_stats() if self.link_manager else {'discovered': 0}
 
-        # Update link statuses before returning (ensures all crawled URLs have their status)
-        if self.link_manager:
-            self.link_manager.update_link_statuses(self.crawl_results)
-
         # Update memory stats
         self.memory_monitor.update()
 
-        # Get actual data size for accurate estimates
-        from src.core.memory_profiler import MemoryProfiler
-        data_sizes = MemoryProfiler.get_crawler_data_size(
-            self.crawl_results,
-            self.link_manager.all_links if self.link_manager else [],
-            self.issue_detector.detected_issues if self.issue_detector else []
-        )
+        # Data sizes are kept as running totals; the full deep walk is only done by /api/debug/memory
+        data_sizes = self.data_sizes.get_data_sizes(self.link_manager)
 
         print(f"get_status called - crawl_results length: {len(self.crawl_results)}, status: {status}, crawled: {self.stats['crawled']}")
 
+        # Results, links and issues are append-only during a crawl, so positions work as sequence numbers
+        is_delta = bool(cursor) and cursor.get('crawl_id') == self.crawl_id
+        url_start = max(0, cursor.get('urls', 0)) if is_delta else 0
+        link_start = max(0, cursor.get('links', 0)) if is_delta else 0
+        issue_start = max(0, cursor.get('issues', 0)) if is_delta else 0
+
+        with self.results_lock:
+            urls = self.crawl_results[url_start:url_start + limit if limit else None]
+        urls = [result.to_dict() for result in urls]
+        links = self.link_manager.get_links(link_start, limit) if self.link_manager else []
+        issues = self.issue_detector.get_issues(issue_start, limit) if self.issue_detector else []
+
         return {
             'status': status,
             'stats': {
                 **self.stats,
                 'discovered': link_stats['discovered']
             },
-            'urls': self.crawl_results.copy(),
-            'links': self.link_manager.all_links.copy() if self.link_manager else [],
-            'issues': self.issue_detector.get_issues() if self.issue_detector else [],
+            'urls': urls,
+            'links': links,
+            'issues': issues,
+            'delta': is_delta,
+            'cursor': {
+                'crawl_id': self.crawl_id,
+                'urls': url_start + len(urls),
+                'links': link_start + len(links),
+                'issues': issue_start + len(issues)
+            },
             'progress': min(100, (self.stats['crawled'] / max(link_stats['discovered'], 1)) * 100),
             'is_running_pagespeed': self.is_running_pagespeed,
             'memory': self.memory_monitor.get_stats(),
-            'memory_data': data_sizes
+            'memory_data': data_sizes,
+            'connection_pool': self.pool_stats.get_stats(),
+            'scheduler': self.scheduler.get_stats() if self.scheduler else None
         }
 
+    def query_results(self, dataset, params, row_filter=None):
+        """
+        Get one page of urls, links or issues, filtered and sorted server-side.
+
+        Args:
+            dataset: 'urls', 'links' or 'issues'
+            params: Query parameters (see ResultQuery.query)
+            row_filter: Optional extra predicate rows must pass
+
+        Returns:
+            dict: items on the page plus total, page, page_size and pages
+        """
+        # Versions are read before the rows so a rewrite in between only costs a re-sort
+        mutation_version = 0
+        if dataset == 'urls':
+            mutation_version = self.linked_from_version
+            with self.results_lock:
+                rows = list(self.crawl_results)
+        elif dataset == 'links':
+            # Filtered and sorted on the link arrays; only the returned page becomes dicts
+            mutation_version = self.link_manager.status_version if self.link_manager else 0
+            rows = self.link_manager.get_link_view() if self.link_manager else []
+        elif dataset == 'issues':
+            rows = self.issue_detector.get_issues() if self.issue_detector else []
+        else:
+            rows = []
+
+        page = self.result_query.query(dataset, rows, params, self.crawl_id, row_filter, mutation_version)
+        if dataset == 'urls':
+            page['items'] = [result.to_dict() for result in page['items']]
+        return page
+
+    def get_row_count(self, dataset):
+        """Get the current number of urls, links or issues"""
+        if dataset == 'urls':
+            with self.results_lock:
+                return len(self.crawl_results)
+        elif dataset == 'links':
+            return self.link_manager.get_link_count() if self.link_manager else 0
+        elif dataset == 'issues':
+            return len(self.issue_detector.get_issues()) if self.issue_detector else 0
+        return 0
+
+    def iter_rows(self, dataset, batch_size=1000):
+        """
+        Yield the current crawl's urls, links or issues in crawl order.
+
+        All three are append-only, so they are read in batches by position and
+        links are only materialized as dicts one batch at a time.
+        """
+        start = 0
+        while True:
+            if dataset == 'urls':
+                with self.results_lock:
+                    rows = self.crawl_results[start:start + batch_size]
+            elif dataset == 'links':
+                rows = self.link_manager.get_links(start, batch_size) if self.link_manager else []
+            elif dataset == 'issues':
+                rows = self.issue_detector.get_issues(start, batch_size) if self.issue_detector else []
+            else:
+                rows = []
+
+            if not rows:
+                return
+            yield from rows
+            start += len(rows)
+
     def update_config(self, new_config):
         """Update crawler configuration"""
         self.config.update(new_config)
@@ -386,19 +553,74 @@ class WebCrawler:
 
         # Update rate limiter if it exists
         if self.rate_limiter:
-            if self.config['delay'] > 0:
-                self.rate_limiter.update_rate(1.0 / self.config['delay'])
-            else:
-                self.rate_limiter.update_rate(100.0)
+            self.rate_limiter.update_rate(self._get_requests_per_second(), self.config.get('burst', 1))
+
+        # Recompile the URL filter for the new patterns
+        if self.link_manager:
+            self.url_filter = UrlFilter(self.config, self.link_manager.is_internal)
+
+    def _get_engine_concurrency(self):
+        """Most requests the configured fetch engine keeps in flight"""
+        if self.config.get('enable_javascript', False):
+            return self.config.get('js_max_concurrent_pages', 3)
+        if self.config.get('fetch_engine', 'threads') == 'async':
+            return self.config.get('async_concurrency', 100)
+        return self.config.get('concurrency', 5)
+
+    def _get_requests_per_second(self):
+        """Sustained per-host request rate from the crawl delay (None when there is no delay)"""
+        if self.config['delay'] > 0:
+            return 1.0 / self.config['delay']
+        return None
 
     def _crawl_worker(self):
-        """Main crawling worker with smooth rate limiting"""
+        """Main crawling worker - runs the configured engine with the parse stage around it"""
+        self._start_parse_pool()
+        try:
+            self._run_crawl_engine()
+        finally:
+            self._stop_parse_pool()
+            self._finish_store()
+
+    def _finish_store(self):
+        """Flush and close the persistent crawl store, if this crawl has one"""
+        crawl_store, self.crawl_store = self.crawl_store, None
+        if crawl_store:
+            with self.results_lock:
+                results = list(self.crawl_results)
+            crawl_store.finish(results, 'stopped' if self.stop_requested else 'completed')
+
+    def _start_parse_pool(self):
+        """Start the HTML parsing process pool if parse_workers is configured"""
+        workers = self.config.get('parse_workers', 0)
+        if workers > 0:
+            # spawn, not fork: forking a multi-threaded server process can deadlock the children
+            self.parse_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            print(f"Started HTML parse pool with {workers} processes")
+
+    def _stop_parse_pool(self):
+        """Shut down the HTML parsing process pool"""
+        if self.parse_pool:
+            self.parse_pool.shutdown(wait=True, cancel_futures=True)
+            self.parse_pool = None
+
+    def _run_crawl_engine(self):
+        """Run the crawl loop of the configured fetch engine with smooth rate limiting"""
         # Use async approach if JavaScript rendering is enabled
         if self.config.get('enable_javascript', False):
             print("Initializing JavaScript rendering...")
             asyncio.run(self._crawl_async_with_js())
             return
 
+        # Event-loop HTTP crawling for high fetch concurrency
+        if self.config.get('fetch_engine', 'threads') == 'async':
+            print("Initializing async HTTP fetch engine...")
+            asyncio.run(self._crawl_async_with_http())
+            return
+
         # Traditional HTTP crawling with smooth rate limiting
         max_workers = self.config.get('concurrency', 5)
 
@@ -412,11 +634,11 @@ class WebCrawler:
                         time.sleep(1)
                         continue
 
-                    # Submit new tasks - fill ALL available slots, apply rate limiting per task
+                    # Submit new tasks - fill ALL available slots with URLs whose host is eligible
                     while (len(active_futures) < max_workers and
                            self.stats['crawled'] < self.config['max_urls']):
 
-                        url_info = self.link_manager.get_next_url()
+                        url_info = self.scheduler.get_next_url()
                         if not url_info:
                             break
 
@@ -424,11 +646,13 @@ class WebCrawler:
 
                         # Skip if depth exceeded
                         if depth > self.config['max_depth']:
+                            self.scheduler.release(current_url)
                             continue
 
-                        # Submit crawl task immediately - rate limiting happens inside the worker
+                        # The scheduler already took this host's slots; give them back when the task ends
                         print(f"Submitting task for: {current_url}")
                         future = executor.submit(self._crawl_url, current_url, depth)
+                        future.add_done_callback(lambda f, url=current_url: self.scheduler.release(url))
                         active_futures[future] = current_url
 
                     # Process completed tasks
@@ -439,14 +663,7 @@ class WebCrawler:
                             try:
                                 result = future.result()
                                 if result:
-                                    with self.results_lock:
-                                        self.crawl_results.append(result)
-                                        self.stats['crawled'] += 1
-                                        self.stats['depth'] = max(self.stats['depth'], result.get('depth', 0))
-                                        print(f"Added URL to results: {result['url']} - Total in results: {len(self.crawl_results)}")
-
-                                    # Detect issues
-                                    self.issue_detector.detect_issues(result)
+                                    self._store_result(result)
                             except Exception as e:
                                 print(f"Error in crawl task: {e}")
 
@@ -460,13 +677,12 @@ class WebCrawler:
                         break
 
                     # Check if no more work
-                    link_stats = self.link_manager.get_stats()
-                    if link_stats['pending'] == 0 and len(active_futures) == 0:
+                    if len(active_futures) == 0 and not self._has_pending_urls():
                         print("No more URLs to crawl")
                         break
 
-                    # Tiny sleep only to yield CPU
-                    time.sleep(0.001)
+                    # Tiny sleep only to yield CPU, longer when only waiting on host delays or retries
+                    time.sleep(self._get_idle_sleep(active_futures))
 
                 except Exception as e:
                     print(f"Error in crawl worker: {e}")
@@ -486,6 +702,46 @@ class WebCrawler:
         self.is_running = False
         print(f"Crawl completed. Discovered: {self.stats['discovered']}, Crawled: {self.stats['crawled']}")
 
+    def _has_pending_urls(self):
+        """Whether URLs are still waiting in the frontier or parked for their host"""
+        return self.link_manager.get_stats()['pending'] > 0 or self.scheduler.get_pending_count() > 0
+
+    def _get_idle_sleep(self, active):
+        """Crawl loop pause: just yield while fetches are in flight, else wait for the next parked URL or retry"""
+        wait = None if active else self.scheduler.get_wait_time()
+        if wait is None:
+            return 0.001
+        return min(max(wait, 0.001), 0.1)
+
+    def _store_result(self, result):
+        """Append a finished page result and run issue detection on it"""
+        result.compact()
+        with self.results_lock:
+            seq = len(self.crawl_results)
+            self.crawl_results.append(result)
+            self.link_manager.record_status(result['url'], result['status_code'])
+            self.stats['crawled'] += 1
+            self.stats['depth'] = max(self.stats['depth'], result.get('depth', 0))
+            print(f"Added URL to results: {result['url']} - Total in results: {len(self.crawl_results)}")
+
+        # Detect issues and account for the new data
+        issues = self.issue_detector.detect_issues(result)
+        self.data_sizes.add_result(result)
+        self.data_sizes.add_issues(issues)
+
+        # Stream to the persistent crawl store
+        crawl_store = self.crawl_store
+        if crawl_store:
+            crawl_store.add(seq, result, issues)
+
+        with self.update_condition:
+            self.update_condition.notify_all()
+
+    def wait_for_update(self, timeout):
+        """Block until a new result is stored or the timeout passes"""
+        with self.update_condition:
+            return self.update_condition.wait(timeout)
+
     def _crawl_url(self, url, depth):
         """Crawl a single URL"""
         # Use JavaScript rendering if enabled
@@ -495,136 +751,250 @@ class WebCrawler:
             return self._crawl_url_with_requests(url, depth)
 
     def _crawl_url_with_requests(self, url, depth):
-        """Crawl a single URL using traditional HTTP requests"""
+        """
+        Crawl a single URL using traditional HTTP requests.
+
+        Returns None when the fetch failed and was queued for a retry.
+        """
         print(f"Starting crawl of {url}")
-        retries = self.config.get('retries', 3)
+        max_file_size = self.config.get('max_file_size', 0)
         start_time = time.time()
 
         try:
-            # Check file size if configured
-            if self.config.get('max_file_size', 0) > 0:
-                try:
-                    head_response = self.session.head(
-                        url,
-                        timeout=self.config['timeout'],
-                        allow_redirects=self.config['follow_redirects']
-                    )
-                    content_length = head_response.headers.get('content-length')
-                    if content_length and int(content_length) > self.config['max_file_size']:
-                        return self.seo_extractor.create_empty_result(
-                            url, depth, 0,
-                            f'File too large: {content_length} bytes'
-                        )
-                except:
-                    pass  # Continue if HEAD request fails
-
-            # Fetch the page with retries
-            response = None
-            for attempt in range(retries + 1):
-                try:
-                    response = self.session.get(
-                        url,
-                        timeout=self.config['timeout'],
-                        allow_redirects=self.config['follow_redirects']
-                    )
-                    break
-                except Exception as e:
-                    if attempt >= retries:
-                        raise e
-                    time.sleep(1)
+            # Fetch the page, streaming the body so max_file_size is enforced without a HEAD request
+            try:
+                response = self.session.get(
+                    url,
+                    timeout=self.config['timeout'],
+                    allow_redirects=self.config['follow_redirects'],
+                    stream=True
+                )
+                content, size_error = self._read_response_body(response, max_file_size)
+                self._record_fetch(url, start_time, response.status_code, response.headers)
+            except Exception as e:
+                self._record_fetch(url, start_time, error=e)
+                if self._retry_later(url, depth, error=e):
+                    return None
+                raise
+
+            if self._retry_later(url, depth, response.status_code, response.headers):
+                return None
+
+            if size_error:
+                return self.seo_extractor.create_empty_result(url, depth, 0, size_error)
+
+            return self._build_page_result(
+                url, depth, response.status_code, response.headers,
+                content, response.encoding, start_time
+            )
 
-            # Determine if URL is internal
-            is_internal = self.link_manager.is_internal(url)
+        except Exception as e:
+            return self.seo_extractor.create_empty_result(url, depth, 0, str(e))
 
-            # Create result structure
-            result = {
-                'url': url,
-                'status_code': response.status_code,
-                'content_type': response.headers.get('content-type', '').split(';')[0],
-                'size': len(response.content),
-                'is_internal': is_internal,
-                'depth': depth,
-                'title': '',
-                'meta_description': '',
-                'h1': '',
-                'h2': [],
-                'h3': [],
-                'word_count': 0,
-                'meta_tags': {},
-                'og_tags': {},
-                'twitter_tags': {},
-                'canonical_url': '',
-                'lang': '',
-                'charset': '',
-                'viewport': '',
-                'robots': '',
-                'author': '',
-                'keywords': '',
-                'generator': '',
-                'theme_color': '',
-                'json_ld': [],
-                'analytics': {
-                    'google_analytics': False,
-                    'gtag': False,
-                    'ga4_id': '',
-                    'gtm_id': '',
-                    'facebook_pixel': False,
-                    'hotjar': False,
-                    'mixpanel': False
-                },
-                'images': [],
-                'external_links': 0,
-                'internal_links': 0,
-                'response_time': 0,
-                'redirects': [],
-                'hreflang': [],
-                'schema_org': [],
-                'linked_from': []
-            }
+    def _retry_later(self, url, depth, status_code=None, headers=None, error=None):
+        """
+        Queue a failed fetch for another attempt if the retry policy allows it.
+
+        Returns:
+            bool: True if the URL was queued for a retry, False if this outcome is final
+        """
+        retries = self.scheduler.get_retry_count(url)
+        if not self.is_running or not self.retry_policy.should_retry(retries, status_code, error):
+            self.scheduler.finish_retries(url, not self.retry_policy.is_retryable(status_code, error))
+            return False
+
+        retry_after = None
+        if headers is not None and status_code in OVERLOAD_STATUS_CODES:
+            retry_after = parse_retry_after(headers.get('retry-after'))
+        delay = self.retry_policy.get_delay(retries, status_code, retry_after)
+        if error is None:
+            reason = str(status_code)
+        else:
+            reason = type(error).__name__ if isinstance(error, Exception) else 'error'
 
-            # Only parse HTML content
-            if 'text/html' in response.headers.get('content-type', ''):
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Extract comprehensive data using SEO extractor
-                self.seo_extractor.extract_basic_seo_data(soup, result)
-                self.seo_extractor.extract_meta_tags(soup, result)
-                self.seo_extractor.extract_opengraph_tags(soup, result)
-                self.seo_extractor.extract_twitter_tags(soup, result)
-                self.seo_extractor.extract_json_ld(soup, result)
-                self.seo_extractor.extract_analytics_tracking(soup, response.text, result)
-                self.seo_extractor.extract_images(soup, url, result)
-                self.seo_extractor.extract_link_counts(soup, result, self.base_domain)
-                self.seo_extractor.extract_hreflang(soup, result)
-                self.seo_extractor.extract_schema_org(soup, result)
-
-                # Collect all links
-                self.link_manager.collect_all_links(soup, url, self.crawl_results)
-
-                # Extract links for further crawling
-                should_extract = (
-                    (is_internal and depth < self.config['max_depth']) or
-                    (self.config['crawl_external'] and depth < self.config['max_depth'])
-                )
+        self.scheduler.schedule_retry(url, depth, delay, reason)
+        print(f"Retrying {url} in {delay:.1f}s ({reason}, retry {retries + 1} of {self.retry_policy.max_retries})")
+        return True
 
-                if should_extract:
-                    self.link_manager.extract_links(soup, url, depth + 1, self._should_crawl_url)
+    def _record_fetch(self, url, fetch_start, status_code=None, headers=None, error=None):
+        """Report a fetch's latency and outcome to the scheduler's per-host concurrency control"""
+        timed_out = isinstance(error, (requests.exceptions.Timeout, asyncio.TimeoutError))
+        if error is not None and not timed_out:
+            return  # Other failures say nothing about server load
+
+        retry_after = None
+        if headers is not None and status_code in OVERLOAD_STATUS_CODES:
+            retry_after = parse_retry_after(headers.get('retry-after'))
+
+        self.scheduler.record_response(url, time.time() - fetch_start, status_code, timed_out, retry_after)
+
+    @staticmethod
+    def _read_response_body(response, max_file_size):
+        """
+        Read a streamed response body, aborting once it exceeds max_file_size.
+
+        Returns:
+            tuple: (content, error_message) - content is None when the size limit was hit
+        """
+        try:
+            content_length = response.headers.get('content-length')
+            if max_file_size > 0 and content_length and int(content_length) > max_file_size:
+                return None, f'File too large: {content_length} bytes'
+
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                total += len(chunk)
+                if max_file_size > 0 and total > max_file_size:
+                    return None, f'File too large: more than {max_file_size} bytes'
+                chunks.append(chunk)
+
+            return b''.join(chunks), None
+        finally:
+            # Releases the connection back to the pool (or drops it if the body was abandoned)
+            response.close()
+
+    async def _crawl_url_with_aiohttp(self, session, url, depth):
+        """
+        Crawl a single URL on the event loop using the shared aiohttp session.
+
+        Returns None when the fetch failed and was queued for a retry.
+        """
+        max_file_size = self.config.get('max_file_size', 0)
+        start_time = time.time()
 
-            # Populate linked_from after all link collection is complete
-            result['linked_from'] = self.link_manager.get_source_pages(url)
-            result['response_time'] = round((time.time() - start_time) * 1000, 2)
-            return result
+        try:
+            # Fetch the page
+            try:
+                async with session.get(
+                    url,
+                    allow_redirects=self.config['follow_redirects'],
+                    proxy=self.config['proxy_url'] if self.config['enable_proxy'] else None
+                ) as response:
+                    status_code = response.status
+                    headers = response.headers
+                    encoding = response.charset
+                    content = None
+                    size_error = None
+
+                    content_length = headers.get('content-length')
+                    if max_file_size > 0 and content_length and int(content_length) > max_file_size:
+                        size_error = f'File too large: {content_length} bytes'
+                    else:
+                        # Read the body in chunks so oversized pages without Content-Length are cut off
+                        chunks = []
+                        total = 0
+                        async for chunk in response.content.iter_chunked(64 * 1024):
+                            total += len(chunk)
+                            if max_file_size > 0 and total > max_file_size:
+                                size_error = f'File too large: more than {max_file_size} bytes'
+                                break
+                            chunks.append(chunk)
+                        if not size_error:
+                            content = b''.join(chunks)
+                self._record_fetch(url, start_time, status_code, headers)
+            except Exception as e:
+                self._record_fetch(url, start_time, error=e)
+                if self._retry_later(url, depth, error=e):
+                    return None
+                raise
+
+            if self._retry_later(url, depth, status_code, headers):
+                return None
+
+            if size_error:
+                return self.seo_extractor.create_empty_result(url, depth, 0, size_error)
+
+            # Parse off the event loop so in-flight fetches keep progressing
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._build_page_result,
+                url, depth, status_code, headers, content, encoding, start_time
+            )
 
         except Exception as e:
             return self.seo_extractor.create_empty_result(url, depth, 0, str(e))
 
+    def _parse_page(self, url, markup, encoding=None):
+        """
+        Extract page data, in the parse process pool when one is running.
+
+        Returns:
+            tuple: (extracted result fields, list of (href, anchor_text, placement))
+        """
+        args = (self.config.get('html_parser', 'lxml'), self.base_domain, url, markup, encoding)
+        if self.parse_pool:
+            # Waiting on the future releases the GIL, so fetch threads keep running meanwhile
+            return self.parse_pool.submit(extract_page_data, *args).result()
+        return extract_page_data(*args)
+
+    async def _parse_page_async(self, url, markup, encoding=None):
+        """Like _parse_page, but awaited so the event loop keeps running other pages meanwhile"""
+        args = (self.config.get('html_parser', 'lxml'), self.base_domain, url, markup, encoding)
+        if self.parse_pool:
+            return await asyncio.wrap_future(self.parse_pool.submit(extract_page_data, *args))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, extract_page_data, *args)
+
+    def _build_page_result(self, url, depth, status_code, headers, content, encoding, start_time):
+        """Build the result record for a fetched page and feed its links to the link manager"""
+        # Determine if URL is internal
+        is_internal = self.link_manager.is_internal(url)
+
+        # Create result structure
+        result = CrawlResult(
+            url=url,
+            status_code=status_code,
+            content_type=headers.get('content-type', '').split(';')[0],
+            size=len(content),
+            is_internal=is_internal,
+            depth=depth
+        )
+
+        # Only parse HTML content
+        if 'text/html' in headers.get('content-type', ''):
+            # Extract comprehensive data and the page's links in a single pass
+            fields, anchors = self._parse_page(url, content, encoding)
+            result.update(fields)
+
+            # Collect all links
+            self.link_manager.collect_all_links(anchors, url)
+
+            # Extract links for further crawling
+            should_extract = (
+                (is_internal and depth < self.config['max_depth']) or
+                (self.config['crawl_external'] and depth < self.config['max_depth'])
+            )
+
+            if should_extract:
+                self.link_manager.extract_links(anchors, url, depth + 1, self._should_crawl_url)
+
+        # Populate linked_from after all link collection is complete
+        result['linked_from'] = self.link_manager.get_source_pages(url)
+        result['linked_from_count'] = self.link_manager.get_in_degree(url)
+        result['response_time'] = round((time.time() - start_time) * 1000, 2)
+        return result
+
     async def _crawl_url_with_javascript(self, url, depth):
         """Crawl a single URL using JavaScript rendering"""
         start_time = time.time()
 
         try:
             # Render page with JavaScript
-            html_content, status_code, error = await self.js_renderer.render_page(url)
+            try:
+                html_content, status_code, error = await self.js_renderer.render_page(url)
+            except Exception as e:
+                self._record_fetch(url, start_time, error=e)
+                if self._retry_later(url, depth, error=e):
+                    return None
+                raise
+
+            # Report render timeouts as timeouts so the concurrency controller backs off on them
+            fetch_error = asyncio.TimeoutError(error) if error == RENDER_TIMEOUT_ERROR else error
+            self._record_fetch(url, start_time, status_code or None, error=fetch_error)
+
+            if self._retry_later(url, depth, status_code or None, error=fetch_error):
+                return None
 
             if error:
                 return self.seo_extractor.create_empty_result(url, depth, status_code, error)
@@ -633,69 +1003,22 @@ class WebCrawler:
             is_internal = self.link_manager.is_internal(url)
 
             # Create result structure
-            result = {
-                'url': url,
-                'status_code': status_code,
-                'content_type': 'text/html',
-                'size': len(html_content.encode('utf-8')),
-                'is_internal': is_internal,
-                'depth': depth,
-                'title': '',
-                'meta_description': '',
-                'h1': '',
-                'h2': [],
-                'h3': [],
-                'word_count': 0,
-                'meta_tags': {},
-                'og_tags': {},
-                'twitter_tags': {},
-                'canonical_url': '',
-                'lang': '',
-                'charset': '',
-                'viewport': '',
-                'robots': '',
-                'author': '',
-                'keywords': '',
-                'generator': '',
-                'theme_color': '',
-                'json_ld': [],
-                'analytics': {
-                    'google_analytics': False,
-                    'gtag': False,
-                    'ga4_id': '',
-                    'gtm_id': '',
-                    'facebook_pixel': False,
-                    'hotjar': False,
-                    'mixpanel': False
-                },
-                'images': [],
-                'external_links': 0,
-                'internal_links': 0,
-                'response_time': 0,
-                'redirects': [],
-                'hreflang': [],
-                'schema_org': [],
-                'linked_from': [],
-                'javascript_rendered': True
-            }
+            result = CrawlResult(
+                url=url,
+                status_code=status_code,
+                content_type='text/html',
+                size=len(html_content.encode('utf-8')),
+                is_internal=is_internal,
+                depth=depth,
+                javascript_rendered=True
+            )
 
-            # Parse HTML
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # Extract comprehensive data
-            self.seo_extractor.extract_basic_seo_data(soup, result)
-            self.seo_extractor.extract_meta_tags(soup, result)
-            self.seo_extractor.extract_opengraph_tags(soup, result)
-            self.seo_extractor.extract_twitter_tags(soup, result)
-            self.seo_extractor.extract_json_ld(soup, result)
-            self.seo_extractor.extract_analytics_tracking(soup, html_content, result)
-            self.seo_extractor.extract_images(soup, url, result)
-            self.seo_extractor.extract_link_counts(soup, result, self.base_domain)
-            self.seo_extractor.extract_hreflang(soup, result)
-            self.seo_extractor.extract_schema_org(soup, result)
+            # Extract comprehensive data and the page's links in a single pass
+            fields, anchors = await self._parse_page_async(url, html_content)
+            result.update(fields)
 
             # Collect all links
-            self.link_manager.collect_all_links(soup, url, self.crawl_results)
+            self.link_manager.collect_all_links(anchors, url)
 
             # Extract links for further crawling
             should_extract = (
@@ -704,10 +1027,11 @@ class WebCrawler:
             )
 
             if should_extract:
-                self.link_manager.extract_links(soup, url, depth + 1, self._should_crawl_url)
+                self.link_manager.extract_links(anchors, url, depth + 1, self._should_crawl_url)
 
             # Populate linked_from after all link collection is complete
             result['linked_from'] = self.link_manager.get_source_pages(url)
+            result['linked_from_count'] = self.link_manager.get_in_degree(url)
             result['response_time'] = round((time.time() - start_time) * 1000, 2)
 
             return result
@@ -732,20 +1056,19 @@ class WebCrawler:
 
                 # Submit new tasks - fill ALL available slots
                 while len(active_tasks) < max_workers:
-                    url_info = self.link_manager.get_next_url()
+                    url_info = self.scheduler.get_next_url()
                     if not url_info:
                         break
 
                     current_url, depth = url_info
 
                     if depth <= self.config['max_depth']:
-                        # SMOOTH RATE LIMITING: Only apply if delay > 0
-                        if self.config.get('delay', 0) > 0:
-                            self.rate_limiter.acquire()
-
                         # Create task
                         task = asyncio.create_task(self._crawl_url_with_javascript(current_url, depth))
+                        task.add_done_callback(lambda t, url=current_url: self.scheduler.release(url))
                         active_tasks.add(task)
+                    else:
+                        self.scheduler.release(current_url)
 
                 # Process completed tasks
                 if active_tasks:
@@ -755,24 +1078,16 @@ class WebCrawler:
                         try:
                             result = await task
                             if result:
-                                with self.results_lock:
-                                    self.crawl_results.append(result)
-                                    self.stats['crawled'] += 1
-                                    self.stats['depth'] = max(self.stats['depth'], result.get('depth', 0))
-                                    print(f"Added URL to results (JS): {result['url']} - Total in results: {len(self.crawl_results)}")
-
-                                # Detect issues
-                                self.issue_detector.detect_issues(result)
+                                self._store_result(result)
                         except Exception as e:
                             print(f"Error in async crawl task: {e}")
 
                 # Check completion
-                link_stats = self.link_manager.get_stats()
-                if link_stats['pending'] == 0 and len(active_tasks) == 0:
+                if len(active_tasks) == 0 and not self._has_pending_urls():
                     print("No more URLs to crawl")
                     break
 
-                await asyncio.sleep(0.001)
+                await asyncio.sleep(self._get_idle_sleep(active_tasks))
 
             # Run PageSpeed if enabled
             if self.config.get('enable_pagespeed', False):
@@ -789,6 +1104,93 @@ class WebCrawler:
             self.is_running = False
             print(f"Crawl completed. Discovered: {self.stats['discovered']}, Crawled: {self.stats['crawled']}")
 
+    async def _crawl_async_with_http(self):
+        """Async crawling loop that keeps many HTTP fetches in flight on one event loop"""
+        import aiohttp
+
+        max_in_flight = self.config.get('async_concurrency', 100)
+        connector = aiohttp.TCPConnector(limit=max_in_flight)
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=self.config['timeout'],
+            sock_read=self.config['timeout']
+        )
+        cookie_jar = None if self.config.get('allow_cookies', True) else aiohttp.DummyCookieJar()
+        active_tasks = set()
+
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers=dict(self.session.headers),
+                cookie_jar=cookie_jar,
+                trace_configs=[create_aiohttp_trace_config(self.pool_stats)]
+            ) as session:
+                while self.is_running:
+                    # Check if paused
+                    if self.is_paused:
+                        await asyncio.sleep(1)
+                        continue
+
+                    # Submit new tasks - fill ALL available slots without overshooting max_urls
+                    while (len(active_tasks) < max_in_flight and
+                           self.stats['crawled'] + len(active_tasks) < self.config['max_urls']):
+                        url_info = self.scheduler.get_next_url()
+                        if not url_info:
+                            break
+
+                        current_url, depth = url_info
+
+                        if depth > self.config['max_depth']:
+                            self.scheduler.release(current_url)
+                            continue
+
+                        task = asyncio.create_task(self._crawl_url_with_aiohttp(session, current_url, depth))
+                        task.add_done_callback(lambda t, url=current_url: self.scheduler.release(url))
+                        active_tasks.add(task)
+
+                    # Process completed tasks
+                    if active_tasks:
+                        done, active_tasks = await asyncio.wait(active_tasks, timeout=0.01, return_when=asyncio.FIRST_COMPLETED)
+
+                        for task in done:
+                            try:
+                                result = await task
+                                if result:
+                                    self._store_result(result)
+                            except Exception as e:
+                                print(f"Error in async crawl task: {e}")
+
+                    # Check for completion
+                    if self.stats['crawled'] >= self.config['max_urls']:
+                        print(f"Reached maximum URLs limit ({self.config['max_urls']})")
+                        break
+
+                    if len(active_tasks) == 0 and not self._has_pending_urls():
+                        print("No more URLs to crawl")
+                        break
+
+                    await asyncio.sleep(self._get_idle_sleep(active_tasks))
+
+                # Abandon in-flight fetches when stopped
+                for task in active_tasks:
+                    task.cancel()
+                if active_tasks:
+                    await asyncio.gather(*active_tasks, return_exceptions=True)
+
+            # Run PageSpeed if enabled
+            if self.config.get('enable_pagespeed', False):
+                print("Running PageSpeed analysis...")
+                self.is_running_pagespeed = True
+                self._run_pagespeed_analysis()
+                self.is_running_pagespeed = False
+
+        finally:
+            # Update all linked_from fields before completing
+            self._update_all_linked_from()
+
+            self.is_running = False
+            print(f"Crawl completed. Discovered: {self.stats['discovered']}, Crawled: {self.stats['crawled']}")
+
     def _update_all_linked_from(self):
         """Update linked_from field for all crawled URLs based on collected source_pages data"""
         print("Updating linked_from data for all URLs...")
@@ -799,74 +1201,28 @@ class WebCrawler:
             sources = self.link_manager.get_source_pages(url)
             if sources:
                 result['linked_from'] = sources
+                result['linked_from_count'] = self.link_manager.get_in_degree(url)
                 updated_count += 1
+        self.linked_from_version += 1
 
         print(f"Updated linked_from data for {updated_count} URLs")
 
     def _should_crawl_url(self, url):
         """Check if URL should be crawled based on settings"""
-        parsed = urlparse(url)
-
-        # Check external domain policy
-        if not self.config['crawl_external']:
-            if not self.link_manager.is_internal(url):
-                return False
-
-        # Check robots.txt
-        if self.config['respect_robots']:
-            if not self._check_robots_txt(url):
-                return False
-
-        # Check file extensions
-        path = parsed.path.lower()
-        if '.' in path:
-            extension = path.split('.')[-1]
-
-            if extension in self.config['exclude_extensions']:
-                return False
-
-            if self.config['include_extensions'] and extension not in self.config['include_extensions']:
-                return False
-
-        # Check URL patterns
-        if self.config['exclude_patterns']:
-            for pattern in self.config['exclude_patterns']:
-                if pattern and re.search(pattern, url):
-                    return False
-
-        if self.config['include_patterns']:
-            pattern_match = False
-            for pattern in self.config['include_patterns']:
-                if pattern and re.search(pattern, url):
-                    pattern_match = True
-                    break
-            if not pattern_match:
+        if not self.url_filter.is_allowed(url):
+            return False
+
+        # Check robots.txt from the cache only; unknown hosts are fetched in the
+        # background and their URLs checked by the scheduler once the rules arrive
+        if self.robots:
+            allowed = self.robots.is_allowed(url)
+            if allowed is False:
                 return False
+            if allowed is None:
+                self.robots.prefetch(url)
 
         return True
 
-    def _check_robots_txt(self, url):
-        """Check if URL is allowed by robots.txt"""
-        try:
-            parsed = urlparse(url)
-            robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-
-            if robots_url not in self._robots_cache:
-                rp = RobotFileParser()
-                rp.set_url(robots_url)
-                try:
-                    rp.read()
-                    self._robots_cache[robots_url] = rp
-                except:
-                    return True
-
-            rp = self._robots_cache[robots_url]
-            user_agent = self.config.get('user_agent', '*')
-            return rp.can_fetch(user_agent, url)
-
-        except Exception:
-            return True
-
     def _run_pagespeed_analysis(self):
         """Run PageSpeed analysis on selected pages"""
         try:
@@ -0,0 +1,233 @@
+"""Background export jobs: export files are written to disk off the request thread and downloaded when done"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from src.exporters import EXPORT_FILE_PREFIXES, RowSource, get_export_chunks
+
+
+# How long finished jobs and their files are kept for download
+EXPORT_JOB_TTL = 3600
+
+# Artifacts written at once across all jobs
+EXPORT_JOB_WORKERS = 4
+
+# Passes an exporter makes over its rows, where more than one (for progress)
+EXPORT_PASSES = {('issues', 'json'): 3}
+
+
+class ExportArtifact:
+    """One file of an export job: the urls, links or issues of a crawl"""
+
+    def __init__(self, dataset, source, fields=None, row_filter=None):
+        """
+        Args:
+            dataset: 'urls', 'links' or 'issues'
+            source: RowSource (or list) of the rows to export
+            fields: URL fields to export
+            row_filter: Optional predicate rows must pass (e.g. issue exclusion patterns)
+        """
+        self.dataset = dataset
+        self.source = source
+        self.fields = fields
+        self.row_filter = row_filter
+        self.filename = None
+        self.size = 0
+        self.rows_read = 0
+        self.expected_rows = len(source)
+
+    def _count_rows(self):
+        for row in self.source:
+            self.rows_read += 1
+            yield row
+
+    def write(self, directory, export_format, timestamp):
+        """Generate the file into directory"""
+        self.expected_rows = len(self.source) * EXPORT_PASSES.get((self.dataset, export_format), 1)
+
+        rows = RowSource(self._count_rows, len(self.source))
+        if self.row_filter:
+            counted = rows
+            rows = RowSource(lambda: (row for row in counted if self.row_filter(row)))
+
+        chunks, _, extension = get_export_chunks(self.dataset, export_format, rows, self.fields)
+        filename = f'{EXPORT_FILE_PREFIXES[self.dataset]}_{timestamp}.{extension}'
+        path = os.path.join(directory, filename)
+
+        with open(path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+
+        self.size = os.path.getsize(path)
+        self.filename = filename
+
+    def to_dict(self):
+        return {
+            'dataset': self.dataset,
+            'filename': self.filename,
+            'size': self.size,
+            'rows_read': self.rows_read,
+            'done': self.filename is not None
+        }
+
+
+class ExportJob:
+    """An export of one or more artifacts, written to its own temporary directory"""
+
+    def __init__(self, owner, export_format, artifacts, zip_files=False):
+        self.id = uuid.uuid4().hex
+        self.owner = owner
+        self.export_format = export_format
+        self.artifacts = artifacts
+        self.zip_files = zip_files
+        self.status = 'pending'
+        self.error = None
+        self.zip_filename = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.directory = tempfile.mkdtemp(prefix='librecrawl-export-')
+
+    def get_progress(self):
+        """Percentage of rows read across all artifacts"""
+        if self.status == 'completed':
+            return 100
+        expected = sum(artifact.expected_rows for artifact in self.artifacts)
+        read = sum(artifact.rows_read for artifact in self.artifacts)
+        return min(99, round(read / expected * 100, 1)) if expected else 0
+
+    def get_files(self):
+        """Names of the downloadable files once the job is done"""
+        if self.status != 'completed':
+            return []
+        if self.zip_filename:
+            return [self.zip_filename]
+        return [artifact.filename for artifact in self.artifacts]
+
+    def get_file_path(self, filename=None):
+        """Path of a finished file (the only file if filename is not given), or None"""
+        files = self.get_files()
+        if filename is None and len(files) == 1:
+            filename = files[0]
+        if filename not in files:
+            return None
+        return os.path.join(self.directory, filename)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'status': self.status,
+            'format': self.export_format,
+            'progress': self.get_progress(),
+            'error': self.error,
+            'artifacts': [artifact.to_dict() for artifact in self.artifacts],
+            'files': self.get_files(),
+            'created_at': self.created_at,
+            'finished_at': self.finished_at
+        }
+
+
+class ExportJobManager:
+    """
+    Runs export jobs in the background.
+
+    Each job gets a coordinator thread which writes the job's artifacts
+    concurrently on a shared pool, then zips them if asked. Finished jobs
+    are kept for EXPORT_JOB_TTL seconds for download.
+    """
+
+    def __init__(self, max_workers=EXPORT_JOB_WORKERS, ttl=EXPORT_JOB_TTL):
+        self.ttl = ttl
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='export')
+
+    def submit(self, owner, export_format, artifacts, zip_files=False):
+        """
+        Start an export job.
+
+        Args:
+            owner: User the job belongs to
+            export_format: 'csv', 'json' or 'xml'
+            artifacts: List of ExportArtifact
+            zip_files: Bundle the files into one zip archive
+
+        Returns:
+            ExportJob: The started job
+        """
+        job = ExportJob(owner, export_format, artifacts, zip_files)
+        with self.lock:
+            self.jobs[job.id] = job
+
+        threading.Thread(target=self._run_job, args=(job,), daemon=True).start()
+        print(f"Started export job {job.id} with {len(artifacts)} file(s)")
+        return job
+
+    def _run_job(self, job):
+        job.status = 'running'
+        timestamp = int(time.time())
+
+        try:
+            futures = [self.executor.submit(artifact.write, job.directory, job.export_format, timestamp)
+                       for artifact in job.artifacts]
+            wait(futures)
+            for future in futures:
+                future.result()
+
+            if job.zip_files:
+                self._zip_job(job, timestamp)
+
+            job.status = 'completed'
+            print(f"Export job {job.id} completed")
+        except Exception as e:
+            job.status = 'failed'
+            job.error = str(e)
+            print(f"Export job {job.id} failed: {e}")
+        finally:
+            job.finished_at = time.time()
+
+    def _zip_job(self, job, timestamp):
+        """Bundle a job's files into one archive, replacing the individual files"""
+        zip_filename = f'librecrawl_export_{timestamp}.zip'
+        with zipfile.ZipFile(os.path.join(job.directory, zip_filename), 'w', zipfile.ZIP_DEFLATED) as archive:
+            for artifact in job.artifacts:
+                path = os.path.join(job.directory, artifact.filename)
+                archive.write(path, artifact.filename)
+                os.remove(path)
+        job.zip_filename = zip_filename
+
+    def get_job(self, job_id, owner):
+        """Get a job if it belongs to owner"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if not job or job.owner != owner:
+            return None
+        return job
+
+    def delete_job(self, job_id, owner):
+        """Remove a finished job and its files"""
+        job = self.get_job(job_id, owner)
+        if not job or job.status in ('pending', 'running'):
+            return False
+        with self.lock:
+            self.jobs.pop(job_id, None)
+        shutil.rmtree(job.directory, ignore_errors=True)
+        return True
+
+    def cleanup_expired(self):
+        """Remove jobs that finished more than ttl seconds ago"""
+        now = time.time()
+        with self.lock:
+            expired = [job for job in self.jobs.values()
+                       if job.finished_at and now - job.finished_at > self.ttl]
+            for job in expired:
+                del self.jobs[job.id]
+
+        for job in expired:
+            shutil.rmtree(job.directory, ignore_errors=True)
+        if expired:
+            print(f"Cleaned up {len(expired)} expired export jobs")
@@ -0,0 +1,467 @@
+"""Streaming CSV, JSON and XML exporters for crawl urls, links and issues"""
+import csv
+import json
+import time
+import zlib
+import xml.etree.ElementTree as ET
+from io import StringIO
+from itertools import groupby, islice
+from textwrap import indent
+
+
+EXPORT_DATASETS = ('urls', 'links', 'issues')
+EXPORT_MIMETYPES = {'csv': 'text/csv', 'json': 'application/json', 'xml': 'application/xml',
+                    'parquet': 'application/vnd.apache.parquet'}
+EXPORT_FILE_PREFIXES = {'urls': 'librecrawl_export', 'links': 'librecrawl_links', 'issues': 'librecrawl_issues'}
+LINK_EXPORT_FIELDS = ['source_url', 'target_url', 'anchor_text', 'is_internal', 'target_domain', 'target_status', 'placement']
+ISSUE_EXPORT_FIELDS = ['url', 'type', 'category', 'issue', 'details']
+
+# Rows written between yielded chunks
+EXPORT_CHUNK_ROWS = 500
+
+# Rows per Parquet row group; each group is yielded as soon as it is written
+PARQUET_ROW_GROUP_ROWS = 10000
+
+
+class RowSource:
+    """
+    Re-iterable rows for an export, read again from factory on every pass.
+
+    count caps each pass, so exports of an append-only dataset that is still
+    growing stay consistent with the totals written in their headers.
+    """
+
+    def __init__(self, factory, count=None):
+        self.factory = factory
+        self.count = count
+
+    def __iter__(self):
+        return islice(self.factory(), self.count)
+
+    def __len__(self):
+        return self.count
+
+
+def format_csv_value(field, value):
+    """Flatten a URL field for a CSV cell"""
+    if field == 'analytics' and isinstance(value, dict):
+        analytics_list = []
+        if value.get('gtag') or value.get('ga4_id'): analytics_list.append('GA4')
+        if value.get('google_analytics'): analytics_list.append('GA')
+        if value.get('gtm_id'): analytics_list.append('GTM')
+        if value.get('facebook_pixel'): analytics_list.append('FB')
+        if value.get('hotjar'): analytics_list.append('HJ')
+        if value.get('mixpanel'): analytics_list.append('MP')
+        return ', '.join(analytics_list)
+    elif field == 'og_tags' and isinstance(value, dict):
+        return f"{len(value)} tags" if value else ''
+    elif field == 'twitter_tags' and isinstance(value, dict):
+        return f"{len(value)} tags" if value else ''
+    elif field == 'json_ld' and isinstance(value, list):
+        return f"{len(value)} scripts" if value else ''
+    elif field == 'images' and isinstance(value, list):
+        return f"{len(value)} images" if value else ''
+    elif field == 'internal_links' and isinstance(value, (int, float)):
+        return f"{int(value)} internal links" if value else '0 internal links'
+    elif field == 'external_links' and isinstance(value, (int, float)):
+        return f"{int(value)} external links" if value else '0 external links'
+    elif field == 'h2' and isinstance(value, list):
+        return ', '.join(value[:3]) + ('...' if len(value) > 3 else '')
+    elif field == 'h3' and isinstance(value, list):
+        return ', '.join(value[:3]) + ('...' if len(value) > 3 else '')
+    elif isinstance(value, (dict, list)):
+        return str(value)
+    return value
+
+
+def _csv_chunks(rows, fieldnames, to_row):
+    """Write rows through csv.DictWriter, yielding the text every EXPORT_CHUNK_ROWS rows"""
+    output = StringIO()
+    writer = csv.DictWriter(output, fieldnames=fieldnames)
+    writer.writeheader()
+
+    for count, item in enumerate(rows, 1):
+        writer.writerow(to_row(item))
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+
+    chunk = output.getvalue()
+    if chunk:
+        yield chunk
+
+
+def _json_array_chunks(items, level):
+    """Stream a JSON array laid out the way json.dumps(indent=2) lays it out at the given nesting level"""
+    pad = '  ' * (level + 1)
+    yield '['
+    chunk = []
+    separator = '\n'
+    for item in items:
+        chunk.append(separator + indent(json.dumps(item, indent=2, default=str), pad))
+        separator = ',\n'
+        if len(chunk) >= EXPORT_CHUNK_ROWS:
+            yield ''.join(chunk)
+            chunk = []
+
+    if separator == '\n':
+        yield ']'
+    else:
+        yield ''.join(chunk) + '\n' + '  ' * level + ']'
+
+
+def _json_header(values):
+    """Opening of a JSON object holding values, ready for more keys to follow"""
+    return json.dumps(values, indent=2)[:-2] + ',\n'
+
+
+def iter_csv_export(urls, fields):
+    """Stream the URL export as CSV"""
+    return _csv_chunks(urls, fields,
+                       lambda url_data: {field: format_csv_value(field, url_data.get(field, '')) for field in fields})
+
+
+def iter_json_export(urls, fields):
+    """Stream the URL export as JSON (urls must support len())"""
+    yield _json_header({
+        'export_date': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'total_urls': len(urls),
+        'fields': fields
+    }) + '  "data": '
+    yield from _json_array_chunks(({field: url_data.get(field, '') for field in fields} for url_data in urls), 1)
+    yield '\n}'
+
+
+def iter_xml_export(urls, fields):
+    """Stream the URL export as XML, one <url> element at a time (urls must support len())"""
+    yield (f'<librecrawl_export export_date="{time.strftime("%Y-%m-%d %H:%M:%S")}" '
+           f'total_urls="{len(urls)}"><urls>')
+
+    chunk = []
+    for url_data in urls:
+        url_element = ET.Element('url')
+        for field in fields:
+            field_element = ET.SubElement(url_element, field)
+            field_element.text = str(url_data.get(field, ''))
+        chunk.append(ET.tostring(url_element, encoding='unicode'))
+        if len(chunk) >= EXPORT_CHUNK_ROWS:
+            yield ''.join(chunk)
+            chunk = []
+
+    yield ''.join(chunk) + '</urls></librecrawl_export>'
+
+
+def _link_csv_row(link):
+    return {
+        'source_url': link.get('source_url', ''),
+        'target_url': link.get('target_url', ''),
+        'anchor_text': link.get('anchor_text', ''),
+        'is_internal': 'Yes' if link.get('is_internal') else 'No',
+        'target_domain': link.get('target_domain', ''),
+        'target_status': link.get('target_status', 'Not crawled'),
+        'placement': link.get('placement', 'body')
+    }
+
+
+def iter_links_csv_export(links):
+    """Stream the links export as CSV"""
+    return _csv_chunks(links, LINK_EXPORT_FIELDS, _link_csv_row)
+
+
+def iter_links_json_export(links):
+    """Stream the links export as a JSON array"""
+    return _json_array_chunks(links, 0)
+
+
+def iter_issues_csv_export(issues):
+    """Stream the issues export as CSV"""
+    return _csv_chunks(issues, ISSUE_EXPORT_FIELDS,
+                       lambda issue: {field: issue.get(field, '') for field in ISSUE_EXPORT_FIELDS})
+
+
+def iter_issues_json_export(issues):
+    """
+    Stream the issues export as JSON, grouped by URL and as a flat list.
+
+    Makes three passes over issues, so it must be re-iterable (a list or a
+    RowSource). Each URL's issues are detected together, so in crawl order
+    they are adjacent and are grouped without holding them all in memory;
+    issues in any other order (local data, a resorted store) are grouped
+    in a dict instead, so no URL key is written twice.
+    """
+    total_issues = 0
+    urls_with_issues = set()
+    adjacent = True
+    last_url = None
+    for issue in issues:
+        total_issues += 1
+        url = issue.get('url', '')
+        if url != last_url:
+            if url in urls_with_issues:
+                adjacent = False
+            urls_with_issues.add(url)
+            last_url = url
+
+    yield _json_header({
+        'export_date': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'total_issues': total_issues,
+        'total_urls_with_issues': len(urls_with_issues)
+    }) + '  "issues_by_url": {'
+    del urls_with_issues
+
+    if adjacent:
+        groups = groupby(issues, key=lambda issue: issue.get('url', ''))
+    else:
+        groups = {}
+        for issue in issues:
+            groups.setdefault(issue.get('url', ''), []).append(issue)
+        groups = groups.items()
+
+    separator = '\n'
+    for url, url_issues in groups:
+        grouped = {url: [{
+            'type': issue.get('type', ''),
+            'category': issue.get('category', ''),
+            'issue': issue.get('issue', ''),
+            'details': issue.get('details', '')
+        } for issue in url_issues]}
+        # Drop the wrapping braces and nest the "url": [...] entry one level deeper
+        yield separator + indent(json.dumps(grouped, indent=2)[2:-2], '  ')
+        separator = ',\n'
+
+    yield ('}' if separator == '\n' else '\n  }') + ',\n  "all_issues": '
+    yield from _json_array_chunks(issues, 1)
+    yield '\n}'
+
+
+class _ChunkSink:
+    """Write-only file object collecting what a Parquet writer writes until it is taken"""
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def take(self):
+        data = b''.join(self.parts)
+        self.parts = []
+        return data
+
+
+def _parquet_schema(pa, dataset, fields):
+    """Arrow schema for a dataset; URL fields without a known type are exported as strings"""
+    if dataset == 'links':
+        return pa.schema([
+            ('source_url', pa.string()),
+            ('target_url', pa.string()),
+            ('anchor_text', pa.string()),
+            ('is_internal', pa.bool_()),
+            ('target_domain', pa.string()),
+            ('target_status', pa.int32()),
+            ('placement', pa.string())
+        ])
+    if dataset == 'issues':
+        return pa.schema([(field, pa.string()) for field in ISSUE_EXPORT_FIELDS])
+
+    string_map = pa.map_(pa.string(), pa.string())
+    url_types = {
+        'status_code': pa.int32(),
+        'size': pa.int64(),
+        'is_internal': pa.bool_(),
+        'depth': pa.int32(),
+        'h2': pa.list_(pa.string()),
+        'h3': pa.list_(pa.string()),
+        'word_count': pa.int32(),
+        'meta_tags': string_map,
+        'og_tags': string_map,
+        'twitter_tags': string_map,
+        'json_ld': pa.list_(pa.string()),  # Arbitrary JSON, kept as JSON text
+        'analytics': pa.struct([
+            ('google_analytics', pa.bool_()),
+            ('gtag', pa.bool_()),
+            ('ga4_id', pa.string()),
+            ('gtm_id', pa.string()),
+            ('facebook_pixel', pa.bool_()),
+            ('hotjar', pa.bool_()),
+            ('mixpanel', pa.bool_())
+        ]),
+        'images': pa.list_(pa.struct([
+            ('src', pa.string()), ('alt', pa.string()), ('width', pa.string()), ('height', pa.string())
+        ])),
+        'external_links': pa.int32(),
+        'internal_links': pa.int32(),
+        'response_time': pa.float64(),
+        'redirects': pa.list_(pa.string()),
+        'hreflang': pa.list_(pa.struct([('lang', pa.string()), ('url', pa.string())])),
+        'schema_org': pa.list_(pa.struct([('type', pa.string()), ('properties', string_map)])),
+        'linked_from': pa.list_(pa.string()),
+        'linked_from_count': pa.int32(),
+        'javascript_rendered': pa.bool_()
+    }
+    return pa.schema([(field, url_types.get(field, pa.string())) for field in fields])
+
+
+def _to_arrow_value(pa, value, arrow_type):
+    """Coerce a crawl value to what an Arrow column of arrow_type accepts (None when it does not fit)"""
+    if value is None:
+        return None
+    try:
+        if pa.types.is_string(arrow_type):
+            if isinstance(value, str):
+                return value
+            return json.dumps(value, default=str) if isinstance(value, (dict, list, tuple)) else str(value)
+        if pa.types.is_boolean(arrow_type):
+            return bool(value)
+        if pa.types.is_integer(arrow_type):
+            return int(value) if value != '' else None
+        if pa.types.is_floating(arrow_type):
+            return float(value) if value != '' else None
+        if pa.types.is_map(arrow_type):
+            if not isinstance(value, dict):
+                return None
+            return [(str(key), _to_arrow_value(pa, item, arrow_type.item_type)) for key, item in value.items()]
+        if pa.types.is_list(arrow_type):
+            if not isinstance(value, (list, tuple)):
+                return None
+            return [_to_arrow_value(pa, item, arrow_type.value_type) for item in value]
+        if pa.types.is_struct(arrow_type):
+            if not isinstance(value, dict):
+                return None
+            return {field.name: _to_arrow_value(pa, value.get(field.name), field.type) for field in arrow_type}
+    except (TypeError, ValueError):
+        return None
+    return value
+
+
+def iter_parquet_export(dataset, rows, fields=None):
+    """
+    Stream a dataset as a Parquet file with typed columns, one row group at a time.
+    """
+    # Imported here so the server and its parse workers only load pyarrow once a Parquet export runs
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema(pa, dataset, fields if dataset == 'urls' else None)
+
+    def generate():
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression='zstd')
+        columns = {field.name: [] for field in schema}
+        count = 0
+
+        def write_row_group():
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            for values in columns.values():
+                values.clear()
+
+        for row in rows:
+            for field in schema:
+                columns[field.name].append(_to_arrow_value(pa, row.get(field.name), field.type))
+            count += 1
+            if count % PARQUET_ROW_GROUP_ROWS == 0:
+                write_row_group()
+                yield sink.take()
+
+        if count % PARQUET_ROW_GROUP_ROWS:
+            write_row_group()
+        writer.close()
+        yield sink.take()
+
+    return generate()
+
+
+def get_export_chunks(dataset, export_format, rows, fields=None):
+    """
+    Pick the streaming exporter for a dataset and format.
+
+    Args:
+        dataset: 'urls', 'links' or 'issues'
+        export_format: 'csv', 'json', 'xml' or 'parquet' (links and issues fall back to CSV for XML)
+        rows: Rows to export; urls need len() for JSON/XML, issues must be re-iterable for JSON
+        fields: URL fields to export
+
+    Returns:
+        tuple: (iterator of text chunks, or bytes for Parquet, mimetype, file extension)
+    """
+    if export_format not in EXPORT_MIMETYPES:
+        raise ValueError('Unsupported export format')
+
+    if export_format == 'parquet':
+        if dataset not in EXPORT_DATASETS:
+            raise ValueError(f"Unknown dataset: {dataset}")
+        chunks = iter_parquet_export(dataset, rows, fields)
+    elif dataset == 'urls':
+        exporters = {'csv': iter_csv_export, 'json': iter_json_export, 'xml': iter_xml_export}
+        chunks = exporters[export_format](rows, fields)
+    elif dataset in ('links', 'issues'):
+        if export_format == 'xml':
+            export_format = 'csv'
+        if dataset == 'links':
+            exporter = iter_links_json_export if export_format == 'json' else iter_links_csv_export
+        else:
+            exporter = iter_issues_json_export if export_format == 'json' else iter_issues_csv_export
+        chunks = exporter(rows)
+    else:
+        raise ValueError(f"Unknown dataset: {dataset}")
+
+    return chunks, EXPORT_MIMETYPES[export_format], export_format
+
+
+def gzip_chunks(chunks, level=6):
+    """Compress a stream of text (or bytes) chunks into gzip file bytes"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def generate_csv_export(urls, fields):
+    """Generate CSV export content"""
+    return ''.join(iter_csv_export(urls, fields))
+
+
+def generate_json_export(urls, fields):
+    """Generate JSON export content"""
+    return ''.join(iter_json_export(urls, fields))
+
+
+def generate_xml_export(urls, fields):
+    """Generate XML export content"""
+    return ''.join(iter_xml_export(urls, fields))
+
+
+def generate_links_csv_export(links):
+    """Generate CSV export for links data"""
+    return ''.join(iter_links_csv_export(links))
+
+
+def generate_links_json_export(links):
+    """Generate JSON export for links data"""
+    return ''.join(iter_links_json_export(links))
+
+
+def generate_issues_csv_export(issues):
+    """Generate CSV export for issues data"""
+    return ''.join(iter_issues_csv_export(issues))
+
+
+def generate_issues_json_export(issues):
+    """Generate JSON export for issues data"""
+    return ''.join(iter_issues_json_export(issues))
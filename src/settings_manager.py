@@ -26,7 +26,7 @@ class SettingsManager:
         # user: Crawler, Export, Issue Exclusion tabs
         user_settings = [
             # Crawler tab
-            'maxDepth', 'maxUrls', 'crawlDelay', 'followRedirects', 'crawlExternalLinks',
+            'maxDepth', 'maxUrls', 'crawlDelay', 'crawlBurst', 'followRedirects', 'crawlExternalLinks',
             # Export tab
             'exportFormat', 'exportFields',
             # Issues tab
@@ -76,6 +76,7 @@ class SettingsManager:
             'maxDepth': 3,
             'maxUrls': 5000000,
             'crawlDelay': 1,
+            'crawlBurst': 1,
             'followRedirects': True,
             'crawlExternalLinks': False,
 
@@ -103,6 +104,14 @@ class SettingsManager:
 
             # Advanced settings
             'concurrency': 5,
+            'fetchEngine': 'threads',
+            'asyncConcurrency': 100,
+            'adaptiveConcurrency': True,
+            'htmlParser': 'lxml',
+            'parseWorkers': 0,
+            'linkedFromLimit': 1000,
+            'frontierMode': 'memory',
+            'persistResults': True,
             'memoryLimit': 512,
             'logLevel': 'INFO',
             'saveSession': False,
@@ -422,10 +431,14 @@ class SettingsManager:
                 'maxDepth': (1, 10),
                 'maxUrls': (1, 5000000),
                 'crawlDelay': (0, 60),
+                'crawlBurst': (1, 100),
                 'timeout': (1, 120),
                 'retries': (0, 10),
                 'maxFileSize': (1, 1000),
                 'concurrency': (1, 50),
+                'asyncConcurrency': (1, 1000),
+                'parseWorkers': (0, 64),
+                'linkedFromLimit': (0, 100000),
                 'memoryLimit': (64, 4096),
                 'jsWaitTime': (0, 30),
                 'jsTimeout': (5, 120),
@@ -446,6 +459,18 @@ class SettingsManager:
                 if key in settings and not settings[key].strip():
                     return False
 
+            # Validate fetch engine choice
+            if settings.get('fetchEngine') not in ('threads', 'async'):
+                return False
+
+            # Validate HTML parser backend
+            if settings.get('htmlParser') not in ('lxml', 'html.parser'):
+                return False
+
+            # Validate frontier storage choice
+            if settings.get('frontierMode') not in ('memory', 'disk'):
+                return False
+
             # Validate export fields is a list
             if 'exportFields' in settings and not isinstance(settings['exportFields'], list):
                 return False
@@ -473,6 +498,7 @@ class SettingsManager:
             'max_depth': settings['maxDepth'],
             'max_urls': settings['maxUrls'],
             'delay': settings['crawlDelay'],
+            'burst': settings['crawlBurst'],
             'follow_redirects': settings['followRedirects'],
             'crawl_external': settings['crawlExternalLinks'],
             'user_agent': settings['userAgent'],
@@ -487,6 +513,14 @@ class SettingsManager:
             'exclude_patterns': [p.strip() for p in settings['excludePatterns'].split('\n') if p.strip()],
             'max_file_size': settings['maxFileSize'] * 1024 * 1024,  # Convert MB to bytes
             'concurrency': settings['concurrency'],
+            'fetch_engine': settings['fetchEngine'],
+            'async_concurrency': settings['asyncConcurrency'],
+            'adaptive_concurrency': settings['adaptiveConcurrency'],
+            'html_parser': settings['htmlParser'],
+            'parse_workers': settings['parseWorkers'],
+            'linked_from_limit': settings['linkedFromLimit'],
+            'frontier_mode': settings['frontierMode'],
+            'persist_results': settings['persistResults'],
             'memory_limit': settings['memoryLimit'] * 1024 * 1024,  # Convert MB to bytes
             'log_level': settings['logLevel'],
             'enable_proxy': settings['enableProxy'],
@@ -7,6 +7,8 @@ let crawlState = {
     urls: [],
     links: [],
     issues: [],
+    cursor: null,  // Last /api/crawl_status cursor, so polls only fetch new data
+    eventSource: null,  // Open /api/crawl_events stream, if any
     stats: {
         discovered: 0,
         crawled: 0,
@@ -222,8 +224,8 @@ function startPythonCrawl(url) {
             updateStatus('Crawling in progress...');
             // Refresh user info to update crawl count
             loadUserInfo();
-            // Start polling for updates
-            pollCrawlProgress();
+            // Start receiving updates (pushed when supported, polled otherwise)
+            listenCrawlProgress();
         } else {
             updateStatus('Error: ' + data.error);
             stopCrawl();
@@ -249,10 +251,58 @@ function stopPythonCrawl() {
     });
 }
 
+function listenCrawlProgress() {
+    if (!window.EventSource) {
+        pollCrawlProgress();
+        return;
+    }
+
+    let eventsUrl = '/api/crawl_events';
+    if (crawlState.cursor) {
+        eventsUrl += '?' + new URLSearchParams(crawlState.cursor).toString();
+    }
+
+    const source = new EventSource(eventsUrl);
+    crawlState.eventSource = source;
+
+    source.addEventListener('crawl', event => {
+        const data = JSON.parse(event.data);
+        updateCrawlData(data);
+
+        if (data.is_running_pagespeed) {
+            updateStatus('Running PageSpeed analysis...');
+        } else if (data.status === 'running') {
+            updateStatus('Crawling in progress...');
+        }
+    });
+
+    source.addEventListener('done', () => {
+        source.close();
+        crawlState.eventSource = null;
+        if (crawlState.isRunning) {
+            stopCrawl();
+            updateStatus('Crawl completed');
+        }
+        syncFinalCrawlData();
+    });
+
+    source.onerror = () => {
+        // Fall back to polling from the last cursor if the stream drops
+        source.close();
+        crawlState.eventSource = null;
+        pollCrawlProgress();
+    };
+}
+
 function pollCrawlProgress() {
     if (!crawlState.isRunning) return;
 
-    fetch('/api/crawl_status')
+    let statusUrl = '/api/crawl_status';
+    if (crawlState.cursor) {
+        statusUrl += '?' + new URLSearchParams(crawlState.cursor).toString();
+    }
+
+    fetch(statusUrl)
         .then(response => response.json())
         .then(data => {
             updateCrawlData(data);
@@ -269,6 +319,7 @@ function pollCrawlProgress() {
             } else if (data.status === 'completed') {
                 stopCrawl();
                 updateStatus('Crawl completed');
+                syncFinalCrawlData();
             }
         })
         .catch(error => {
@@ -276,6 +327,45 @@ function pollCrawlProgress() {
         });
 }
 
+function syncFinalCrawlData() {
+    // Delta polls never resend URLs or links, but linked_from is finalized when the crawl ends
+    // and links sent before their target was crawled still lack its status
+    fetch('/api/crawl_status')
+        .then(response => response.json())
+        .then(data => {
+            if (!data.urls) return;
+            const finalUrls = new Map(data.urls.map(url => [url.url, url]));
+            crawlState.urls.forEach(url => {
+                const finalUrl = finalUrls.get(url.url);
+                if (finalUrl) {
+                    url.linked_from = finalUrl.linked_from;
+                    url.linked_from_count = finalUrl.linked_from_count;
+                }
+            });
+
+            let statusesChanged = false;
+            crawlState.links.forEach(link => {
+                const target = finalUrls.get(link.target_url);
+                if (target && link.target_status !== target.status_code) {
+                    link.target_status = target.status_code;
+                    statusesChanged = true;
+                }
+            });
+            if (statusesChanged) {
+                if (isLinksTabActive()) {
+                    applyLinksFilter();
+                } else {
+                    crawlState.pendingLinks = crawlState.links;
+                }
+            }
+
+            crawlState.cursor = data.cursor || null;
+        })
+        .catch(error => {
+            console.error('Error syncing final crawl data:', error);
+        });
+}
+
 function updateCrawlData(data) {
     // Update statistics
     crawlState.stats = data.stats || crawlState.stats;
@@ -293,27 +383,32 @@ function updateCrawlData(data) {
         });
     }
 
+    // Delta responses only carry links and issues added since the last poll
+    const links = data.delta ? crawlState.links.concat(data.links || []) : data.links;
+    const issues = data.delta ? crawlState.issues.concat(data.issues || []) : data.issues;
+    crawlState.cursor = data.cursor || null;
+
     // Update links tables only if Links tab is active to improve performance
-    if (data.links) {
+    if (links && (!data.delta || data.links.length > 0)) {
         // Always store links data in crawlState
-        crawlState.links = data.links;
+        crawlState.links = links;
         if (isLinksTabActive()) {
-            updateLinksTable(data.links);
+            updateLinksTable(links);
         } else {
             // Store in pendingLinks for lazy loading when switching to tab
-            crawlState.pendingLinks = data.links;
+            crawlState.pendingLinks = links;
         }
     }
 
     // Update issues table only if Issues tab is active
-    if (data.issues) {
+    if (issues && (!data.delta || data.issues.length > 0)) {
         // Always store issues data in crawlState
-        crawlState.issues = data.issues;
+        crawlState.issues = issues;
         if (isIssuesTabActive()) {
-            updateIssuesTable(data.issues);
+            updateIssuesTable(issues);
         } else {
             // Store in pendingIssues for lazy loading when switching to tab
-            crawlState.pendingIssues = data.issues;
+            crawlState.pendingIssues = issues;
         }
     }
 
@@ -765,6 +860,7 @@ function clearAllTables() {
     if (statusCodesBody) statusCodesBody.innerHTML = '';
 
     crawlState.urls = [];
+    crawlState.cursor = null;
 
     console.log('All tables cleared');
 }
@@ -1234,96 +1330,59 @@ async function exportData() {
         const exportFormat = settings.exportFormat || 'csv';
         const exportFields = settings.exportFields || ['url', 'status_code', 'title', 'meta_description', 'h1'];
 
-        // Check if there's data to export - always fetch fresh data from backend
-        let hasData = false;
-        let exportUrls = [];
-        let exportLinks = [];
-        let exportIssues = [];
-
-        // Always fetch from backend to ensure we have the latest data including links
-        const status = await fetch('/api/crawl_status');
-        const statusData = await status.json();
-
-        if (statusData.urls && statusData.urls.length > 0) {
-            hasData = true;
-            exportUrls = statusData.urls;
-            exportLinks = statusData.links || [];
-            exportIssues = statusData.issues || [];
-        } else if (crawlState.urls && crawlState.urls.length > 0) {
-            // Fallback to local state if backend has no data (e.g., loaded crawl)
-            hasData = true;
-            exportUrls = crawlState.urls;
-            // Get links and issues from stored state
-            exportLinks = crawlState.links || [];
-            exportIssues = crawlState.issues || window.currentIssues || [];
-        }
+        // Export the backend crawl; fall back to local state if the backend has no data (e.g., loaded crawl)
+        const hasRegularFields = exportFields.some(field => field !== 'issues_detected' && field !== 'links_detailed');
+        const fileCount = [hasRegularFields, exportFields.includes('issues_detected'), exportFields.includes('links_detailed')]
+            .filter(Boolean).length;
+        const jobRequest = {
+            format: exportFormat,
+            fields: exportFields,
+            // Several files come back as one zip archive
+            zip: fileCount > 1
+        };
 
-        if (!hasData) {
-            showNotification('No crawl data to export', 'error');
-            return;
+        if (!(await hasBackendCrawlData())) {
+            if (!crawlState.urls || crawlState.urls.length === 0) {
+                showNotification('No crawl data to export', 'error');
+                return;
+            }
+            jobRequest.localData = {
+                urls: crawlState.urls,
+                links: crawlState.links || [],
+                issues: crawlState.issues || window.currentIssues || []
+            };
         }
 
         showNotification('Preparing export...', 'info');
 
-        // Request export from backend, including local data if available
-        const exportResponse = await fetch('/api/export_data', {
+        // Exports run as background jobs on the server; poll until the files are ready
+        const jobResponse = await fetch('/api/export_jobs', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
             },
-            body: JSON.stringify({
-                format: exportFormat,
-                fields: exportFields,
-                // Send local data if we have it (for loaded crawls)
-                localData: {
-                    urls: exportUrls,
-                    links: exportLinks,
-                    issues: exportIssues
-                }
-            })
+            body: JSON.stringify(jobRequest)
         });
+        const jobData = await jobResponse.json();
 
-        const exportData = await exportResponse.json();
+        if (!jobData.success) {
+            showNotification(jobData.error || 'Export failed', 'error');
+            return;
+        }
 
-        if (!exportData.success) {
-            showNotification(exportData.error || 'Export failed', 'error');
+        const job = await waitForExportJob(jobData.job.id);
+        if (!job || job.status !== 'completed') {
+            showNotification((job && job.error) || 'Export failed', 'error');
             return;
         }
 
-        // Check if we have multiple files to download
-        if (exportData.multiple_files && exportData.files) {
-            // Download each file separately
-            exportData.files.forEach((file, index) => {
-                setTimeout(() => {
-                    const blob = new Blob([file.content], { type: file.mimetype });
-                    const url = window.URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.style.display = 'none';
-                    a.href = url;
-                    a.download = file.filename;
-                    document.body.appendChild(a);
-                    a.click();
-                    window.URL.revokeObjectURL(url);
-                    document.body.removeChild(a);
-                }, index * 500); // Delay between downloads to avoid browser blocking
-            });
+        job.files.forEach((filename, index) => {
+            setTimeout(() => {
+                downloadExportFile(`/api/export_jobs/${job.id}/download?file=${encodeURIComponent(filename)}`);
+            }, index * 500); // Delay between downloads to avoid browser blocking
+        });
 
-            showNotification(`Exporting ${exportData.files.length} files...`, 'success');
-        } else {
-            // Single file download (original logic)
-            const blob = new Blob([exportData.content], { type: exportData.mimetype });
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.style.display = 'none';
-            a.href = url;
-            a.download = exportData.filename;
-            document.body.appendChild(a);
-            a.click();
-            window.URL.revokeObjectURL(url);
-            document.body.removeChild(a);
-
-            showNotification(`Export complete: ${exportData.filename}`, 'success');
-        }
+        showNotification(job.files.length > 1 ? `Exporting ${job.files.length} files...` : `Export complete: ${job.files[0]}`, 'success');
 
     } catch (error) {
         console.error('Export error:', error);
@@ -1331,6 +1390,49 @@ async function exportData() {
     }
 }
 
+// Check whether the backend holds crawl results for this session
+async function hasBackendCrawlData() {
+    const response = await fetch('/api/query/urls?page_size=1');
+    const data = await response.json();
+    return data.success && data.total > 0;
+}
+
+// Poll an export job, showing its progress in the status bar, until it finishes
+async function waitForExportJob(jobId) {
+    const previousStatus = document.getElementById('statusText').textContent;
+
+    try {
+        while (true) {
+            const response = await fetch(`/api/export_jobs/${jobId}`);
+            const data = await response.json();
+            if (!data.success) {
+                return null;
+            }
+
+            const job = data.job;
+            if (job.status === 'completed' || job.status === 'failed') {
+                return job;
+            }
+
+            updateStatus(`Exporting... ${Math.round(job.progress)}%`);
+            await new Promise(resolve => setTimeout(resolve, 1000));
+        }
+    } finally {
+        updateStatus(previousStatus);
+    }
+}
+
+// Start a browser download of a streamed export (the server names the file)
+function downloadExportFile(href) {
+    const a = document.createElement('a');
+    a.style.display = 'none';
+    a.href = href;
+    a.download = '';
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
+}
+
 // Helper function to escape HTML for safe display
 function escapeHtml(text) {
     if (!text) return text;
@@ -1360,6 +1462,9 @@ function showUrlDetails(url) {
     const safeGa4Id = escapeHtml(urlData.analytics?.ga4_id) || 'N/A';
     const safeGtmId = escapeHtml(urlData.analytics?.gtm_id) || 'N/A';
 
+    // linked_from may be a sample; linked_from_count is the exact number of linking pages
+    const linkedFromCount = urlData.linked_from_count || (urlData.linked_from ? urlData.linked_from.length : 0);
+
     // Create modal content
     const modalContent = `
         <div class="details-modal-overlay" onclick="closeUrlDetails()">
@@ -1448,7 +1553,7 @@ function showUrlDetails(url) {
                         <div class="details-section">
                             <h4>🔗 Linked From</h4>
                             <div class="details-grid">
-                                <div><strong>Found on ${urlData.linked_from.length} page${urlData.linked_from.length !== 1 ? 's' : ''}:</strong></div>
+                                <div><strong>Found on ${linkedFromCount} page${linkedFromCount !== 1 ? 's' : ''}:</strong></div>
                             </div>
                             <div class="details-subsection">
                                 <ul style="list-style: none; padding: 0; margin: 10px 0;">
@@ -1456,7 +1561,7 @@ function showUrlDetails(url) {
                                         const escapedUrl = escapeHtml(sourceUrl);
                                         return `<li style="padding: 5px 0; word-break: break-all;"><a href="${escapedUrl}" target="_blank" style="color: #8b5cf6; text-decoration: none;">${escapedUrl}</a></li>`;
                                     }).join('')}
-                                    ${urlData.linked_from.length > 20 ? `<li style="padding: 5px 0; font-style: italic; color: #9ca3af;">... and ${urlData.linked_from.length - 20} more</li>` : ''}
+                                    ${linkedFromCount > 20 ? `<li style="padding: 5px 0; font-style: italic; color: #9ca3af;">... and ${linkedFromCount - 20} more</li>` : ''}
                                 </ul>
                             </div>
                         </div>
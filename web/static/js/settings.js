@@ -5,6 +5,7 @@ let defaultSettings = {
     maxDepth: 3,
     maxUrls: 5000000,
     crawlDelay: 1,
+    crawlBurst: 1,
     followRedirects: true,
     crawlExternalLinks: false,
 
@@ -32,6 +33,14 @@ let defaultSettings = {
 
     // Advanced settings
     concurrency: 5,
+    fetchEngine: 'threads',
+    asyncConcurrency: 100,
+    adaptiveConcurrency: true,
+    htmlParser: 'lxml',
+    parseWorkers: 0,
+    linkedFromLimit: 1000,
+    frontierMode: 'memory',
+    persistResults: true,
     memoryLimit: 512,
     logLevel: 'INFO',
     saveSession: false,
@@ -431,10 +440,10 @@ function collectSettingsFromForm() {
 
     // Collect regular form fields
     const formFields = [
-        'maxDepth', 'maxUrls', 'crawlDelay', 'followRedirects', 'crawlExternalLinks',
+        'maxDepth', 'maxUrls', 'crawlDelay', 'crawlBurst', 'followRedirects', 'crawlExternalLinks',
         'userAgent', 'timeout', 'retries', 'acceptLanguage', 'respectRobotsTxt', 'allowCookies', 'discoverSitemaps', 'enablePageSpeed', 'googleApiKey',
         'includeExtensions', 'excludeExtensions', 'includePatterns', 'excludePatterns', 'maxFileSize',
-        'exportFormat', 'concurrency', 'memoryLimit', 'logLevel', 'saveSession',
+        'exportFormat', 'concurrency', 'fetchEngine', 'asyncConcurrency', 'adaptiveConcurrency', 'htmlParser', 'parseWorkers', 'linkedFromLimit', 'frontierMode', 'persistResults', 'memoryLimit', 'logLevel', 'saveSession',
         'enableProxy', 'proxyUrl', 'customHeaders',
         'enableJavaScript', 'jsWaitTime', 'jsTimeout', 'jsBrowser', 'jsHeadless', 'jsUserAgent', 'jsViewportWidth', 'jsViewportHeight', 'jsMaxConcurrentPages',
         'customCSS', 'issueExclusionPatterns'
@@ -551,6 +560,10 @@ function validateSettings(settings) {
         errors.push('Crawl delay must be between 0 and 60 seconds');
     }
 
+    if (settings.crawlBurst < 1 || settings.crawlBurst > 100) {
+        errors.push('Burst requests must be between 1 and 100');
+    }
+
     if (settings.timeout < 1 || settings.timeout > 120) {
         errors.push('Timeout must be between 1 and 120 seconds');
     }
@@ -567,6 +580,18 @@ function validateSettings(settings) {
         errors.push('Concurrency must be between 1 and 50');
     }
 
+    if (settings.asyncConcurrency < 1 || settings.asyncConcurrency > 1000) {
+        errors.push('Async in-flight requests must be between 1 and 1000');
+    }
+
+    if (settings.parseWorkers < 0 || settings.parseWorkers > 64) {
+        errors.push('Parse worker processes must be between 0 and 64');
+    }
+
+    if (settings.linkedFromLimit < 0 || settings.linkedFromLimit > 100000) {
+        errors.push('Linked From limit must be between 0 and 100000');
+    }
+
     if (settings.memoryLimit < 64 || settings.memoryLimit > 4096) {
         errors.push('Memory limit must be between 64 and 4096 MB');
     }